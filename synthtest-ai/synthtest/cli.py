@@ -3,15 +3,23 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
+from typing import Dict, Optional
+
+import yaml
 
 from synthtest.config.loader import load_schema_from_path
+from synthtest.config.models import ExportOptions, RunMetadata
 from synthtest.gen.core import generate_dataset
 from synthtest.profile.infer_basic import infer_basic
+from synthtest.profile.infer_dataset import infer_dataset
+from synthtest.schema.postgres_introspect import introspect_postgres_config
 from synthtest.validate.validator import validate_output
 from synthtest.util.logging import get_logger, log_event
 
 LOGGER = get_logger(__name__)
 
+FORMATS = ["csv", "json", "sql", "parquet", "arrow"]
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(prog="synthtest", description="SynthTest AI CLI")
@@ -22,16 +30,58 @@ def main() -> None:
     gen_parser = subparsers.add_parser("generate", help="Generate synthetic data")
     gen_parser.add_argument("--config", required=True, help="Path to schema config")
     gen_parser.add_argument("--out", required=True, help="Output directory")
-    gen_parser.add_argument("--format", default="csv", choices=["csv", "json", "sql"], help="Output format")
+    gen_parser.add_argument(
+        "--format", default="csv", choices=FORMATS + ["db"], help="Output format (db loads into --db)"
+    )
+    gen_parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for sharded generation (columnar engine)"
+    )
+    gen_parser.add_argument(
+        "--validate",
+        choices=["inline", "reread", "off"],
+        help="Validate rows while writing them, re-read the output afterwards (default for files), or skip",
+    )
+    gen_parser.add_argument(
+        "--sql-style", default="insert", choices=["insert", "copy"], help="SQL output: INSERT statements or COPY"
+    )
+    gen_parser.add_argument("--sql-batch-size", type=int, default=1, help="Rows per INSERT statement (SQL output)")
+    gen_parser.add_argument(
+        "--buffer-size", type=int, default=1 << 20, help="Write buffer size in bytes for text exporters"
+    )
+    gen_parser.add_argument("--compress", choices=["gzip", "zstd"], help="Compress output files")
+    gen_parser.add_argument("--db", help="Target database URL for --format db (sqlite:///x.db, postgresql://...)")
+    gen_parser.add_argument("--db-batch-size", type=int, default=1000, help="Rows per database round trip")
+    gen_parser.add_argument(
+        "--db-mode",
+        default="replace",
+        choices=["replace", "append"],
+        help="Drop and recreate existing tables, or append to them (--format db)",
+    )
 
     val_parser = subparsers.add_parser("validate", help="Validate generated data")
     val_parser.add_argument("--config", required=True, help="Path to schema config")
     val_parser.add_argument("--data", required=True, help="Output directory")
-    val_parser.add_argument("--format", default="csv", choices=["csv", "json", "sql"], help="Data format")
+    val_parser.add_argument("--format", default="csv", choices=FORMATS, help="Data format")
+    val_parser.add_argument("--workers", type=int, default=1, help="Processes validating tables in parallel")
 
     infer_parser = subparsers.add_parser("infer-basic", help="Infer schema from sample CSV")
     infer_parser.add_argument("--input", required=True, help="Input CSV file")
     infer_parser.add_argument("--out", required=True, help="Output schema YAML path")
+    infer_parser.add_argument("--sample-rows", type=int, help="Profile only the first N rows")
+
+    infer_dir_parser = subparsers.add_parser("infer", help="Infer a multi-table schema from a directory of files")
+    infer_dir_parser.add_argument("--input", required=True, help="Directory of CSV / Parquet files, one per table")
+    infer_dir_parser.add_argument("--out", required=True, help="Output schema YAML path")
+    infer_dir_parser.add_argument("--workers", type=int, default=1, help="Processes profiling files in parallel")
+    infer_dir_parser.add_argument("--sample-rows", type=int, help="Profile only the first N rows of each file")
+
+    introspect_parser = subparsers.add_parser("introspect", help="Build a schema config from a PostgreSQL database")
+    introspect_parser.add_argument("--dsn", required=True, help="PostgreSQL connection string")
+    introspect_parser.add_argument("--out", required=True, help="Output schema YAML path")
+    introspect_parser.add_argument("--schema", default="public", help="Database schema to read")
+    introspect_parser.add_argument("--rows", type=int, default=100, help="Rows to generate per table")
+    introspect_parser.add_argument("--cache-dir", help="Catalog snapshot cache directory")
+    introspect_parser.add_argument("--refresh", action="store_true", help="Ignore a cached catalog snapshot")
 
     args = parser.parse_args()
 
@@ -40,25 +90,56 @@ def main() -> None:
         return
     if args.command == "generate":
         schema, config_hash = load_schema_from_path(args.config)
-        metadata = generate_dataset(schema, config_hash, args.out, args.format)
+        export = ExportOptions(
+            sql_style=args.sql_style,
+            sql_batch_size=args.sql_batch_size,
+            buffer_size=args.buffer_size,
+            compression=args.compress,
+            db_url=args.db,
+            db_batch_size=args.db_batch_size,
+            db_mode=args.db_mode,
+        )
+        metadata = generate_dataset(
+            schema, config_hash, args.out, args.format, workers=args.workers, validate=args.validate, export=export
+        )
         log_event(LOGGER, "generation_complete", output=args.out, dataset_id=metadata.dataset_id)
         return
     if args.command == "validate":
         schema, _ = load_schema_from_path(args.config)
-        report = validate_output(schema, Path(args.data), args.format)
+        files = _recorded_files(Path(args.data), args.format)
+        report = validate_output(schema, Path(args.data), args.format, workers=args.workers, files=files)
         report_path = Path(args.data) / "validation_report.json"
         report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
         log_event(LOGGER, "validation_complete", output=str(report_path), violations=report.total_violations)
         return
     if args.command == "infer-basic":
-        infer_basic(args.input, args.out)
+        infer_basic(args.input, args.out, sample_rows=args.sample_rows)
         log_event(LOGGER, "infer_complete", output=args.out)
         return
 
+    if args.command == "infer":
+        config = infer_dataset(args.input, args.out, workers=args.workers, sample_rows=args.sample_rows)
+        log_event(LOGGER, "infer_complete", output=args.out, tables=len(config["tables"]))
+        return
+    if args.command == "introspect":
+        config = introspect_postgres_config(args.dsn, args.schema, args.rows, args.cache_dir, args.refresh)
+        Path(args.out).write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+        log_event(LOGGER, "introspect_complete", output=args.out, tables=len(config["tables"]))
+        return
+
     parser.print_help()
     sys.exit(1)
 
 
+def _recorded_files(data_dir: Path, fmt: str) -> Optional[Dict[str, str]]:
+    """Table files named in ``run_metadata.json`` if the run there wrote ``fmt``."""
+    metadata_path = data_dir / "run_metadata.json"
+    if not metadata_path.exists():
+        return None
+    metadata = RunMetadata.model_validate_json(metadata_path.read_text(encoding="utf-8"))
+    return metadata.files if metadata.format == fmt else None
+
+
 def _handle_init() -> None:
     root = Path.cwd()
     examples_dir = root / "examples"
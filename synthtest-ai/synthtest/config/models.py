@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class RunMetadata(BaseModel):
@@ -16,3 +16,17 @@ class RunMetadata(BaseModel):
     row_counts: Dict[str, int]
     tables: List[str]
     max_attempts: int
+    compression: Optional[str] = None
+    files: Dict[str, str] = Field(default_factory=dict)
+
+
+class ExportOptions(BaseModel):
+    """Output-only settings; they change how files are written, never the generated values."""
+
+    sql_style: Literal["insert", "copy"] = "insert"
+    sql_batch_size: int = Field(default=1, gt=0)
+    buffer_size: int = Field(default=1 << 20, gt=0)
+    compression: Optional[Literal["gzip", "zstd"]] = None
+    db_url: Optional[str] = None
+    db_batch_size: int = Field(default=1000, gt=0)
+    db_mode: Literal["replace", "append"] = "replace"
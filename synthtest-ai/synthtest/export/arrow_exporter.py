@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from synthtest.gen.batch import ColumnBatch
+from synthtest.schema.canonical import ColumnSpec, TableSpec
+
+from .json_exporter import _serialize_value
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow installed
+    pa = None
+    pq = None
+
+ARROW_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+
+def arrow_available() -> bool:
+    return pa is not None
+
+
+def arrow_type(column: ColumnSpec, mode: str):
+    """Arrow type a column is written as; everything is text in invalid mode."""
+    if mode == "invalid":
+        return pa.string()
+    if column.type == "int":
+        return pa.int64()
+    if column.type == "decimal":
+        return pa.float64()
+    if column.type == "bool":
+        return pa.bool_()
+    if column.type == "date":
+        return pa.date32()
+    if column.type == "datetime":
+        return pa.timestamp("us")
+    if column.type == "enum":
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+class ArrowExporter:
+    """Writes a table as Parquet or Arrow IPC (Feather v2) in typed row groups.
+
+    Rows are buffered per column and written as one record batch / row group
+    every ``row_group_size`` rows, compressed inside the file with
+    ``compress`` if set. In invalid mode the injected values do not
+    fit the column types, so every column is written as string. Arrow IPC
+    files allow one dictionary per column, so enums are encoded against the
+    column's ``values`` in every record batch.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: TableSpec,
+        mode: str,
+        fmt: str = "parquet",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compress: Optional[str] = None,
+    ):
+        if pa is None:
+            raise ValueError(f"{fmt} output requires pyarrow (pip install 'synthtest-ai[arrow]')")
+        self.path = path
+        self.table = table.name
+        self.columns = list(table.columns)
+        self.row_group_size = row_group_size
+        fields = []
+        self._dictionaries: List[Optional[Dict[str, int]]] = []
+        for name, spec in table.columns.items():
+            field_type = arrow_type(spec, mode)
+            lookup = None
+            if fmt == "arrow" and pa.types.is_dictionary(field_type):
+                if spec.values:
+                    labels = [str(_serialize_value(value)) for value in spec.values]
+                    lookup = {label: index for index, label in enumerate(labels)}
+                else:
+                    field_type = pa.string()
+            fields.append(pa.field(name, field_type))
+            self._dictionaries.append(lookup)
+        self.schema = pa.schema(fields)
+        self._dictionary_arrays = [
+            None if lookup is None else pa.array(list(lookup), type=pa.string()) for lookup in self._dictionaries
+        ]
+        self._encoders: List[Callable[[Any], Any]] = [_encoder(field.type) for field in self.schema]
+        self._buffers: List[List[Any]] = [[] for _ in self.columns]
+        # Both formats compress internally, so ``compress`` never changes the file name.
+        if fmt == "parquet":
+            self._writer = pq.ParquetWriter(str(path), self.schema, compression=compress or "snappy")
+        elif compress in (None, "zstd"):
+            options = pa.ipc.IpcWriteOptions(compression=compress)
+            self._writer = pa.ipc.new_file(str(path), self.schema, options=options)
+        else:
+            raise ValueError(f"Arrow IPC output does not support {compress} compression (use zstd)")
+
+    def write_row(self, row: dict[str, Any]) -> None:
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        fields = list(zip(self._buffers, self._encoders, self.columns))
+        for row in rows:
+            for buffer, encode, col in fields:
+                buffer.append(encode(row.get(col)))
+            if len(self._buffers[0]) >= self.row_group_size:
+                self._flush()
+                fields = list(zip(self._buffers, self._encoders, self.columns))
+
+    def write_batch(self, batch: ColumnBatch) -> None:
+        """Write ``batch`` column by column; row groups are the same as with ``write_rows``."""
+        count = len(batch)
+        columns = []
+        for col, encode in zip(self.columns, self._encoders):
+            values = batch.data.get(col)
+            if values is None:
+                values = [None] * count
+            columns.append(values if encode is _identity else list(map(encode, values)))
+        offset = 0
+        while offset < count:
+            stop = min(count, offset + self.row_group_size - len(self._buffers[0]))
+            for buffer, values in zip(self._buffers, columns):
+                buffer.extend(values[offset:stop])
+            offset = stop
+            if len(self._buffers[0]) >= self.row_group_size:
+                self._flush()
+
+    def readback(self, row: dict[str, Any]) -> dict[str, Any]:
+        """``row`` as the validator reads it back from this file."""
+        return {col: encode(row.get(col)) for col, encode in zip(self.columns, self._encoders)}
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def _flush(self) -> None:
+        if not self._buffers or not self._buffers[0]:
+            return
+        arrays = []
+        for buffer, field, lookup, dictionary in zip(
+            self._buffers, self.schema, self._dictionaries, self._dictionary_arrays
+        ):
+            try:
+                if lookup is None:
+                    arrays.append(pa.array(buffer, type=field.type))
+                else:
+                    indices = pa.array([None if value is None else lookup[value] for value in buffer], pa.int32())
+                    arrays.append(pa.DictionaryArray.from_arrays(indices, dictionary))
+            except KeyError as exc:
+                raise ValueError(f"Column {self.table}.{field.name} has a value outside its enum values: {exc}")
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError) as exc:
+                raise ValueError(f"Column {self.table}.{field.name} has values that do not fit {field.type}: {exc}")
+        self._writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self._buffers = [[] for _ in self.columns]
+
+
+def read_arrow_batches(
+    path: Path, fmt: str, start: int = 0, stop: Optional[int] = None
+) -> Iterator[Dict[str, List[Any]]]:
+    """Yield ``column -> values`` for each row group / record batch of ``path``.
+
+    ``start`` / ``stop`` restrict the read to a slice of the batch indices.
+    """
+    _require_pyarrow(fmt)
+    if fmt == "parquet":
+        parquet_file = pq.ParquetFile(str(path))
+        for index in range(parquet_file.num_row_groups)[start:stop]:
+            yield parquet_file.read_row_group(index).to_pydict()
+        return
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        for index in range(reader.num_record_batches)[start:stop]:
+            yield reader.get_batch(index).to_pydict()
+
+
+def arrow_batch_sizes(path: Path, fmt: str) -> List[int]:
+    """Uncompressed size in bytes of each row group / record batch of ``path``."""
+    _require_pyarrow(fmt)
+    if fmt == "parquet":
+        metadata = pq.ParquetFile(str(path)).metadata
+        return [metadata.row_group(index).total_byte_size for index in range(metadata.num_row_groups)]
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        return [reader.get_batch(index).nbytes for index in range(reader.num_record_batches)]
+
+
+def _require_pyarrow(fmt: str) -> None:
+    if pa is None:
+        raise ValueError(f"Reading {fmt} requires pyarrow (pip install 'synthtest-ai[arrow]')")
+
+
+def _encoder(arrow_type) -> Callable[[Any], Any]:
+    if pa.types.is_string(arrow_type) or pa.types.is_dictionary(arrow_type):
+        return lambda value: None if value is None else str(_serialize_value(value))
+    if pa.types.is_floating(arrow_type):
+        return lambda value: None if value is None else float(value)
+    return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import gzip
+import io
+from pathlib import Path
+from typing import IO, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard installed
+    zstandard = None
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compressed_path(path: Path, compress: Optional[str]) -> Path:
+    """``path`` with the suffix of ``compress`` appended (``orders.csv`` -> ``orders.csv.gz``)."""
+    if not compress:
+        return path
+    return path.with_name(path.name + _suffix(compress))
+
+
+def find_table_file(path: Path) -> Path:
+    """The one existing file among ``path`` and its compressed siblings (``path`` if none exists)."""
+    candidates = [path] + [path.with_name(path.name + suffix) for suffix in COMPRESSION_SUFFIXES.values()]
+    found = [candidate for candidate in candidates if candidate.exists()]
+    if len(found) > 1:
+        names = ", ".join(candidate.name for candidate in found)
+        raise ValueError(f"Several output files for one table ({names}); remove the stale ones")
+    return found[0] if found else path
+
+
+def open_text_writer(
+    path: Path,
+    compress: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    newline: Optional[str] = None,
+) -> IO[str]:
+    """Open ``path`` for UTF-8 text output, compressed with ``compress`` if set.
+
+    gzip output is written with a zero mtime and no file name so it is
+    reproducible; zstd compresses on all cores (its output does not depend on
+    the number of threads).
+    """
+    if not compress:
+        return path.open("w", encoding="utf-8", newline=newline, buffering=buffer_size)
+    _suffix(compress)
+    raw = path.open("wb")
+    if compress == "gzip":
+        stream = _ClosingGzipFile(raw)
+    else:
+        _require_zstandard()
+        stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).stream_writer(raw, closefd=True)
+    return io.TextIOWrapper(io.BufferedWriter(stream, buffer_size), encoding="utf-8", newline=newline)
+
+
+def open_text_reader(path: Path) -> IO[str]:
+    """Open ``path`` for UTF-8 text input, decompressing based on its suffix."""
+    if path.suffix == COMPRESSION_SUFFIXES["gzip"]:
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == COMPRESSION_SUFFIXES["zstd"]:
+        _require_zstandard()
+        stream = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _suffix(compress: str) -> str:
+    if compress not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compress}")
+    return COMPRESSION_SUFFIXES[compress]
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ValueError("zstd compression requires zstandard (pip install 'synthtest-ai[zstd]')")
+
+
+class _ClosingGzipFile(gzip.GzipFile):
+    """``GzipFile`` that also closes the file object it writes to."""
+
+    def __init__(self, raw: IO[bytes]):
+        super().__init__(filename="", mode="wb", compresslevel=GZIP_LEVEL, fileobj=raw, mtime=0)
+        self._raw = raw
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._raw.close()
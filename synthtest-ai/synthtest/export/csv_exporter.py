@@ -2,22 +2,37 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import Any, Iterable, List, Optional
 
+from .compression import DEFAULT_BUFFER_SIZE, open_text_writer
 from .json_exporter import _serialize_value
 
 
 class CsvExporter:
-    def __init__(self, path: Path, columns: List[str]):
+    def __init__(
+        self,
+        path: Path,
+        columns: List[str],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compress: Optional[str] = None,
+    ):
         self.path = path
         self.columns = columns
-        self._file = path.open("w", newline="", encoding="utf-8")
-        self._writer = csv.DictWriter(self._file, fieldnames=columns)
-        self._writer.writeheader()
+        self._file = open_text_writer(path, compress, buffer_size, newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
 
     def write_row(self, row: dict[str, Any]) -> None:
-        serialized = {col: _serialize_value(row.get(col)) for col in self.columns}
-        self._writer.writerow(serialized)
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        columns = self.columns
+        self._writer.writerows([_serialize_value(row.get(col)) for col in columns] for row in rows)
+
+    def readback(self, row: dict[str, Any]) -> dict[str, Any]:
+        """``row`` as the validator reads it back from this file."""
+        values = (_serialize_value(row.get(col)) for col in self.columns)
+        return {col: "" if value is None else str(value) for col, value in zip(self.columns, values)}
 
     def close(self) -> None:
         self._file.close()
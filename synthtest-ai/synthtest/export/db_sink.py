@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List
+from urllib.parse import urlparse
+
+from synthtest.schema.canonical import TableSpec
+
+from .json_exporter import _serialize_value
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - exercised only without psycopg installed
+    psycopg = None
+
+DEFAULT_DB_BATCH_SIZE = 1000
+DB_MODES = ("replace", "append")
+
+_SQLITE_TYPES = {"int": "INTEGER", "decimal": "REAL", "bool": "INTEGER"}
+_POSTGRES_TYPES = {
+    "uuid": "UUID",
+    "int": "BIGINT",
+    "decimal": "DOUBLE PRECISION",
+    "bool": "BOOLEAN",
+    "date": "DATE",
+    "datetime": "TIMESTAMP",
+}
+
+
+def dialect_for(url: str) -> str:
+    scheme = urlparse(url).scheme
+    if scheme == "sqlite":
+        return "sqlite"
+    if scheme in {"postgres", "postgresql"}:
+        return "postgres"
+    raise ValueError(f"Unsupported database URL: {url} (expected sqlite:///... or postgresql://...)")
+
+
+class ConnectionPool:
+    """Up to ``size`` DB-API connections to ``url``, shared by table writers.
+
+    ``sqlite:///relative.db``, ``sqlite:////absolute.db`` and
+    ``postgresql://user@host/db`` URLs are supported; Postgres needs psycopg 3.
+    Connections are opened lazily, so a serial run only ever opens one.
+    """
+
+    def __init__(self, url: str, size: int = 1):
+        self.url = url
+        self.dialect = dialect_for(url)
+        self.size = max(1, size)
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._opened: List[Any] = []
+        self._lock = threading.Lock()
+        if self.dialect == "postgres" and psycopg is None:
+            raise ValueError("PostgreSQL output requires psycopg (pip install 'synthtest-ai[postgres]')")
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.size:
+                connection = self._connect()
+                self._opened.append(connection)
+                return connection
+        return self._idle.get()
+
+    def release(self, connection) -> None:
+        self._idle.put(connection)
+
+    def close(self) -> None:
+        for connection in self._opened:
+            connection.close()
+        self._opened = []
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _connect(self):
+        if self.dialect == "sqlite":
+            path = urlparse(self.url).path[1:] or ":memory:"
+            # Writers in other threads wait for the database lock instead of failing.
+            return sqlite3.connect(path, timeout=60, check_same_thread=False)
+        return psycopg.connect(self.url)
+
+
+class DatabaseExporter:
+    """Writes one table into a database, ``batch_size`` rows per round trip.
+
+    With ``db_mode="replace"`` (default) an existing table of the same name is
+    dropped and created again, so a run can be repeated against one database;
+    ``append`` creates the table only if it does not exist and inserts into
+    it. Every batch is committed on its
+    own, which keeps SQLite write locks short while sibling tables load in
+    parallel. SQLite uses ``executemany``; Postgres streams rows with ``COPY``.
+    In invalid mode the table is created untyped and without a primary key so
+    injected values are stored as generated.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        table: TableSpec,
+        mode: str,
+        batch_size: int = DEFAULT_DB_BATCH_SIZE,
+        db_mode: str = "replace",
+    ):
+        if db_mode not in DB_MODES:
+            raise ValueError(f"Unsupported database mode: {db_mode} (expected replace or append)")
+        self.pool = pool
+        self.table = table.name
+        self.columns = list(table.columns)
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+        self._connection = pool.acquire()
+        cols = ", ".join(_quote(col) for col in self.columns)
+        if pool.dialect == "sqlite":
+            placeholders = ", ".join("?" for _ in self.columns)
+            self._insert = f"INSERT INTO {_quote(self.table)} ({cols}) VALUES ({placeholders})"
+            self._adapt = _serialize_value
+        else:
+            self._insert = f"COPY {_quote(self.table)} ({cols}) FROM STDIN"
+            self._adapt = _identity
+        if db_mode == "replace":
+            self._execute(f"DROP TABLE IF EXISTS {_quote(self.table)}")
+        self._execute(_create_table(table, pool.dialect, mode))
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        adapt = self._adapt
+        columns = self.columns
+        for row in rows:
+            self._pending.append(tuple(adapt(row.get(col)) for col in columns))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def readback(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """``row`` as handed to the database driver."""
+        return {col: _serialize_value(row.get(col)) for col in self.columns}
+
+    def close(self) -> None:
+        try:
+            self._flush()
+        finally:
+            self.pool.release(self._connection)
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        cursor = self._connection.cursor()
+        try:
+            if self.pool.dialect == "sqlite":
+                cursor.executemany(self._insert, rows)
+            else:
+                with cursor.copy(self._insert) as copy:
+                    for values in rows:
+                        copy.write_row(values)
+        finally:
+            cursor.close()
+        self._connection.commit()
+
+    def _execute(self, statement: str) -> None:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+        self._connection.commit()
+
+
+def _create_table(table: TableSpec, dialect: str, mode: str) -> str:
+    types = _SQLITE_TYPES if dialect == "sqlite" else _POSTGRES_TYPES
+    if mode == "invalid":
+        definitions = [f"{_quote(name)} TEXT" for name in table.columns]
+    else:
+        definitions = [f"{_quote(name)} {types.get(spec.type, 'TEXT')}" for name, spec in table.columns.items()]
+        if table.primary_key in table.columns:
+            definitions.append(f"PRIMARY KEY ({_quote(table.primary_key)})")
+    return f"CREATE TABLE IF NOT EXISTS {_quote(table.name)} ({', '.join(definitions)})"
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -1,19 +1,49 @@
 from __future__ import annotations
 
 import json
+import math
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterable, List, Optional
+
+from .compression import DEFAULT_BUFFER_SIZE, open_text_writer
 
 
 class JsonExporter:
-    def __init__(self, path: Path, columns: List[str]):
+    def __init__(
+        self,
+        path: Path,
+        columns: List[str],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compress: Optional[str] = None,
+    ):
         self.path = path
         self.columns = columns
-        self._file = path.open("w", encoding="utf-8")
+        self._file = open_text_writer(path, compress, buffer_size)
+        # Pre-encoded '{"col": ' / ', "col": ' fragments, in column order.
+        self._keys = [
+            ("{" if index == 0 else ", ") + encode_basestring_ascii(col) + ": " for index, col in enumerate(columns)
+        ]
 
     def write_row(self, row: dict[str, Any]) -> None:
-        payload = {col: _serialize_value(row.get(col)) for col in self.columns}
-        self._file.write(json.dumps(payload, ensure_ascii=True) + "\n")
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        if not self.columns:
+            self._file.writelines("{}\n" for _ in rows)
+            return
+        pairs = list(zip(self._keys, self.columns))
+        parts: List[str] = []
+        for row in rows:
+            for key, col in pairs:
+                parts.append(key)
+                parts.append(_encode_value(_serialize_value(row.get(col))))
+            parts.append("}\n")
+        self._file.write("".join(parts))
+
+    def readback(self, row: dict[str, Any]) -> dict[str, Any]:
+        """``row`` as the validator reads it back from this file."""
+        return {col: _serialize_value(row.get(col)) for col in self.columns}
 
     def close(self) -> None:
         self._file.close()
@@ -25,3 +55,20 @@ def _serialize_value(value: Any) -> Any:
     if hasattr(value, "isoformat"):
         return value.isoformat()
     return value
+
+
+def _encode_value(value: Any) -> str:
+    """JSON text of ``value``, identical to ``json.dumps(value, ensure_ascii=True)``."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return int.__repr__(value)
+    if type(value) is float and math.isfinite(value):
+        return float.__repr__(value)
+    return json.dumps(value, ensure_ascii=True)
@@ -1,27 +1,81 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterable, List, Optional
 
+from .compression import DEFAULT_BUFFER_SIZE, open_text_writer
 from .json_exporter import _serialize_value
 
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
 
 class SqlExporter:
-    def __init__(self, path: Path, table: str, columns: List[str]):
+    """Writes ``INSERT`` statements, or a PostgreSQL ``COPY ... FROM stdin`` block.
+
+    With ``batch_size`` > 1 rows are grouped into multi-row
+    ``INSERT ... VALUES`` statements, one tuple per line.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        columns: List[str],
+        batch_size: int = 1,
+        style: str = "insert",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compress: Optional[str] = None,
+    ):
+        if style not in {"insert", "copy"}:
+            raise ValueError(f"Unsupported SQL style: {style}")
         self.path = path
         self.table = table
         self.columns = columns
-        self._file = path.open("w", encoding="utf-8")
+        self.batch_size = batch_size
+        self.style = style
+        self._pending: List[str] = []
+        self._file = open_text_writer(path, compress, buffer_size)
+        cols = ", ".join(self.columns)
+        self._header = f"INSERT INTO {self.table} ({cols}) VALUES"
+        if style == "copy":
+            self._file.write(f"COPY {self.table} ({cols}) FROM stdin;\n")
 
     def write_row(self, row: dict[str, Any]) -> None:
-        values = [_sql_literal(_serialize_value(row.get(col))) for col in self.columns]
-        cols = ", ".join(self.columns)
-        vals = ", ".join(values)
-        self._file.write(f"INSERT INTO {self.table} ({cols}) VALUES ({vals});\n")
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        columns = self.columns
+        serialized = ([_serialize_value(row.get(col)) for col in columns] for row in rows)
+        if self.style == "copy":
+            self._file.write("".join("\t".join(map(_copy_literal, values)) + "\n" for values in serialized))
+            return
+        tuples = ("(" + ", ".join(map(_sql_literal, values)) + ")" for values in serialized)
+        if self.batch_size == 1:
+            header = self._header
+            self._file.write("".join(f"{header} {values};\n" for values in tuples))
+            return
+        for values in tuples:
+            self._pending.append(values)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def readback(self, row: dict[str, Any]) -> dict[str, Any]:
+        """``row`` as the validator reads it back from this file."""
+        values = (_serialize_value(row.get(col)) for col in self.columns)
+        return {col: None if value is None else str(value) for col, value in zip(self.columns, values)}
 
     def close(self) -> None:
+        self._flush()
+        if self.style == "copy":
+            self._file.write("\\.\n")
         self._file.close()
 
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        self._file.write(self._header + "\n" + ",\n".join(self._pending) + ";\n")
+        self._pending = []
+
 
 def _sql_literal(value: Any) -> str:
     if value is None:
@@ -30,3 +84,9 @@ def _sql_literal(value: Any) -> str:
         return str(value)
     text = str(value).replace("'", "''")
     return f"'{text}'"
+
+
+def _copy_literal(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    return str(value).translate(_COPY_ESCAPES)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List
+
+
+@dataclass
+class ColumnBatch:
+    """A chunk of generated rows stored column-wise.
+
+    Rows are only assembled into dicts when a consumer asks for them, so
+    columnar consumers can read ``data`` directly.
+    """
+
+    columns: List[str]
+    data: Dict[str, List[Any]]
+    start: int = 0
+
+    def __len__(self) -> int:
+        if not self.columns:
+            return 0
+        return len(self.data[self.columns[0]])
+
+    def row(self, index: int) -> Dict[str, Any]:
+        return {col: self.data[col][index] for col in self.columns}
+
+    def set_row(self, index: int, row: Dict[str, Any]) -> None:
+        for col in self.columns:
+            self.data[col][index] = row.get(col)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        columns = self.columns
+        for values in zip(*(self.data[col] for col in columns)):
+            yield dict(zip(columns, values))
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import datetime as dt
+import re
+from functools import cached_property
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Pattern, Tuple
+
+from synthtest.gen.constraints import ConstraintPlan, build_constraint_plan
+from synthtest.gen.edge_cases import EdgeCaseFn, compile_edge_cases
+from synthtest.gen.generators import faker_generators, primitives
+from synthtest.gen.keys import ForeignKeyIndex
+from synthtest.gen.rules_engine import RuleSet, compile_rules
+from synthtest.schema.canonical import ColumnSpec, SchemaSpec, TableSpec
+from synthtest.util.rng import Rng
+
+ValueFn = Callable[[Rng], Any]
+
+_FAKER_GENERATORS: Dict[str, ValueFn] = {
+    "email": faker_generators.generate_email,
+    "phone": faker_generators.generate_phone,
+    "country": faker_generators.generate_country,
+    "postcode_uk": faker_generators.generate_postcode_uk,
+    "name": faker_generators.generate_name,
+}
+
+
+class CompiledColumn:
+    """One column with its generator and checks bound up front.
+
+    Ranges, dates, regexes and enum weights are parsed once here instead of
+    for every cell; the draw sequence is the same as the per-cell code paths.
+    """
+
+    def __init__(self, column: ColumnSpec, mode: str, fk_index: ForeignKeyIndex):
+        self.spec = column
+        self.name = column.name
+        self.is_foreign_key = fk_index.is_foreign_key(column.name)
+        self.sampler: Optional[primitives.WeightedSampler] = None
+        if self.is_foreign_key:
+            self.generate = _foreign_key_generator(column.name, mode, fk_index)
+        else:
+            self.sampler = weighted_sampler(column)
+            self.generate = self.sampler.draw if self.sampler else compile_generator(column)
+        self.apply_edge_cases: EdgeCaseFn = compile_edge_cases(column, mode)
+        self.regex: Optional[Pattern[str]] = re.compile(column.regex) if column.regex else None
+        self.enum_values: Optional[FrozenSet[Any]] = (
+            frozenset(column.values) if column.type == "enum" and column.values else None
+        )
+        self.numeric_range: Optional[Tuple[float, float]] = None
+        if column.type in {"int", "decimal"} and column.range and len(column.range) >= 2:
+            self.numeric_range = (float(column.range[0]), float(column.range[1]))
+
+    def generate_many(self, rng: Rng, count: int) -> List[Any]:
+        """``count`` values, drawn exactly as ``count`` calls to ``generate`` would."""
+        if self.sampler is not None:
+            return self.sampler.draw_many(rng, count)
+        generate = self.generate
+        return [generate(rng) for _ in range(count)]
+
+    @cached_property
+    def range_check(self) -> Optional[Callable[[Any], bool]]:
+        """Range predicate over validator-coerced values (``None`` if unbounded)."""
+        return _range_check(self.spec)
+
+
+class CompiledTable:
+    """Everything needed to generate or validate rows of one table, built once.
+
+    ``parents`` maps table names to their primary-key collections; it is
+    resolved into a ``ForeignKeyIndex`` up front.
+    """
+
+    def __init__(self, table: TableSpec, schema: SchemaSpec, parents: Mapping[str, Any]):
+        self.table = table
+        self.name = table.name
+        self.primary_key = table.primary_key
+        self.mode = schema.dataset.mode
+        self.max_attempts = schema.dataset.max_attempts
+        self.fk_index = ForeignKeyIndex(table, parents)
+        self.rules: RuleSet = compile_rules(schema.rules).for_context([table.name])
+        self.constraints: Optional[ConstraintPlan] = (
+            build_constraint_plan(schema.rules, table)
+            if schema.dataset.mode == "valid" and schema.dataset.repair == "targeted"
+            else None
+        )
+        self.columns: Dict[str, CompiledColumn] = {
+            name: CompiledColumn(column, self.mode, self.fk_index) for name, column in table.columns.items()
+        }
+        self._variants: Dict[int, Tuple[ColumnSpec, CompiledColumn]] = {}
+
+    def column(self, spec: ColumnSpec) -> CompiledColumn:
+        """Compiled form of ``spec``, which may be a constraint-narrowed copy of a column."""
+        compiled = self.columns[spec.name]
+        if spec is compiled.spec:
+            return compiled
+        variant = self._variants.get(id(spec))
+        if variant is None:
+            variant = (spec, CompiledColumn(spec, self.mode, self.fk_index))
+            self._variants[id(spec)] = variant
+        return variant[1]
+
+
+def compile_table(table: TableSpec, schema: SchemaSpec, parents: Mapping[str, Any]) -> CompiledTable:
+    return CompiledTable(table, schema, parents)
+
+
+def compile_generator(column: ColumnSpec) -> ValueFn:
+    """Return a value generator for a (non foreign-key) column."""
+    if column.type == "uuid":
+        return primitives.generate_uuid
+    if column.type in {"int", "decimal"}:
+        if column.type == "int":
+            draw = primitives.generate_int
+            min_val, max_val = primitives.parse_int_range(column.range)
+        else:
+            draw = primitives.generate_decimal
+            min_val, max_val = _range_to_float(column.range)
+        distribution = column.distribution
+        quantiles = _quantiles(column)
+        if quantiles:
+            return lambda rng: draw(rng, min_val, max_val, distribution, quantiles)
+        return lambda rng: draw(rng, min_val, max_val, distribution)
+    if column.type == "bool":
+        return primitives.generate_bool
+    if column.type == "datetime":
+        start, end = primitives.parse_datetime_range(column.range)
+        quantiles = _quantiles(column, start)
+        return lambda rng: primitives.generate_datetime(rng, start, end, quantiles)
+    if column.type == "date":
+        start, end = primitives.parse_date_range(column.range)
+        quantiles = _quantiles(column, start)
+        return lambda rng: primitives.generate_date(rng, start, end, quantiles)
+    if column.type == "enum":
+        return _enum_generator(column)
+    if column.type == "text":
+        if column.regex:
+            return primitives.compile_regex_generator(column.regex)
+        min_len, max_len = _length_pair(column.length)
+        return lambda rng: primitives.generate_text(rng, min_len, max_len)
+    generator = _FAKER_GENERATORS.get(column.type)
+    if generator is not None:
+        return generator
+    return lambda rng: None
+
+
+def _foreign_key_generator(column: str, mode: str, fk_index: ForeignKeyIndex) -> ValueFn:
+    parent_pool = fk_index.parent_keys(column)
+    invalid = mode == "invalid"
+
+    def generate(rng: Rng) -> Any:
+        if invalid and rng.random() < 0.2:
+            return "invalid_fk"
+        if parent_pool:
+            return rng.choice(parent_pool)
+        return None
+
+    return generate
+
+
+def weighted_sampler(column: ColumnSpec) -> Optional[primitives.WeightedSampler]:
+    """Sampler for an enum with one weight per value, else ``None``."""
+    values, weights = column.values, column.weights
+    if column.type != "enum" or not values or not weights or len(weights) != len(values):
+        return None
+    return primitives.WeightedSampler(values, weights)
+
+
+def _enum_generator(column: ColumnSpec) -> ValueFn:
+    values = list(column.values or [])
+    if not values:
+        return lambda rng: ""
+    sampler = weighted_sampler(column)
+    if sampler is not None:
+        return sampler.draw
+    return lambda rng: rng.choice(values)
+
+
+def _range_check(column: ColumnSpec) -> Optional[Callable[[Any], bool]]:
+    if not column.range or len(column.range) < 2:
+        return None
+    min_val, max_val = column.range[0], column.range[1]
+    if column.type in {"int", "decimal"}:
+        low, high = float(min_val), float(max_val)
+        return lambda value: low <= float(value) <= high
+    if column.type == "date":
+        start = dt.date.fromisoformat(str(min_val))
+        end = dt.date.fromisoformat(str(max_val))
+        return lambda value: start <= value <= end
+    if column.type == "datetime":
+        start = dt.datetime.fromisoformat(str(min_val).replace("Z", "+00:00")).replace(tzinfo=None)
+        end = dt.datetime.fromisoformat(str(max_val).replace("Z", "+00:00")).replace(tzinfo=None)
+
+        def check(value: Any) -> bool:
+            if isinstance(value, dt.datetime) and value.tzinfo is not None:
+                value = value.replace(tzinfo=None)
+            return start <= value <= end
+
+        return check
+    return None
+
+
+def _quantiles(column: ColumnSpec, start: Any = None) -> Optional[List[float]]:
+    if column.distribution != "empirical":
+        return None
+    try:
+        return primitives.quantile_points(column.type, column.quantiles or [], start)
+    except ValueError as exc:
+        raise ValueError(f"Column {column.name}: {exc}") from exc
+
+
+def _range_to_float(raw):
+    if not raw or len(raw) < 2:
+        return None, None
+    return float(raw[0]), float(raw[1])
+
+
+def _length_pair(raw):
+    if not raw or len(raw) < 2:
+        return None, None
+    return int(raw[0]), int(raw[1])
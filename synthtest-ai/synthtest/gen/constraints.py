@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import ast
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from synthtest.schema.canonical import ColumnSpec, RuleSpec, TableSpec
+
+PREDICATE_TYPES = {"enum", "bool"}
+BOUNDED_TYPES = {"int", "decimal"}
+DEFAULT_NUMERIC_RANGE = (0.0, 1000.0)
+
+_FLIPPED = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE}
+
+
+@dataclass(frozen=True)
+class ConditionalBound:
+    """A numeric bound on ``column`` that applies when every predicate matches the row."""
+
+    column: str
+    predicates: Tuple[Tuple[str, Any], ...]
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+
+    def matches(self, row: Dict[str, Any]) -> bool:
+        return all(row.get(col) == expected for col, expected in self.predicates)
+
+
+class ConstraintPlan:
+    """Rule-derived generation bounds for one table.
+
+    Rules of the form ``if <enum/bool predicate> then <column> <op> <number>``
+    become conditional bounds: when the predicate holds for a row, the bounded
+    column is drawn from the narrowed range instead of being left to the
+    repair loop.
+    """
+
+    def __init__(self, table: TableSpec, bounds: Dict[str, List[ConditionalBound]]):
+        self.table = table
+        self.bounds = bounds
+        self._narrowed: Dict[Tuple[str, Tuple[ConditionalBound, ...]], Optional[ColumnSpec]] = {}
+        targets = set(bounds)
+        predicate_columns = {col for items in bounds.values() for bound in items for col, _ in bound.predicates}
+        # Bounded columns are generated last so their predicates are already known.
+        self.order = [col for col in table.columns if col not in targets] + [
+            col for col in table.columns if col in targets
+        ]
+        self.ambiguous = targets & predicate_columns
+
+    def __bool__(self) -> bool:
+        return bool(self.bounds)
+
+    def column_for(self, column: ColumnSpec, row: Dict[str, Any]) -> ColumnSpec:
+        candidates = self.bounds.get(column.name)
+        if not candidates or column.name in self.ambiguous:
+            return column
+        active = tuple(bound for bound in candidates if bound.matches(row))
+        if not active:
+            return column
+        key = (column.name, active)
+        if key not in self._narrowed:
+            self._narrowed[key] = _narrow(column, active)
+        narrowed = self._narrowed[key]
+        if narrowed is None:
+            return column
+        return narrowed
+
+
+def build_constraint_plan(rules: List[RuleSpec], table: TableSpec) -> ConstraintPlan:
+    bounds: Dict[str, List[ConditionalBound]] = {}
+    for rule in rules:
+        predicates = _parse_predicates(rule.if_expr, table)
+        if predicates is None:
+            continue
+        for constraint in rule.then:
+            bound = _parse_bound(constraint, table, predicates)
+            if bound is not None:
+                bounds.setdefault(bound.column, []).append(bound)
+    return ConstraintPlan(table, bounds)
+
+
+def _parse_predicates(expr: str, table: TableSpec) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    node = _parse(expr)
+    if node is None:
+        return None
+    parts = node.values if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And) else [node]
+    predicates: List[Tuple[str, Any]] = []
+    for part in parts:
+        predicate = _parse_predicate(part, table)
+        if predicate is None:
+            return None
+        predicates.append(predicate)
+    return tuple(predicates)
+
+
+def _parse_predicate(node: ast.AST, table: TableSpec) -> Optional[Tuple[str, Any]]:
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        column = _column_ref(node.operand, table)
+        if column is not None and column.type == "bool":
+            return column.name, False
+        return None
+    column = _column_ref(node, table)
+    if column is not None:
+        return (column.name, True) if column.type == "bool" else None
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.ops[0], ast.Eq):
+        left, right = node.left, node.comparators[0]
+        column = _column_ref(left, table) or _column_ref(right, table)
+        constant = right if isinstance(right, ast.Constant) else left
+        if column is not None and column.type in PREDICATE_TYPES and isinstance(constant, ast.Constant):
+            return column.name, constant.value
+    return None
+
+
+def _parse_bound(expr: str, table: TableSpec, predicates: Tuple[Tuple[str, Any], ...]) -> Optional[ConditionalBound]:
+    node = _parse(expr)
+    if not isinstance(node, ast.Compare) or len(node.ops) != 1:
+        return None
+    op, left, right = node.ops[0], node.left, node.comparators[0]
+    column = _column_ref(left, table)
+    if column is None:
+        column = _column_ref(right, table)
+        left, right = right, left
+        op = _FLIPPED.get(type(op), type(op))()
+    if column is None or column.type not in BOUNDED_TYPES:
+        return None
+    if not isinstance(right, ast.Constant) or isinstance(right.value, bool):
+        return None
+    if not isinstance(right.value, (int, float)):
+        return None
+    value = float(right.value)
+    is_int = column.type == "int"
+    if isinstance(op, ast.Lt):
+        upper = math.ceil(value) - 1 if is_int else math.nextafter(value, -math.inf)
+        return ConditionalBound(column.name, predicates, upper=upper)
+    if isinstance(op, ast.LtE):
+        return ConditionalBound(column.name, predicates, upper=math.floor(value) if is_int else value)
+    if isinstance(op, ast.Gt):
+        lower = math.floor(value) + 1 if is_int else math.nextafter(value, math.inf)
+        return ConditionalBound(column.name, predicates, lower=lower)
+    if isinstance(op, ast.GtE):
+        return ConditionalBound(column.name, predicates, lower=math.ceil(value) if is_int else value)
+    return None
+
+
+def _narrow(column: ColumnSpec, bounds: Tuple[ConditionalBound, ...]) -> Optional[ColumnSpec]:
+    if column.range and len(column.range) >= 2:
+        lower, upper = float(column.range[0]), float(column.range[1])
+    else:
+        lower, upper = DEFAULT_NUMERIC_RANGE
+    for bound in bounds:
+        if bound.lower is not None:
+            lower = max(lower, bound.lower)
+        if bound.upper is not None:
+            upper = min(upper, bound.upper)
+    if lower > upper:
+        return None
+    if column.type == "int":
+        return column.model_copy(update={"range": [int(lower), int(upper)]})
+    return column.model_copy(update={"range": [lower, upper]})
+
+
+def _column_ref(node: ast.AST, table: TableSpec) -> Optional[ColumnSpec]:
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == table.name:
+        return table.columns.get(node.attr)
+    return None
+
+
+def _parse(expr: str) -> Optional[ast.AST]:
+    try:
+        return ast.parse(expr, mode="eval").body
+    except SyntaxError:
+        return None
@@ -1,71 +1,136 @@
 from __future__ import annotations
 
+import tempfile
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-from synthtest.config.models import RunMetadata
+from synthtest.config.models import ExportOptions, RunMetadata
+from synthtest.export.arrow_exporter import ARROW_FORMATS, ArrowExporter
+from synthtest.export.compression import compressed_path
 from synthtest.export.csv_exporter import CsvExporter
+from synthtest.export.db_sink import ConnectionPool, DatabaseExporter
 from synthtest.export.json_exporter import JsonExporter
 from synthtest.export.sql_exporter import SqlExporter
-from synthtest.gen.edge_cases import apply_edge_cases
-from synthtest.gen.generators import faker_generators, primitives
-from synthtest.gen.repair import repair_loop
-from synthtest.gen.rules_engine import evaluate_rules
-from synthtest.plan.planner import plan_tables
-from synthtest.schema.canonical import ColumnSpec, SchemaSpec, TableSpec
+from synthtest.gen.batch import ColumnBatch
+from synthtest.gen.compiled import CompiledColumn, CompiledTable, compile_table
+from synthtest.gen.generators import vectorized
+from synthtest.gen.keys import BloomKeySet, KeyPool, KeySet
+from synthtest.gen.spill import spill_available
+from synthtest.gen.parallel import ChunkTask, PoolStore, load_pool, ordered_map
+from synthtest.gen.repair import RepairResult, repair_loop, targeted_repair_loop
+from synthtest.plan.dependency_graph import DependencyError
+from synthtest.plan.planner import plan_parents, plan_tables
+from synthtest.schema.canonical import SchemaSpec, TableSpec
 from synthtest.util.logging import get_logger, log_event
 from synthtest.util.rng import Rng
+from synthtest.validate.inline import InlineValidation
 from synthtest.validate.validator import validate_output
 
 LOGGER = get_logger(__name__)
 
+VALIDATE_MODES = ("inline", "reread", "off")
+# Rows handed to the exporter at once by the row engine.
+WRITE_CHUNK_ROWS = 1024
 
-def generate_dataset(schema: SchemaSpec, config_hash: str, out_dir: str | Path, fmt: str) -> RunMetadata:
+
+def generate_dataset(
+    schema: SchemaSpec,
+    config_hash: str,
+    out_dir: str | Path,
+    fmt: str,
+    workers: int = 1,
+    validate: str | None = None,
+    export: ExportOptions | None = None,
+) -> RunMetadata:
+    """Generate every table of ``schema`` into ``out_dir``.
+
+    ``validate`` selects how ``validation_report.json`` is produced: ``reread``
+    validates the written files afterwards, ``inline`` validates rows as they
+    are written (same report, no second pass over the files) and ``off``
+    skips validation. It defaults to ``reread`` for files and ``inline`` for
+    ``fmt="db"``, which loads rows into ``export.db_url`` instead of writing
+    files. ``export`` holds output-only settings such as the SQL statement
+    style.
+    """
     out_path = Path(out_dir)
     out_path.mkdir(parents=True, exist_ok=True)
+    export = export or ExportOptions()
+    if workers > 1 and schema.dataset.engine != "columnar":
+        raise ValueError("Parallel generation (workers > 1) requires dataset.engine: columnar")
+    if validate is None:
+        validate = "inline" if fmt == "db" else "reread"
+    if validate not in VALIDATE_MODES:
+        raise ValueError(f"Unsupported validation mode: {validate}")
+    if fmt == "db" and validate == "reread":
+        raise ValueError("Database output cannot be re-read; use validate inline or off")
+    if fmt == "db" and not export.db_url:
+        raise ValueError("Database output requires a database URL")
 
     dataset_id = str(uuid.uuid4())
-    rng = Rng.with_seed(schema.dataset.seed)
+    rng = Rng.with_seed(schema.dataset.seed, counter=schema.dataset.rng == "counter")
+
+    if schema.dataset.backend == "numpy" and not vectorized.numpy_available():
+        log_event(LOGGER, "numpy_backend_unavailable", fallback="python")
+    spill_after = schema.dataset.spill_after
+    if spill_after is not None and not spill_available():
+        log_event(LOGGER, "key_spill_unavailable", fallback="memory")
 
     plan = plan_tables(schema)
     row_counts: Dict[str, int] = {}
-    pk_pools: Dict[str, List[Any]] = {}
+    pk_pools: Dict[str, KeyPool] = {}
     repair_attempts: Dict[str, int] = {}
-
-    for table_name in plan:
-        table = schema.tables[table_name]
-        table_seed = rng.derive(table_name)
-        row_count = schema.dataset.size.get(table_name, 10)
-        row_counts[table_name] = row_count
-        pk_pools[table_name] = []
-        repair_attempts[table_name] = 0
-
-        exporter = _make_exporter(fmt, out_path, table_name, list(table.columns.keys()))
-        unique_sets: Dict[str, set] = {col: set() for col, spec in table.columns.items() if spec.unique}
-        pk_set: set = set()
-
-        def generate_row() -> Dict[str, Any]:
-            return _generate_row(table, table_seed, pk_pools, schema)
-
-        def validate_row(row: Dict[str, Any]) -> bool:
-            return _row_valid(row, table, unique_sets, pk_set, pk_pools, schema)
-
-        for idx in range(row_count):
-            if schema.dataset.mode == "valid":
-                result = repair_loop(generate_row, validate_row, schema.dataset.max_attempts)
-                row = result.row
-                success = result.success
-                repair_attempts[table_name] += result.attempts
-                if not success:
-                    log_event(LOGGER, "row_generation_failed", table=table_name, row_index=idx)
+    inline = InlineValidation(schema) if validate == "inline" else None
+
+    with ExitStack() as stack:
+        executor = None
+        pool_store = None
+        connections = None
+        if fmt == "db":
+            connections = stack.enter_context(ConnectionPool(export.db_url, size=workers))
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            pool_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="synthtest-pools-"))
+            pool_store = PoolStore(Path(pool_dir))
+        spill_root = None
+        if spill_after is not None and spill_available():
+            spill_root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="synthtest-spill-")))
+
+        for table_name in plan:
+            row_counts[table_name] = schema.dataset.size.get(table_name, 10)
+            if spill_root is None:
+                pk_pools[table_name] = KeyPool()
             else:
-                row = generate_row()
-
-            _register_uniques(row, table, unique_sets, pk_set, pk_pools)
-            exporter.write_row(row)
-
-        exporter.close()
+                pk_pools[table_name] = KeyPool(spill_after=spill_after, spill_dir=spill_root / table_name)
+            repair_attempts[table_name] = 0
+
+        def run_table(table_name: str) -> None:
+            table = schema.tables[table_name]
+            exporter = _make_exporter(fmt, out_path, table, schema, export, connections)
+            if inline is not None:
+                exporter = inline.wrap(table_name, exporter)
+            repair_attempts[table_name] = _generate_table(
+                table,
+                rng.derive(table_name),
+                row_counts[table_name],
+                pk_pools,
+                schema,
+                exporter,
+                executor,
+                pool_store,
+                workers,
+            )
+            exporter.close()
+            if pool_store is not None:
+                pool_store.publish(table_name, pk_pools[table_name])
+
+        if executor is None:
+            for table_name in plan:
+                run_table(table_name)
+        else:
+            _run_schedule(plan, plan_parents(schema), run_table, workers)
 
     metadata = RunMetadata(
         dataset_id=dataset_id,
@@ -78,12 +143,19 @@ def generate_dataset(schema: SchemaSpec, config_hash: str, out_dir: str | Path,
         row_counts=row_counts,
         tables=list(row_counts.keys()),
         max_attempts=schema.dataset.max_attempts,
+        compression=export.compression,
+        files={name: _output_path(fmt, out_path, name, export).name for name in row_counts} if fmt != "db" else {},
     )
 
     metadata_path = out_path / "run_metadata.json"
     metadata_path.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
 
-    report = validate_output(schema, out_path, fmt)
+    if validate == "off":
+        return metadata
+    if inline is not None:
+        report = inline.report()
+    else:
+        report = validate_output(schema, out_path, fmt, workers=workers, files=metadata.files)
     for table_name, attempts in repair_attempts.items():
         if table_name in report.tables:
             report.tables[table_name].repair_attempts = attempts
@@ -93,138 +165,495 @@ def generate_dataset(schema: SchemaSpec, config_hash: str, out_dir: str | Path,
     return metadata
 
 
-def _make_exporter(fmt: str, out_dir: Path, table: str, columns: List[str]):
+def _run_schedule(
+    plan: List[str],
+    parents: Dict[str, Set[str]],
+    run_table: Callable[[str], None],
+    workers: int,
+) -> None:
+    """Run tables concurrently, starting each one once all of its parents are done.
+
+    Table threads only orchestrate: chunk generation runs in the shared process
+    pool, and each table's output depends only on its seed and its parents'
+    finalized key pools, so scheduling order never changes the result.
+    """
+    pending = list(plan)
+    done: Set[str] = set()
+    running: Dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="synthtest-table") as threads:
+        while pending or running:
+            ready = [name for name in pending if parents.get(name, set()) <= done]
+            for name in ready:
+                pending.remove(name)
+                running[threads.submit(run_table, name)] = name
+                log_event(LOGGER, "table_started", table=name)
+            if not running:
+                raise DependencyError(f"Unschedulable tables: {', '.join(pending)}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                future.result()
+                done.add(name)
+
+
+def _generate_table(
+    table: TableSpec,
+    table_seed: Rng,
+    row_count: int,
+    pk_pools: Dict[str, KeyPool],
+    schema: SchemaSpec,
+    exporter,
+    executor: Executor | None = None,
+    pool_store: PoolStore | None = None,
+    workers: int = 1,
+) -> int:
+    """Generate one table into ``exporter``; returns the number of repair attempts."""
+    repair_attempts = 0
+    unique_sets = _unique_sets(table, schema.dataset.unique_check, row_count)
+    # The table's own pool doubles as its primary-key set.
+    pk_set = pk_pools[table.name]
+    plan = compile_table(table, schema, pk_pools)
+
+    if schema.dataset.engine == "columnar":
+        batches = _generate_columnar(
+            plan,
+            table_seed,
+            row_count,
+            pk_pools,
+            schema,
+            unique_sets,
+            pk_set,
+            executor,
+            pool_store,
+            workers,
+        )
+        for batch, attempts in batches:
+            repair_attempts += attempts
+            if hasattr(exporter, "write_batch"):
+                exporter.write_batch(batch)
+            else:
+                exporter.write_rows(batch.rows())
+        return repair_attempts
+
+    row_rng = table_seed
+
+    def generate_row() -> Dict[str, Any]:
+        return _generate_row(plan, row_rng)
+
+    def validate_row(row: Dict[str, Any]) -> bool:
+        return _row_valid(row, plan, unique_sets, pk_set)
+
+    pending: List[Dict[str, Any]] = []
+    for idx in range(row_count):
+        # A counter rng gives each row its own streams; a sequential one returns itself.
+        row_rng = table_seed.row(idx)
+        if plan.mode == "valid" and plan.constraints is not None:
+            result = _targeted_repair(generate_row(), plan, row_rng, unique_sets, pk_set)
+            row = result.row
+            repair_attempts += result.attempts
+            if not result.success:
+                log_event(LOGGER, "row_generation_failed", table=table.name, row_index=idx)
+        elif plan.mode == "valid":
+            result = repair_loop(generate_row, validate_row, plan.max_attempts)
+            row = result.row
+            success = result.success
+            repair_attempts += result.attempts
+            if not success:
+                log_event(LOGGER, "row_generation_failed", table=table.name, row_index=idx)
+        else:
+            row = generate_row()
+
+        _register_uniques(row, table, unique_sets, pk_pools)
+        pending.append(row)
+        if len(pending) >= WRITE_CHUNK_ROWS:
+            exporter.write_rows(pending)
+            pending = []
+
+    exporter.write_rows(pending)
+    return repair_attempts
+
+
+def _targeted_repair(
+    row: Dict[str, Any],
+    plan: CompiledTable,
+    rng: Rng,
+    unique_sets: Dict[str, set],
+    pk_set: set,
+) -> RepairResult:
+    return targeted_repair_loop(
+        row,
+        lambda candidate: _row_violations(candidate, plan, unique_sets, pk_set),
+        lambda candidate, columns: _resample_columns(candidate, columns, plan, rng),
+        plan.max_attempts,
+    )
+
+
+def _output_path(fmt: str, out_dir: Path, table: str, export: ExportOptions) -> Path:
     if fmt == "csv":
-        return CsvExporter(out_dir / f"{table}.csv", columns)
+        return compressed_path(out_dir / f"{table}.csv", export.compression)
     if fmt == "json":
-        return JsonExporter(out_dir / f"{table}.jsonl", columns)
+        return compressed_path(out_dir / f"{table}.jsonl", export.compression)
     if fmt == "sql":
-        return SqlExporter(out_dir / f"{table}.sql", table, columns)
+        return compressed_path(out_dir / f"{table}.sql", export.compression)
+    if fmt in ARROW_FORMATS:
+        return out_dir / f"{table}{ARROW_FORMATS[fmt]}"
     raise ValueError(f"Unsupported format: {fmt}")
 
 
-def _generate_row(table: TableSpec, rng: Rng, pk_pools: Dict[str, List[Any]], schema: SchemaSpec) -> Dict[str, Any]:
+def _make_exporter(
+    fmt: str,
+    out_dir: Path,
+    table: TableSpec,
+    schema: SchemaSpec,
+    export: ExportOptions,
+    connections: ConnectionPool | None = None,
+):
+    if fmt == "db":
+        return DatabaseExporter(connections, table, schema.dataset.mode, export.db_batch_size, export.db_mode)
+    columns = list(table.columns.keys())
+    path = _output_path(fmt, out_dir, table.name, export)
+    if fmt == "csv":
+        return CsvExporter(path, columns, export.buffer_size, export.compression)
+    if fmt == "json":
+        return JsonExporter(path, columns, export.buffer_size, export.compression)
+    if fmt == "sql":
+        return SqlExporter(
+            path,
+            table.name,
+            columns,
+            export.sql_batch_size,
+            export.sql_style,
+            export.buffer_size,
+            export.compression,
+        )
+    return ArrowExporter(path, table, schema.dataset.mode, fmt, schema.dataset.batch_size, export.compression)
+
+
+def _generate_row(plan: CompiledTable, rng: Rng) -> Dict[str, Any]:
+    if plan.constraints:
+        return _resample_columns({}, set(plan.columns), plan, rng)
+
     row: Dict[str, Any] = {}
-    for col_name, column in table.columns.items():
-        value = _generate_value(table, column, rng, pk_pools, schema)
-        value, _ = apply_edge_cases(value, column, schema.dataset.mode, rng)
+    for col_name, column in plan.columns.items():
+        column_rng = rng.column(col_name)
+        value, _ = column.apply_edge_cases(column.generate(column_rng), column_rng)
         row[col_name] = value
 
     return row
 
 
-def _generate_value(
-    table: TableSpec,
-    column: ColumnSpec,
+def _resample_columns(
+    row: Dict[str, Any],
+    columns: Set[str],
+    plan: CompiledTable,
+    rng: Rng,
+) -> Dict[str, Any]:
+    """Redraw ``columns`` of ``row``, applying rule-derived bounds to bounded columns.
+
+    Bounded columns are drawn after all other columns so their predicates are
+    known; the returned row keeps the table's column order.
+    """
+    constraints = plan.constraints
+    updated = dict(row)
+    for col_name in constraints.order:
+        if col_name not in columns:
+            continue
+        column = plan.column(constraints.column_for(plan.table.columns[col_name], updated))
+        column_rng = rng.column(col_name)
+        value, _ = column.apply_edge_cases(column.generate(column_rng), column_rng)
+        updated[col_name] = value
+    return {col_name: updated.get(col_name) for col_name in plan.columns}
+
+
+def _generate_columnar(
+    plan: CompiledTable,
     rng: Rng,
-    pk_pools: Dict[str, List[Any]],
+    row_count: int,
+    pk_pools: Dict[str, KeyPool],
     schema: SchemaSpec,
-) -> Any:
-    fk = next((fk for fk in table.foreign_keys if fk.column == column.name), None)
-    if fk:
-        parent_pool = pk_pools.get(fk.ref_table, [])
-        if schema.dataset.mode == "invalid" and rng.random() < 0.2:
-            return "invalid_fk"
-        if parent_pool:
-            return rng.choice(parent_pool)
-        return None
-
-    if column.type == "uuid":
-        return primitives.generate_uuid(rng)
-    if column.type == "int":
-        min_val, max_val = _range_to_float(column.range)
-        return primitives.generate_int(rng, min_val, max_val, column.distribution)
-    if column.type == "decimal":
-        min_val, max_val = _range_to_float(column.range)
-        return primitives.generate_decimal(rng, min_val, max_val, column.distribution)
-    if column.type == "bool":
-        return primitives.generate_bool(rng)
-    if column.type == "datetime":
-        start, end = primitives.parse_datetime_range(column.range)
-        return primitives.generate_datetime(rng, start, end)
-    if column.type == "date":
-        start, end = primitives.parse_date_range(column.range)
-        return primitives.generate_date(rng, start, end)
-    if column.type == "enum":
-        return primitives.generate_enum(rng, column.values or [], column.weights)
-    if column.type == "text":
-        min_len, max_len = _length_pair(column.length)
-        if column.regex:
-            return primitives.generate_text_from_regex(rng, column.regex)
-        return primitives.generate_text(rng, min_len, max_len)
-    if column.type == "email":
-        return faker_generators.generate_email(rng)
-    if column.type == "phone":
-        return faker_generators.generate_phone(rng)
-    if column.type == "country":
-        return faker_generators.generate_country(rng)
-    if column.type == "postcode_uk":
-        return faker_generators.generate_postcode_uk(rng)
-    if column.type == "name":
-        return faker_generators.generate_name(rng)
-    return None
-
-
-def _range_to_float(raw):
-    if not raw or len(raw) < 2:
-        return None, None
-    return float(raw[0]), float(raw[1])
-
-
-def _length_pair(raw):
-    if not raw or len(raw) < 2:
-        return None, None
-    return int(raw[0]), int(raw[1])
-
-
-def _row_valid(
-    row: Dict[str, Any],
-    table: TableSpec,
     unique_sets: Dict[str, set],
     pk_set: set,
-    pk_pools: Dict[str, List[Any]],
+    executor: Executor | None = None,
+    pool_store: PoolStore | None = None,
+    workers: int = 1,
+) -> Iterator[Tuple[ColumnBatch, int]]:
+    """Generate a table in column chunks of ``dataset.batch_size`` rows.
+
+    Seed ordering (stable for a given seed and batch size):
+      - chunk ``k`` draws from ``table_rng.derive("chunk:k")``
+      - each column draws its values from ``chunk_rng.derive(column)``, then
+        edge cases from ``column_rng.derive("edge")``
+      - rows failing validation inside the chunk are regenerated from
+        ``chunk_rng.derive("repair")``
+      - rows colliding with keys of earlier chunks are regenerated from
+        ``chunk_rng.derive("merge")``
+
+    Chunks only depend on their seed and the parent key pools, so with an
+    executor they are generated as shards in worker processes. Merging always
+    happens here, in chunk order, which keeps the output independent of the
+    number of workers.
+
+    With ``repair: targeted`` only the offending columns of a failing row are
+    resampled, using the same seeds.
+    """
+    table = plan.table
+    batch_size = schema.dataset.batch_size
+    chunks = [
+        (start, min(batch_size, row_count - start), rng if rng.counter else rng.derive(f"chunk:{chunk_index}"))
+        for chunk_index, start in enumerate(range(0, row_count, batch_size))
+    ]
+    if executor is None or pool_store is None:
+        results = (_generate_chunk(plan, chunk_rng, start, count, schema) for start, count, chunk_rng in chunks)
+    else:
+        parent_pools = pool_store.paths(fk.ref_table for fk in table.foreign_keys)
+        tasks = (
+            ChunkTask(schema, table.name, chunk_rng.seed, start, count, parent_pools)
+            for start, count, chunk_rng in chunks
+        )
+        results = ordered_map(executor, _run_chunk_task, tasks, window=workers * 2)
+
+    for (_, _, chunk_rng), (batch, attempts) in zip(chunks, results):
+        attempts += _merge_chunk(batch, plan, chunk_rng, unique_sets, pk_set, pk_pools)
+        yield batch, attempts
+
+
+def _run_chunk_task(task: ChunkTask) -> Tuple[ColumnBatch, int]:
+    table = task.schema.tables[task.table]
+    parents = {name: load_pool(path) for name, path in task.parent_pools.items()}
+    plan = compile_table(table, task.schema, parents)
+    rng = Rng.with_seed(task.seed, counter=task.schema.dataset.rng == "counter")
+    return _generate_chunk(plan, rng, task.start, task.count, task.schema)
+
+
+def _generate_chunk(
+    plan: CompiledTable,
+    rng: Rng,
+    start: int,
+    count: int,
     schema: SchemaSpec,
-) -> bool:
-    for col_name, column in table.columns.items():
+) -> Tuple[ColumnBatch, int]:
+    table = plan.table
+    data = {
+        col_name: _generate_column(column, rng.derive(col_name), count, schema, start)
+        for col_name, column in plan.columns.items()
+    }
+    batch = ColumnBatch(columns=list(plan.columns), data=data, start=start)
+    if plan.mode != "valid":
+        return batch, 0
+    attempts = count
+
+    if plan.constraints:
+        _apply_bounds(batch, plan, rng, start)
+    repair_rng = rng.derive("repair")
+    unique_sets: Dict[str, set] = {col: set() for col, spec in table.columns.items() if spec.unique}
+    pk_set: set = set()
+    for index in range(count):
+        row = batch.row(index)
+        if not _row_valid(row, plan, unique_sets, pk_set):
+            if plan.constraints is not None:
+                result = _targeted_repair(row, plan, repair_rng.row(start + index), unique_sets, pk_set)
+                result.attempts -= 1
+            else:
+                row_rng = repair_rng.row(start + index)
+                result = repair_loop(
+                    lambda: _generate_row(plan, row_rng),
+                    lambda candidate: _row_valid(candidate, plan, unique_sets, pk_set),
+                    plan.max_attempts - 1,
+                )
+            attempts += result.attempts
+            if result.row:
+                row = result.row
+                batch.set_row(index, row)
+            if not result.success:
+                log_event(LOGGER, "row_generation_failed", table=table.name, row_index=start + index)
+        _register_keys(row, table, unique_sets, pk_set)
+    return batch, attempts
+
+
+def _apply_bounds(batch: ColumnBatch, plan: CompiledTable, rng: Rng, start: int) -> None:
+    """Redraw bounded cells whose rule predicates hold from the narrowed range.
+
+    Columns are drawn unconditionally first, so this gives the first pass the
+    same bounds the row engine applies; cell ``i`` of column ``c`` redraws from
+    ``rng.derive(c + ":bounds").row(start + i)``.
+    """
+    constraints = plan.constraints
+    for col_name in constraints.order:
+        if col_name not in constraints.bounds:
+            continue
+        spec = plan.table.columns[col_name]
+        values = batch.data[col_name]
+        bound_rng = rng.derive(f"{col_name}:bounds")
+        for index in range(len(batch)):
+            narrowed = constraints.column_for(spec, batch.row(index))
+            if narrowed is spec:
+                continue
+            column = plan.column(narrowed)
+            cell_rng = bound_rng.row(start + index)
+            values[index] = column.apply_edge_cases(column.generate(cell_rng), cell_rng)[0]
+
+
+def _merge_chunk(
+    batch: ColumnBatch,
+    plan: CompiledTable,
+    rng: Rng,
+    unique_sets: Dict[str, set],
+    pk_set: set,
+    pk_pools: Dict[str, KeyPool],
+) -> int:
+    table = plan.table
+    attempts = 0
+    merge_rng = None
+    check = plan.mode == "valid"
+    for index in range(len(batch)):
+        if check and _key_conflict(batch, index, table, unique_sets, pk_set):
+            # Counter rngs repair a row from the same stream wherever its conflict is found,
+            # so the output does not depend on batch_size.
+            merge_rng = merge_rng or rng.derive("repair" if rng.counter else "merge")
+            row_rng = merge_rng.row(batch.start + index)
+            if plan.constraints is not None:
+                result = _targeted_repair(batch.row(index), plan, row_rng, unique_sets, pk_set)
+                result.attempts -= 1
+            else:
+                result = repair_loop(
+                    lambda: _generate_row(plan, row_rng),
+                    lambda candidate: _row_valid(candidate, plan, unique_sets, pk_set),
+                    plan.max_attempts,
+                )
+            attempts += result.attempts
+            if result.row:
+                batch.set_row(index, result.row)
+            if not result.success:
+                log_event(LOGGER, "row_generation_failed", table=table.name, row_index=batch.start + index)
+        _register_uniques(batch.row(index), table, unique_sets, pk_pools)
+    return attempts
+
+
+def _key_conflict(batch: ColumnBatch, index: int, table: TableSpec, unique_sets: Dict[str, set], pk_set: set) -> bool:
+    pk_values = batch.data.get(table.primary_key)
+    if pk_values is not None and pk_values[index] is not None and pk_values[index] in pk_set:
+        return True
+    for col_name, values in unique_sets.items():
+        value = batch.data[col_name][index]
+        if value is not None and value in values:
+            return True
+    return False
+
+
+def _generate_column(column: CompiledColumn, rng: Rng, count: int, schema: SchemaSpec, start: int = 0) -> List[Any]:
+    values = None
+    if schema.dataset.backend == "numpy" and not column.is_foreign_key:
+        values = vectorized.generate_column(column.spec, rng, count, start)
+    if rng.counter:
+        return _generate_counter_column(column, rng, count, start, values)
+    if values is None:
+        values = column.generate_many(rng, count)
+    edge_rng = rng.derive("edge")
+    apply_edge_cases = column.apply_edge_cases
+    return [apply_edge_cases(value, edge_rng)[0] for value in values]
+
+
+def _generate_counter_column(
+    column: CompiledColumn, rng: Rng, count: int, start: int, values: Optional[List[Any]]
+) -> List[Any]:
+    """Rows ``start .. start + count`` of a column, each drawn from ``rng.row(index)``.
+
+    Scalar values and their edge cases come from the row's stream, as in the
+    row engine; NumPy values took the first draws of every row, so their edge
+    cases use ``rng.derive("edge")`` instead.
+    """
+    apply_edge_cases = column.apply_edge_cases
+    if values is None:
+        generate = column.generate
+        out = []
+        for index in range(start, start + count):
+            row_rng = rng.row(index)
+            out.append(apply_edge_cases(generate(row_rng), row_rng)[0])
+        return out
+    edge_rng = rng.derive("edge")
+    return [apply_edge_cases(value, edge_rng.row(start + offset))[0] for offset, value in enumerate(values)]
+
+
+def _row_valid(row: Dict[str, Any], plan: CompiledTable, unique_sets: Dict[str, set], pk_set: set) -> bool:
+    return next(_iter_row_violations(row, plan, unique_sets, pk_set), None) is None
+
+
+def _row_violations(row: Dict[str, Any], plan: CompiledTable, unique_sets: Dict[str, set], pk_set: set) -> Set[str]:
+    return set(_iter_row_violations(row, plan, unique_sets, pk_set))
+
+
+def _iter_row_violations(
+    row: Dict[str, Any],
+    plan: CompiledTable,
+    unique_sets: Dict[str, set],
+    pk_set: set,
+) -> Iterator[str]:
+    """Yield the name of each column that makes ``row`` invalid.
+
+    Rule violations yield the columns their constraint reads, or every column
+    when the constraint does not reference this table.
+    """
+    fk_index = plan.fk_index
+    for col_name, column in plan.columns.items():
+        spec = column.spec
         value = row.get(col_name)
         if value is None:
-            if not column.nullable:
-                return False
+            if not spec.nullable:
+                yield col_name
+            continue
+        if spec.unique and value in unique_sets.get(col_name, ()):
+            yield col_name
             continue
-        if column.unique and value in unique_sets.get(col_name, set()):
-            return False
-        if col_name == table.primary_key and value in pk_set:
-            return False
-        if column.type == "enum" and column.values and value not in column.values:
-            return False
-        if column.type in {"int", "decimal"} and column.range and len(column.range) >= 2:
-            min_val, max_val = float(column.range[0]), float(column.range[1])
+        if col_name == plan.primary_key and value in pk_set:
+            yield col_name
+            continue
+        if column.enum_values is not None and value not in column.enum_values:
+            yield col_name
+            continue
+        if column.numeric_range is not None:
             try:
                 numeric = float(value)
             except (TypeError, ValueError):
-                return False
-            if numeric < min_val or numeric > max_val:
-                return False
-        if column.type == "text" and column.regex:
-            import re
-
-            if not re.fullmatch(column.regex, str(value)):
-                return False
-        fk = next((fk for fk in table.foreign_keys if fk.column == col_name), None)
-        if fk:
-            if value not in pk_pools.get(fk.ref_table, []):
-                return False
-    context = {table.name: row}
-    if evaluate_rules(schema.rules, context):
-        return False
-    return True
-
-
-def _register_uniques(row: Dict[str, Any], table: TableSpec, unique_sets: Dict[str, set], pk_set: set, pk_pools: Dict[str, List[Any]]):
+                yield col_name
+                continue
+            if numeric < column.numeric_range[0] or numeric > column.numeric_range[1]:
+                yield col_name
+                continue
+        if spec.type == "text" and column.regex is not None and not column.regex.fullmatch(str(value)):
+            yield col_name
+            continue
+        if column.is_foreign_key and not fk_index.contains(col_name, value):
+            yield col_name
+            continue
+    if plan.rules:
+        for columns in plan.rules.violated_columns({plan.name: row}, plan.name):
+            yield from columns or plan.columns
+
+
+def _unique_sets(table: TableSpec, unique_check: str, row_count: int) -> Dict[str, Any]:
+    """Seen-value sets of the unique columns; Bloom filters for non-key columns in ``bloom`` mode."""
+    return {
+        col: BloomKeySet(row_count) if unique_check == "bloom" and col != table.primary_key else KeySet()
+        for col, spec in table.columns.items()
+        if spec.unique
+    }
+
+
+def _register_uniques(row: Dict[str, Any], table: TableSpec, unique_sets: Dict[str, Any], pk_pools: Dict[str, KeyPool]):
     pk_value = row.get(table.primary_key)
     if pk_value is not None:
-        pk_set.add(pk_value)
         pk_pools[table.name].append(pk_value)
+    _register_unique_values(row, unique_sets)
+
+
+def _register_keys(row: Dict[str, Any], table: TableSpec, unique_sets: Dict[str, set], pk_set: set) -> None:
+    pk_value = row.get(table.primary_key)
+    if pk_value is not None:
+        pk_set.add(pk_value)
+    _register_unique_values(row, unique_sets)
+
+
+def _register_unique_values(row: Dict[str, Any], unique_sets: Dict[str, Any]) -> None:
     for col_name, values in unique_sets.items():
         value = row.get(col_name)
         if value is not None:
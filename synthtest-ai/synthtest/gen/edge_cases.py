@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Tuple
+from typing import Any, Callable, Optional, Tuple
 
 from synthtest.schema.canonical import ColumnSpec
 from synthtest.util.rng import Rng
@@ -11,17 +11,52 @@ VALID_NULL_PROB = 0.1
 INVALID_PROB = 0.25
 
 
+EdgeCaseFn = Callable[[Any, Rng], Tuple[Any, Optional[str]]]
+
+
 def apply_edge_cases(value: Any, column: ColumnSpec, mode: str, rng: Rng) -> tuple[Any, str | None]:
-    if mode == "invalid" and rng.random() < INVALID_PROB:
-        return _invalid_value(column, rng), "invalid"
+    return compile_edge_cases(column, mode)(value, rng)
+
+
+def compile_edge_cases(column: ColumnSpec, mode: str) -> EdgeCaseFn:
+    """Bind the edge-case policy of ``column`` once; draws match ``apply_edge_cases``."""
+    invalid = mode == "invalid"
+    invalid_value = _invalid_value(column, None)
+    nullable = column.nullable
+    boundary = _compile_boundary(column)
+
+    def apply(value: Any, rng: Rng) -> tuple[Any, str | None]:
+        if invalid and rng.random() < INVALID_PROB:
+            return invalid_value, "invalid"
+        if nullable and rng.random() < VALID_NULL_PROB:
+            return None, "null"
+        if rng.random() < VALID_BOUNDARY_PROB:
+            return boundary(value, rng), "boundary"
+        return value, None
 
-    if column.nullable and rng.random() < VALID_NULL_PROB:
-        return None, "null"
+    return apply
 
-    if rng.random() < VALID_BOUNDARY_PROB:
-        return _boundary_value(value, column, rng), "boundary"
 
-    return value, None
+def _compile_boundary(column: ColumnSpec) -> Callable[[Any, Rng], Any]:
+    try:
+        if column.type in {"int", "decimal"} and column.range and len(column.range) >= 2:
+            cast = int if column.type == "int" else float
+            pair = (cast(column.range[0]), cast(column.range[1]))
+        elif column.type == "date" and column.range and len(column.range) >= 2:
+            pair = primitives.parse_date_range(column.range)
+        elif column.type == "datetime" and column.range and len(column.range) >= 2:
+            pair = primitives.parse_datetime_range(column.range)
+        elif column.type == "enum" and column.values:
+            pair = (column.values[0], column.values[-1])
+        elif column.type == "text" and column.length and len(column.length) >= 2:
+            return lambda value, rng: _boundary_value(value, column, rng)
+        else:
+            return lambda value, rng: value
+    except (TypeError, ValueError):
+        # Leave malformed ranges to fail (or not) per value, as before.
+        return lambda value, rng: _boundary_value(value, column, rng)
+    low, high = pair
+    return lambda value, rng: low if rng.random() < 0.5 else high
 
 
 def _boundary_value(value: Any, column: ColumnSpec, rng: Rng) -> Any:
@@ -45,7 +80,7 @@ def _boundary_value(value: Any, column: ColumnSpec, rng: Rng) -> Any:
     return value
 
 
-def _invalid_value(column: ColumnSpec, rng: Rng) -> Any:
+def _invalid_value(column: ColumnSpec, rng: Rng | None) -> Any:
     if column.type in {"int", "decimal"}:
         if column.range and len(column.range) >= 2:
             return float(column.range[1]) + 9999
@@ -4,7 +4,9 @@ import datetime as dt
 import math
 import string
 import uuid
-from typing import List, Optional
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 from synthtest.util.rng import Rng
 
@@ -13,16 +15,26 @@ DEFAULT_DATE_START = dt.date(2020, 1, 1)
 DEFAULT_DATE_END = dt.date(2025, 12, 31)
 DEFAULT_DATETIME_START = dt.datetime(2020, 1, 1, 0, 0, 0)
 DEFAULT_DATETIME_END = dt.datetime(2025, 12, 31, 23, 59, 59)
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
 
 
 def generate_uuid(rng: Rng) -> str:
     return str(uuid.UUID(int=rng.getrandbits(128)))
 
 
-def generate_int(rng: Rng, min_val: int | None, max_val: int | None, distribution: str | None) -> int:
+def generate_int(
+    rng: Rng,
+    min_val: int | None,
+    max_val: int | None,
+    distribution: str | None,
+    quantiles: Sequence[float] | None = None,
+) -> int:
     min_val = 0 if min_val is None else int(min_val)
     max_val = 1000 if max_val is None else int(max_val)
-    if distribution == "normal":
+    if distribution == "empirical" and quantiles:
+        value = int(round(sample_quantiles(rng, quantiles)))
+    elif distribution == "normal":
         mean = (min_val + max_val) / 2
         sigma = (max_val - min_val) / 6 or 1
         value = int(round(rng.gauss(mean, sigma)))
@@ -33,10 +45,18 @@ def generate_int(rng: Rng, min_val: int | None, max_val: int | None, distributio
     return max(min_val, min(max_val, value))
 
 
-def generate_decimal(rng: Rng, min_val: float | None, max_val: float | None, distribution: str | None) -> float:
+def generate_decimal(
+    rng: Rng,
+    min_val: float | None,
+    max_val: float | None,
+    distribution: str | None,
+    quantiles: Sequence[float] | None = None,
+) -> float:
     min_val = 0.0 if min_val is None else float(min_val)
     max_val = 1000.0 if max_val is None else float(max_val)
-    if distribution == "normal":
+    if distribution == "empirical" and quantiles:
+        value = sample_quantiles(rng, quantiles)
+    elif distribution == "normal":
         mean = (min_val + max_val) / 2
         sigma = (max_val - min_val) / 6 or 1.0
         value = rng.gauss(mean, sigma)
@@ -51,22 +71,65 @@ def generate_bool(rng: Rng) -> bool:
     return rng.random() < 0.5
 
 
-def generate_date(rng: Rng, start: dt.date | None, end: dt.date | None) -> dt.date:
+def generate_date(
+    rng: Rng, start: dt.date | None, end: dt.date | None, quantiles: Sequence[float] | None = None
+) -> dt.date:
+    """``quantiles`` are day offsets from ``start`` (see ``quantile_points``)."""
     start = start or DEFAULT_DATE_START
     end = end or DEFAULT_DATE_END
-    delta_days = (end - start).days
-    offset = rng.randint(0, max(delta_days, 0))
+    delta_days = max((end - start).days, 0)
+    if quantiles:
+        offset = max(0, min(delta_days, int(round(sample_quantiles(rng, quantiles)))))
+    else:
+        offset = rng.randint(0, delta_days)
     return start + dt.timedelta(days=offset)
 
 
-def generate_datetime(rng: Rng, start: dt.datetime | None, end: dt.datetime | None) -> dt.datetime:
+def generate_datetime(
+    rng: Rng, start: dt.datetime | None, end: dt.datetime | None, quantiles: Sequence[float] | None = None
+) -> dt.datetime:
+    """``quantiles`` are second offsets from ``start`` (see ``quantile_points``)."""
     start = start or DEFAULT_DATETIME_START
     end = end or DEFAULT_DATETIME_END
-    delta_seconds = int((end - start).total_seconds())
-    offset = rng.randint(0, max(delta_seconds, 0))
+    delta_seconds = max(int((end - start).total_seconds()), 0)
+    if quantiles:
+        offset = max(0, min(delta_seconds, int(round(sample_quantiles(rng, quantiles)))))
+    else:
+        offset = rng.randint(0, delta_seconds)
     return start + dt.timedelta(seconds=offset)
 
 
+def sample_quantiles(rng: Rng, points: Sequence[float]) -> float:
+    """Inverse-CDF draw: pick one of the equal-mass bins between consecutive
+    quantile ``points`` and interpolate linearly inside it. O(1) per draw."""
+    bins = len(points) - 1
+    position = rng.random() * bins
+    index = int(position)
+    low = points[index]
+    return low + (position - index) * (points[index + 1] - low)
+
+
+def quantile_points(column_type: str, raw: Sequence[str | int | float], start: Any = None) -> List[float]:
+    """Numeric quantile points for an ``empirical`` column.
+
+    Dates and datetimes become day / second offsets from ``start`` (the
+    range start, or the default one).
+    """
+    if len(raw) < 2:
+        raise ValueError("empirical distribution needs at least two quantiles")
+    if column_type == "date":
+        start = start or DEFAULT_DATE_START
+        points = [float((_to_date(value) - start).days) for value in raw]
+    elif column_type == "datetime":
+        start = start or DEFAULT_DATETIME_START
+        points = [(_to_datetime(value) - start).total_seconds() for value in raw]
+    else:
+        points = [float(value) for value in raw]
+    if any(high < low for low, high in zip(points, points[1:])):
+        raise ValueError("empirical quantiles must be in ascending order")
+    return points
+
+
 def generate_text(rng: Rng, min_len: int | None, max_len: int | None) -> str:
     min_len = 5 if min_len is None else min_len
     max_len = 20 if max_len is None else max_len
@@ -76,13 +139,19 @@ def generate_text(rng: Rng, min_len: int | None, max_len: int | None) -> str:
 
 
 def generate_text_from_regex(rng: Rng, pattern: str) -> str:
+    return compile_regex_generator(pattern)(rng)
+
+
+def compile_regex_generator(pattern: str) -> Callable[[Rng], str]:
+    """Parse ``pattern`` once into a generator; draws match ``generate_text_from_regex``."""
     cleaned = pattern.strip()
     if cleaned.startswith("^"):
         cleaned = cleaned[1:]
     if cleaned.endswith("$"):
         cleaned = cleaned[:-1]
 
-    tokens: List[str] = []
+    # Each token is (charset, literal, fixed repeat, (low, high) or None).
+    tokens: List[Tuple[Optional[str], Optional[str], int, Optional[Tuple[int, int]]]] = []
     i = 0
     while i < len(cleaned):
         char = cleaned[i]
@@ -110,6 +179,7 @@ def generate_text_from_regex(rng: Rng, pattern: str) -> str:
             i += 1
 
         repeat = 1
+        bounds = None
         if i < len(cleaned) and cleaned[i] == "{":
             end = cleaned.find("}", i)
             if end != -1:
@@ -118,18 +188,24 @@ def generate_text_from_regex(rng: Rng, pattern: str) -> str:
                     parts = [p.strip() for p in quant.split(",", 1)]
                     low = int(parts[0] or 0)
                     high = int(parts[1] or low)
-                    repeat = rng.randint(low, max(low, high))
+                    bounds = (low, max(low, high))
                 else:
                     repeat = int(quant)
                 i = end + 1
+        tokens.append((charset, literal, repeat, bounds))
 
-        for _ in range(repeat):
+    def generate(rng: Rng) -> str:
+        out: List[str] = []
+        for charset, literal, repeat, bounds in tokens:
+            if bounds is not None:
+                repeat = rng.randint(bounds[0], bounds[1])
             if charset:
-                tokens.append(rng.choice(charset))
+                out.extend(rng.choice(charset) for _ in range(repeat))
             elif literal is not None:
-                tokens.append(literal)
+                out.append(literal * repeat)
+        return "".join(out)
 
-    return "".join(tokens)
+    return generate
 
 
 def _expand_class(content: str) -> str:
@@ -151,10 +227,45 @@ def generate_enum(rng: Rng, values: List[str], weights: Optional[List[float]] =
     if not values:
         return ""
     if weights and len(weights) == len(values):
-        return rng.choices(values, weights=weights, k=1)[0]
+        return WeightedSampler(values, weights).draw(rng)
     return rng.choice(values)
 
 
+class WeightedSampler:
+    """Weighted choice over fixed values, built once per column.
+
+    Cumulative weights are computed up front and each draw is one bisect
+    (O(log n)) on a single ``rng.random()``, so draws are identical to
+    ``rng.choices(values, weights)`` without rebuilding the weights per call.
+    """
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+        if len(values) != len(weights) or not values:
+            raise ValueError("weights must match values")
+        self.values = list(values)
+        self.cum_weights = list(accumulate(weights))
+        self.total = self.cum_weights[-1] + 0.0
+        if not (0.0 < self.total < math.inf):
+            raise ValueError("weights must sum to a positive, finite total")
+        self._hi = len(self.values) - 1
+
+    def draw(self, rng: Rng) -> Any:
+        return self.values[bisect_right(self.cum_weights, rng.random() * self.total, 0, self._hi)]
+
+    def draw_many(self, rng: Rng, count: int) -> List[Any]:
+        """``count`` draws, the same as calling ``draw`` ``count`` times."""
+        values, cum_weights, total, hi = self.values, self.cum_weights, self.total, self._hi
+        random = rng.random
+        return [values[bisect_right(cum_weights, random() * total, 0, hi)] for _ in range(count)]
+
+
+def parse_int_range(raw: List[str | int | float] | None) -> tuple[int | None, int | None]:
+    """Int bounds as exact Python ints (no float round trip), clamped to the int64 range."""
+    if not raw or len(raw) < 2:
+        return None, None
+    return _to_int64(raw[0]), _to_int64(raw[1])
+
+
 def parse_date_range(raw: List[str | int | float] | None) -> tuple[dt.date | None, dt.date | None]:
     if not raw or len(raw) < 2:
         return None, None
@@ -171,6 +282,17 @@ def parse_datetime_range(raw: List[str | int | float] | None) -> tuple[dt.dateti
     return start, end
 
 
+def _to_int64(value: str | int | float) -> int:
+    if isinstance(value, int):
+        number = value
+    else:
+        try:
+            number = int(str(value))
+        except ValueError:
+            number = int(float(value))
+    return max(INT64_MIN, min(INT64_MAX, number))
+
+
 def _to_date(value: str | int | float) -> dt.date:
     if isinstance(value, (int, float)):
         return dt.date.fromtimestamp(float(value))
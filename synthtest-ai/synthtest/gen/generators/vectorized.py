@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from typing import Any, List, Optional
+
+from synthtest.gen.generators import primitives
+from synthtest.schema.canonical import ColumnSpec
+from synthtest.util.rng import Rng
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def make_generator(rng: Rng, start: int = 0, count: int = 0):
+    if rng.counter:
+        return rng.batch(start, count)
+    return np.random.default_rng(rng.seed)
+
+
+def generate_column(column: ColumnSpec, rng: Rng, count: int, start: int = 0) -> Optional[List[Any]]:
+    """Generate ``count`` values for ``column`` with NumPy.
+
+    Returns ``None`` when NumPy is unavailable or the column type has no
+    vectorized implementation, so callers can fall back to the scalar path.
+    With a counter rng the values are those of rows ``start .. start + count``.
+    """
+    if np is None:
+        return None
+    gen = make_generator(rng, start, count)
+    if column.type == "uuid":
+        return generate_uuid_array(gen, count)
+    if column.type == "int":
+        min_val, max_val = primitives.parse_int_range(column.range)
+        quantiles = _quantiles(column)
+        return generate_int_array(gen, count, min_val, max_val, column.distribution, quantiles).tolist()
+    if column.type == "decimal":
+        min_val, max_val = _range_pair(column.range)
+        quantiles = _quantiles(column)
+        return generate_decimal_array(gen, count, min_val, max_val, column.distribution, quantiles).tolist()
+    if column.type == "bool":
+        return generate_bool_array(gen, count).tolist()
+    if column.type == "date":
+        start, end = primitives.parse_date_range(column.range)
+        return generate_date_array(gen, count, start, end, _quantiles(column, start))
+    if column.type == "datetime":
+        start, end = primitives.parse_datetime_range(column.range)
+        return generate_datetime_array(gen, count, start, end, _quantiles(column, start))
+    if column.type == "enum":
+        return generate_enum_array(gen, count, column.values or [], column.weights)
+    return None
+
+
+def generate_uuid_array(gen, count: int) -> List[str]:
+    raw = gen.bytes(16 * count)
+    return [str(uuid.UUID(bytes=raw[i : i + 16])) for i in range(0, 16 * count, 16)]
+
+
+def generate_int_array(
+    gen,
+    count: int,
+    min_val: int | None,
+    max_val: int | None,
+    distribution: str | None,
+    quantiles: Optional[List[float]] = None,
+):
+    min_val = 0 if min_val is None else int(min_val)
+    max_val = 1000 if max_val is None else int(max_val)
+    if distribution == "empirical" and quantiles:
+        values = np.rint(_sample_quantiles(gen, count, quantiles)).astype(np.int64)
+    elif distribution == "normal":
+        mean = (min_val + max_val) / 2
+        sigma = (max_val - min_val) / 6 or 1
+        values = np.rint(gen.normal(mean, sigma, count)).astype(np.int64)
+    elif distribution == "lognormal":
+        values = np.rint(_scaled_lognormal(gen, count, min_val, max_val)).astype(np.int64)
+    else:
+        values = gen.integers(min_val, max_val, size=count, endpoint=True)
+    return np.clip(values, min_val, max_val)
+
+
+def generate_decimal_array(
+    gen,
+    count: int,
+    min_val: float | None,
+    max_val: float | None,
+    distribution: str | None,
+    quantiles: Optional[List[float]] = None,
+):
+    min_val = 0.0 if min_val is None else float(min_val)
+    max_val = 1000.0 if max_val is None else float(max_val)
+    if distribution == "empirical" and quantiles:
+        values = _sample_quantiles(gen, count, quantiles)
+    elif distribution == "normal":
+        mean = (min_val + max_val) / 2
+        sigma = (max_val - min_val) / 6 or 1.0
+        values = gen.normal(mean, sigma, count)
+    elif distribution == "lognormal":
+        values = _scaled_lognormal(gen, count, min_val, max_val)
+    else:
+        values = gen.uniform(min_val, max_val, count)
+    return np.clip(values, min_val, max_val)
+
+
+def generate_bool_array(gen, count: int):
+    return gen.random(count) < 0.5
+
+
+def generate_date_array(
+    gen, count: int, start: dt.date | None, end: dt.date | None, quantiles: Optional[List[float]] = None
+) -> List[dt.date]:
+    start = start or primitives.DEFAULT_DATE_START
+    end = end or primitives.DEFAULT_DATE_END
+    delta_days = max((end - start).days, 0)
+    offsets = _offsets(gen, count, delta_days, quantiles)
+    return (np.datetime64(start, "D") + offsets.astype("timedelta64[D]")).astype(object).tolist()
+
+
+def generate_datetime_array(
+    gen, count: int, start: dt.datetime | None, end: dt.datetime | None, quantiles: Optional[List[float]] = None
+) -> List[dt.datetime]:
+    start = start or primitives.DEFAULT_DATETIME_START
+    end = end or primitives.DEFAULT_DATETIME_END
+    delta_seconds = max(int((end - start).total_seconds()), 0)
+    offsets = _offsets(gen, count, delta_seconds, quantiles)
+    if start.tzinfo is not None:
+        return [start + dt.timedelta(seconds=offset) for offset in offsets.tolist()]
+    return (np.datetime64(start, "s") + offsets.astype("timedelta64[s]")).astype(object).tolist()
+
+
+def generate_enum_array(gen, count: int, values: List[str], weights: Optional[List[float]] = None) -> List[str]:
+    if not values:
+        return [""] * count
+    probs = None
+    if weights and len(weights) == len(values):
+        total = float(sum(weights))
+        probs = np.asarray(weights, dtype=float) / total
+    indexes = gen.choice(len(values), size=count, p=probs)
+    return np.asarray(values, dtype=object)[indexes].tolist()
+
+
+def _scaled_lognormal(gen, count: int, min_val: float, max_val: float):
+    if min_val <= 0:
+        min_val = 0.01
+    if max_val <= min_val:
+        max_val = min_val + 1.0
+    values = np.log1p(gen.lognormal(0.0, 1.0, count))
+    return min_val + (max_val - min_val) * (values / (1 + values))
+
+
+def _offsets(gen, count: int, delta: int, quantiles: Optional[List[float]]):
+    if quantiles:
+        return np.clip(np.rint(_sample_quantiles(gen, count, quantiles)).astype(np.int64), 0, delta)
+    return gen.integers(0, delta, size=count, endpoint=True)
+
+
+def _sample_quantiles(gen, count: int, quantiles: List[float]):
+    points = np.asarray(quantiles, dtype=float)
+    position = gen.random(count) * (len(points) - 1)
+    index = position.astype(np.int64)
+    low = points[index]
+    return low + (position - index) * (points[index + 1] - low)
+
+
+def _quantiles(column: ColumnSpec, start: Any = None) -> Optional[List[float]]:
+    if column.distribution != "empirical":
+        return None
+    return primitives.quantile_points(column.type, column.quantiles or [], start)
+
+
+def _range_pair(raw):
+    if not raw or len(raw) < 2:
+        return None, None
+    return float(raw[0]), float(raw[1])
@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from synthtest.gen.spill import SpilledKeys, spill_available
+from synthtest.schema.canonical import TableSpec
+from synthtest.util.logging import get_logger, log_event
+
+LOGGER = get_logger(__name__)
+
+COMPACT_AFTER = 1 << 18
+
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+_MASK64 = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15
+_MIN_SLOTS = 16
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+class KeySet:
+    """Exact set of key values that switches to compact storage when it grows.
+
+    Up to ``compact_after`` values it is a plain Python set. Past that, values
+    move to a typed buffer chosen from the first value: ints as
+    ``array('q')``, canonical UUID strings as two 64-bit words, other strings
+    as UTF-8 bytes with end offsets. Membership then goes through an
+    open-addressing table of buffer positions, so a key costs 20-40 bytes
+    instead of a Python object plus hash-table entries, at roughly 1-2 us
+    per lookup. Values that fit no buffer (floats, dates, mixed types) keep
+    the plain form.
+    """
+
+    def __init__(self, values: Iterable[Any] = (), compact_after: Optional[int] = None):
+        self._compact_after = COMPACT_AFTER if compact_after is None else compact_after
+        self._members: Optional[set] = set()
+        self._kind: Optional[str] = None
+        self._words = array("q")
+        self._text = bytearray()
+        self._ends = array("Q")
+        self._count = 0
+        self._slots = array("I")
+        self._shift = 0
+        for value in values:
+            self.add(value)
+
+    @property
+    def compact(self) -> bool:
+        return self._members is None
+
+    def add(self, value: Any) -> None:
+        if self._members is not None:
+            self._plain_add(value)
+        elif not self._find(value):
+            self._store(value)
+
+    def __len__(self) -> int:
+        return len(self._members) if self._members is not None else self._count
+
+    def __contains__(self, value: Any) -> bool:
+        if self._members is not None:
+            return value in self._members
+        return self._find(value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        if self._kind == "text":
+            # bytes hashes differ between processes; the index is rebuilt on load.
+            del state["_slots"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if "_slots" not in state:
+            self._rebuild()
+
+    def _plain_add(self, value: Any) -> None:
+        self._members.add(value)
+        if len(self._members) >= self._compact_after:
+            self._compact(list(self._members))
+
+    def _compact(self, values: List[Any]) -> None:
+        kind = _kind_of(values[0])
+        encode = _ENCODERS.get(kind)
+        codes = [encode(value) for value in values] if encode else [None]
+        if None in codes:
+            # Never retried: a table that produced such a value keeps the plain form.
+            self._compact_after = math.inf
+            return
+        self._kind = kind
+        self._words = array("q" if kind == "int" else "Q")
+        self._members = None
+        self._count = 0
+        for code in codes:
+            self._write(code)
+        self._rebuild()
+
+    def _plain_values(self) -> List[Any]:
+        return [self._decode(position) for position in range(self._count)]
+
+    def _to_plain(self) -> None:
+        """Leave compact storage when a value does not fit the buffer's kind."""
+        self._members = set(self._plain_values())
+        self._compact_after = math.inf
+        self._kind, self._words, self._text, self._ends = None, array("q"), bytearray(), array("Q")
+        self._count, self._slots = 0, array("I")
+
+    def _store(self, value: Any) -> None:
+        code = _ENCODERS[self._kind](value)
+        if code is None:
+            self._to_plain()
+            self._plain_add(value)
+            return
+        self._write(code)
+        if 2 * self._count > len(self._slots):
+            self._rebuild()
+        else:
+            self._index(self._count - 1, code)
+
+    def _write(self, code: Any) -> None:
+        if self._kind == "int":
+            self._words.append(code)
+        elif self._kind == "uuid":
+            self._words.append(code >> 64)
+            self._words.append(code & _MASK64)
+        else:
+            self._text += code
+            self._ends.append(len(self._text))
+        self._count += 1
+
+    def _find(self, value: Any) -> bool:
+        kind = self._kind
+        code = _ENCODERS[kind](value)
+        if code is None:
+            return False
+        slots, mask = self._slots, len(self._slots) - 1
+        index = (hash(code) * _MIX & _MASK64) >> self._shift
+        words = self._words
+        if kind == "int":
+            while True:
+                position = slots[index]
+                if not position:
+                    return False
+                if words[position - 1] == code:
+                    return True
+                index = (index + 1) & mask
+        if kind == "uuid":
+            high, low = code >> 64, code & _MASK64
+            while True:
+                position = slots[index]
+                if not position:
+                    return False
+                if words[2 * position - 1] == low and words[2 * position - 2] == high:
+                    return True
+                index = (index + 1) & mask
+        stored = self._stored
+        while True:
+            position = slots[index]
+            if not position:
+                return False
+            if stored(position - 1) == code:
+                return True
+            index = (index + 1) & mask
+
+    def _rebuild(self) -> None:
+        size = _MIN_SLOTS
+        while size < 4 * self._count:
+            size *= 2
+        self._slots = array("I", bytes(4 * size))
+        self._shift = 65 - size.bit_length()
+        for position in range(self._count):
+            self._index(position, self._stored(position))
+
+    def _index(self, position: int, code: Any) -> None:
+        # Duplicates kept by a pool get a slot each; lookups stop at the first.
+        slots, mask = self._slots, len(self._slots) - 1
+        index = (hash(code) * _MIX & _MASK64) >> self._shift
+        while slots[index]:
+            index = (index + 1) & mask
+        slots[index] = position + 1
+
+    def _stored(self, position: int) -> Any:
+        if self._kind == "int":
+            return self._words[position]
+        if self._kind == "uuid":
+            return (self._words[2 * position] << 64) | self._words[2 * position + 1]
+        start = self._ends[position - 1] if position else 0
+        return bytes(self._text[start : self._ends[position]])
+
+    def _decode(self, position: int) -> Any:
+        if self._kind == "uuid":
+            return _uuid_text(self._stored(position))
+        if self._kind == "text":
+            return self._stored(position).decode("utf-8")
+        return self._stored(position)
+
+
+class KeyPool(KeySet):
+    """Generated primary keys of one table.
+
+    Keeps every appended key in insertion order (duplicates included) for
+    index-based sampling (``rng.choice``) and answers membership checks;
+    large pools use the compact storage of ``KeySet``. With ``spill_after``
+    a pool of int or UUID keys moves to memory-mapped files under
+    ``spill_dir`` once it holds that many keys (see ``SpilledKeys``).
+    """
+
+    def __init__(
+        self,
+        values: Iterable[Any] = (),
+        compact_after: Optional[int] = None,
+        spill_after: Optional[int] = None,
+        spill_dir: Optional[Path] = None,
+    ):
+        self._values: Optional[List[Any]] = []
+        self._spill_after = spill_after if spill_dir is not None else None
+        self._spill_dir = spill_dir
+        self._spilled: Optional[SpilledKeys] = None
+        # Spilled pools keep values that fit no buffer (invalid-mode keys) here, by position.
+        self._extras: Dict[int, Any] = {}
+        self._extra_members: set = set()
+        super().__init__(compact_after=compact_after)
+        for value in values:
+            self.append(value)
+
+    @property
+    def spilled(self) -> bool:
+        return self._spilled is not None
+
+    def append(self, value: Any) -> None:
+        if self._spilled is not None:
+            code = _ENCODERS[self._kind](value)
+            if code is None:
+                self._extras[self._count] = value
+                self._extra_members.add(value)
+            self._spilled.append(code)
+            self._count += 1
+            return
+        if self._members is not None:
+            self._plain_add(value)
+        else:
+            self._store(value)
+        if self._spill_after is not None and len(self) >= self._spill_after:
+            self._spill()
+
+    def add(self, value: Any) -> None:
+        if value not in self:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._values) if self._values is not None else self._count
+
+    def __contains__(self, value: Any) -> bool:
+        if self._spilled is None:
+            return super().__contains__(value)
+        code = _ENCODERS[self._kind](value)
+        if code is None:
+            return value in self._extra_members
+        return self._spilled.contains(code)
+
+    def __getitem__(self, index: int) -> Any:
+        if self._values is not None:
+            return self._values[index]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("key pool index out of range")
+        if self._extras and index in self._extras:
+            return self._extras[index]
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._values is not None:
+            return iter(self._values)
+        return (self[position] for position in range(self._count))
+
+    def _spill(self) -> None:
+        if self._members is not None:
+            self._compact(self._values)
+            if self._members is None:
+                self._values = None
+        if self._kind not in ("int", "uuid") or not spill_available():
+            log_event(LOGGER, "key_pool_spill_skipped", keys=len(self), kind=self._kind or "mixed")
+            self._spill_after = None
+            return
+        self._spilled = SpilledKeys(self._spill_dir, wide=self._kind == "uuid", words=self._words)
+        self._words, self._slots = array(self._words.typecode), array("I")
+        log_event(LOGGER, "key_pool_spilled", keys=self._count, path=str(self._spill_dir))
+
+    def _stored(self, position: int) -> Any:
+        if self._spilled is not None:
+            return self._spilled.code(position)
+        return super()._stored(position)
+
+    def _plain_add(self, value: Any) -> None:
+        self._values.append(value)
+        self._members.add(value)
+        if len(self._values) >= self._compact_after:
+            self._compact(self._values)
+            if self._members is None:
+                self._values = None
+
+    def _to_plain(self) -> None:
+        self._values = self._plain_values()
+        super()._to_plain()
+
+
+def _encode_int(value: Any) -> Optional[int]:
+    if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+        return value
+    return None
+
+
+def _encode_uuid(value: Any) -> Optional[int]:
+    """128-bit int of a canonical (lowercase, hyphenated) UUID string, else None."""
+    if type(value) is str and _UUID_RE.fullmatch(value):
+        return int(value.replace("-", ""), 16)
+    return None
+
+
+def _encode_text(value: Any) -> Optional[bytes]:
+    return value.encode("utf-8") if type(value) is str else None
+
+
+_ENCODERS: Dict[str, Callable[[Any], Any]] = {"int": _encode_int, "uuid": _encode_uuid, "text": _encode_text}
+
+
+def _uuid_text(code: int) -> str:
+    digits = f"{code:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+def _kind_of(value: Any) -> Optional[str]:
+    if type(value) is int:
+        return "int"
+    if type(value) is str:
+        return "uuid" if _encode_uuid(value) is not None else "text"
+    return None
+
+
+class BloomKeySet:
+    """Probabilistic set for unique-value checks (``unique_check: bloom``).
+
+    A Bloom filter sized for ``capacity`` values at ``error_rate`` false
+    positives: about 1.8 bytes per value at the default rate, and no value
+    is stored. ``in`` never misses a value that was added. Having no values
+    to fall back on, callers treat every hit as a collision: a false positive
+    resamples a value that was in fact new (see ``unique_check`` in
+    docs/config-spec.md).
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        bits = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._bits = bytearray((bits + 7) // 8)
+        self._size = len(self._bits) * 8
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+
+    def add(self, value: Any) -> None:
+        for bit in self._positions(value):
+            self._bits[bit >> 3] |= 1 << (bit & 7)
+
+    def __contains__(self, value: Any) -> bool:
+        return all(self._bits[bit >> 3] & (1 << (bit & 7)) for bit in self._positions(value))
+
+    def _positions(self, value: Any) -> Iterator[int]:
+        # Stable across processes (unlike hash()), so false positives are reproducible.
+        digest = hashlib.blake2b(f"{type(value).__name__}:{value}".encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big") | 1
+        return ((first + i * second) % self._size for i in range(self._hashes))
+
+
+class ForeignKeyIndex:
+    """Foreign-key column -> parent key collection for one table, resolved once.
+
+    ``parents`` maps table names to anything supporting ``in`` (a ``KeyPool``
+    during generation, a plain set during validation).
+    """
+
+    def __init__(self, table: TableSpec, parents: Mapping[str, Any]):
+        self.ref_tables: Dict[str, str] = {fk.column: fk.ref_table for fk in table.foreign_keys}
+        self._parents: Dict[str, Any] = {
+            column: parents.get(ref_table) for column, ref_table in self.ref_tables.items()
+        }
+
+    def is_foreign_key(self, column: str) -> bool:
+        return column in self.ref_tables
+
+    def parent_keys(self, column: str) -> Optional[Any]:
+        return self._parents.get(column)
+
+    def contains(self, column: str, value: Any) -> bool:
+        keys = self._parents.get(column)
+        return keys is not None and value in keys
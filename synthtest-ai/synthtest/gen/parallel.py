@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pickle
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+from synthtest.gen.keys import KeyPool
+from synthtest.schema.canonical import SchemaSpec
+
+_LOADED_POOLS: Dict[str, KeyPool] = {}
+
+
+@dataclass
+class ChunkTask:
+    schema: SchemaSpec
+    table: str
+    seed: int
+    start: int
+    count: int
+    parent_pools: Dict[str, str]
+
+
+class PoolStore:
+    """Hands finalized primary-key pools to worker processes through files.
+
+    Each pool is written once when its table completes; workers load it on
+    first use and keep it cached for the rest of the run.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._paths: Dict[str, str] = {}
+
+    def publish(self, table: str, pool: KeyPool) -> None:
+        path = self.root / f"{table}.pool"
+        with path.open("wb") as handle:
+            pickle.dump(pool, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        self._paths[table] = str(path)
+
+    def paths(self, tables: Iterable[str]) -> Dict[str, str]:
+        return {table: self._paths[table] for table in tables if table in self._paths}
+
+
+def load_pool(path: str) -> KeyPool:
+    pool = _LOADED_POOLS.get(path)
+    if pool is None:
+        with open(path, "rb") as handle:
+            pool = pickle.load(handle)
+        _LOADED_POOLS[path] = pool
+    return pool
+
+
+def ordered_map(executor: Executor, fn: Callable[[Any], Any], items: Iterable[Any], window: int) -> Iterator[Any]:
+    """Like ``executor.map`` but keeps at most ``window`` tasks in flight."""
+    pending: deque = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Tuple
+from typing import Callable, Dict, Set, Tuple
 
 
 class RepairResult:
@@ -24,3 +24,22 @@ def repair_loop(
         if validate_row(row):
             return RepairResult(row=row, attempts=attempts, success=True)
     return RepairResult(row=last_row, attempts=attempts, success=False)
+
+
+def targeted_repair_loop(
+    row: Dict[str, object],
+    find_violations: Callable[[Dict[str, object]], Set[str]],
+    resample: Callable[[Dict[str, object], Set[str]], Dict[str, object]],
+    max_attempts: int,
+) -> RepairResult:
+    """Resample only the offending columns of ``row`` instead of the whole row.
+
+    The initial row counts as the first attempt and each resample as another.
+    """
+    attempts = 1
+    offending = find_violations(row)
+    while offending and attempts < max_attempts:
+        attempts += 1
+        row = resample(row, offending)
+        offending = find_violations(row)
+    return RepairResult(row=row, attempts=attempts, success=not offending)
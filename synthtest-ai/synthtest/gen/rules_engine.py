@@ -1,27 +1,127 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from synthtest.schema.canonical import RuleSpec
-from synthtest.util.safe_expr import SafeExprError, evaluate
+from synthtest.util.safe_expr import CompiledExpr, SafeExprError, compile_expr
 
 
 class RuleViolation(Exception):
     pass
 
 
+class CompiledRule:
+    def __init__(self, condition: Optional[CompiledExpr], constraints: List[Tuple[str, Optional[CompiledExpr]]]):
+        self.condition = condition
+        self.constraints = constraints
+
+
+class RuleSet:
+    """Rules compiled once per schema; expressions that fail to compile count as false."""
+
+    def __init__(self, rules: List[CompiledRule]):
+        self.rules = rules
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def for_context(self, names: Iterable[str]) -> "RuleSet":
+        """Keep only rules whose condition can resolve against a context with ``names``.
+
+        A condition referencing any other name always evaluates to false, so
+        dropping the rule up front does not change the result.
+        """
+        available = set(names)
+        return RuleSet(
+            [rule for rule in self.rules if rule.condition is not None and rule.condition.names <= available]
+        )
+
+    def evaluate(self, context: Dict[str, Dict[str, object]]) -> List[str]:
+        violations: List[str] = []
+        for rule in self.rules:
+            if _safe_eval(rule.condition, context):
+                for source, constraint in rule.constraints:
+                    if not _safe_eval(constraint, context):
+                        violations.append(source)
+        return violations
+
+    def violated_columns(self, context: Dict[str, Dict[str, object]], table: str) -> List[FrozenSet[str]]:
+        """Columns of ``table`` referenced by each violated constraint (empty if none)."""
+        violated: List[FrozenSet[str]] = []
+        for rule in self.rules:
+            if _safe_eval(rule.condition, context):
+                for _, constraint in rule.constraints:
+                    if not _safe_eval(constraint, context):
+                        attributes = constraint.attributes if constraint is not None else frozenset()
+                        violated.append(frozenset(attr for name, attr in attributes if name == table))
+        return violated
+
+    def evaluate_batch(self, context: Dict[str, Dict[str, List[Any]]], size: int) -> List[List[str]]:
+        """Evaluate every rule over column batches; returns the violations for each row."""
+        violations: List[List[str]] = [[] for _ in range(size)]
+        for rule in self.rules:
+            fired = _safe_eval_batch(rule.condition, context, size)
+            rows = [index for index, value in enumerate(fired) if value]
+            if not rows:
+                continue
+            for source, constraint in rule.constraints:
+                passed = _safe_eval_batch(constraint, context, size, rows)
+                for index in rows:
+                    if not passed[index]:
+                        violations[index].append(source)
+        return violations
+
+
+def compile_rules(rules: List[RuleSpec]) -> RuleSet:
+    return RuleSet(
+        [
+            CompiledRule(_try_compile(rule.if_expr), [(expr, _try_compile(expr)) for expr in rule.then])
+            for rule in rules
+        ]
+    )
+
+
 def evaluate_rules(rules: List[RuleSpec], context: Dict[str, Dict[str, object]]) -> List[str]:
-    violations: List[str] = []
-    for rule in rules:
-        if _safe_eval(rule.if_expr, context):
-            for constraint in rule.then:
-                if not _safe_eval(constraint, context):
-                    violations.append(constraint)
-    return violations
+    return compile_rules(rules).evaluate(context)
+
+
+def _try_compile(expr: str) -> Optional[CompiledExpr]:
+    try:
+        return compile_expr(expr)
+    except SafeExprError:
+        return None
 
 
-def _safe_eval(expr: str, context: Dict[str, Dict[str, object]]) -> bool:
+def _safe_eval(expr: Optional[CompiledExpr], context: Dict[str, Dict[str, object]]) -> bool:
+    if expr is None:
+        return False
     try:
-        return bool(evaluate(expr, context))
+        return bool(expr(context))
     except SafeExprError:
         return False
+
+
+def _safe_eval_batch(
+    expr: Optional[CompiledExpr],
+    context: Dict[str, Dict[str, List[Any]]],
+    size: int,
+    rows: Optional[List[int]] = None,
+) -> List[bool]:
+    if expr is None:
+        return [False] * size
+    try:
+        return [bool(value) for value in expr.evaluate_batch(context, size)]
+    except (SafeExprError, TypeError):
+        # Fall back to row-by-row evaluation so errors surface exactly as they
+        # would for a single row (and only for the rows that are evaluated).
+        results = [False] * size
+        for index in range(size) if rows is None else rows:
+            results[index] = _safe_eval(expr, _row_context(context, index))
+        return results
+
+
+def _row_context(context: Dict[str, Dict[str, List[Any]]], index: int) -> Dict[str, Any]:
+    return {
+        name: {col: values[index] for col, values in columns.items()} if isinstance(columns, dict) else columns
+        for name, columns in context.items()
+    }
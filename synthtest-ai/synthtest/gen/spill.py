@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import bisect
+import mmap
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+SPILL_BLOCK = 1 << 18
+MAX_RUN_KEYS = 1 << 26
+_MASK64 = (1 << 64) - 1
+
+
+def spill_available() -> bool:
+    return np is not None
+
+
+class SpilledKeys:
+    """Key codes of one pool kept in files under ``directory``, read through mmap.
+
+    ``records.bin`` holds the codes in insertion order (one 64-bit word per
+    int key, two per UUID), so ``code(i)`` is a constant-time read for index
+    sampling. Membership uses sorted runs: every ``SPILL_BLOCK`` appended
+    keys are sorted into a run file, and runs of similar size are merged
+    (up to ``MAX_RUN_KEYS``), so a lookup is a binary search in a handful of
+    memory-mapped arrays. Only the unflushed tail block is held in memory.
+    """
+
+    def __init__(self, directory: Path, wide: bool, words: array):
+        if np is None:
+            raise ValueError("Spilling key pools requires numpy (pip install 'synthtest-ai[fast]')")
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.wide = wide
+        self._width = 2 if wide else 1
+        self._typecode = "Q" if wide else "q"
+        self._records_path = directory / "records.bin"
+        self._records_path.write_bytes(b"")
+        self._disk_count = 0
+        self._runs: List[_Run] = []
+        self._next_run = 0
+        self._map: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._tail = array(self._typecode)
+        self._tail_codes: set = set()
+        self._tail += words
+        self._tail_codes.update(self._tail_code(index) for index in range(len(self._tail) // self._width))
+        self.flush()
+
+    def __len__(self) -> int:
+        return self._disk_count + len(self._tail) // self._width
+
+    def append(self, code: Optional[int]) -> None:
+        """Append ``code``; ``None`` reserves a position that no lookup matches."""
+        if code is None:
+            self._tail.extend([0] * self._width)
+        elif self.wide:
+            self._tail.append(code >> 64)
+            self._tail.append(code & _MASK64)
+            self._tail_codes.add(code)
+        else:
+            self._tail.append(code)
+            self._tail_codes.add(code)
+        if len(self._tail) >= SPILL_BLOCK * self._width:
+            self.flush()
+
+    def code(self, position: int) -> int:
+        if position >= self._disk_count:
+            words, position = self._tail, position - self._disk_count
+        else:
+            words = self._view
+        if self.wide:
+            return (words[2 * position] << 64) | words[2 * position + 1]
+        return words[position]
+
+    def contains(self, code: int) -> bool:
+        return code in self._tail_codes or any(run.contains(code) for run in self._runs)
+
+    def flush(self) -> None:
+        """Write the tail block to disk as records plus one sorted run."""
+        if not self._tail:
+            return
+        with self._records_path.open("ab") as handle:
+            self._tail.tofile(handle)
+        if self._tail_codes:
+            self._runs.append(self._write_run(self._tail_codes))
+            self._merge_runs()
+        self._disk_count += len(self._tail) // self._width
+        self._tail = array(self._typecode)
+        self._tail_codes = set()
+        self._remap()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers only read a published pool; flushing first puts every key on disk.
+        self.flush()
+        state = dict(self.__dict__)
+        del state["_map"], state["_view"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._map = self._view = None
+        self._remap()
+
+    def _tail_code(self, index: int) -> int:
+        if self.wide:
+            return (self._tail[2 * index] << 64) | self._tail[2 * index + 1]
+        return self._tail[index]
+
+    def _remap(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._map.close()
+        with self._records_path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map).cast(self._typecode)
+
+    def _write_run(self, codes: Iterable[int]) -> "_Run":
+        codes = list(codes)
+        if self.wide:
+            high = np.fromiter((code >> 64 for code in codes), dtype=np.uint64, count=len(codes))
+            low = np.fromiter((code & _MASK64 for code in codes), dtype=np.uint64, count=len(codes))
+            return self._save_run(high, low)
+        return self._save_run(np.sort(np.fromiter(codes, dtype=np.int64, count=len(codes))), None)
+
+    def _merge_runs(self) -> None:
+        runs = self._runs
+        while len(runs) >= 2 and runs[-1].size >= runs[-2].size and runs[-1].size + runs[-2].size <= MAX_RUN_KEYS:
+            newer, older = runs.pop(), runs.pop()
+            keys = np.concatenate([older.keys, newer.keys])
+            low = np.concatenate([older.low, newer.low]) if self.wide else None
+            if not self.wide:
+                keys.sort(kind="stable")
+            runs.append(self._save_run(keys, low))
+            older.remove()
+            newer.remove()
+
+    def _save_run(self, keys, low) -> "_Run":
+        if low is not None:
+            order = np.lexsort((low, keys))
+            keys, low = keys[order], low[order]
+        path = self.directory / f"run-{self._next_run}"
+        self._next_run += 1
+        keys.tofile(path.with_suffix(".keys"))
+        if low is not None:
+            low.tofile(path.with_suffix(".low"))
+        return _Run(path, len(keys), low is not None)
+
+
+class _Run:
+    """One sorted run: 64-bit keys (the high words for UUIDs) and, for UUIDs, the matching low words.
+
+    Lookups bisect a memoryview over the mapped file; numpy arrays are only
+    mapped when runs are merged.
+    """
+
+    def __init__(self, path: Path, size: int, wide: bool):
+        self.path = path
+        self.size = size
+        self.wide = wide
+        self._views: Optional[List[memoryview]] = None
+        self._maps: List[mmap.mmap] = []
+
+    @property
+    def keys(self):
+        dtype = np.uint64 if self.wide else np.int64
+        return np.fromfile(self.path.with_suffix(".keys"), dtype=dtype, count=self.size)
+
+    @property
+    def low(self):
+        return np.fromfile(self.path.with_suffix(".low"), dtype=np.uint64, count=self.size)
+
+    def contains(self, code: int) -> bool:
+        if self._views is None:
+            self._open()
+        if not self.wide:
+            keys = self._views[0]
+            index = bisect.bisect_left(keys, code)
+            return index < self.size and keys[index] == code
+        keys, low = self._views
+        high, code_low = code >> 64, code & _MASK64
+        index = bisect.bisect_left(keys, high)
+        while index < self.size and keys[index] == high:
+            if low[index] == code_low:
+                return True
+            index += 1
+        return False
+
+    def _open(self) -> None:
+        typecode = "Q" if self.wide else "q"
+        suffixes = (".keys", ".low") if self.wide else (".keys",)
+        self._views = []
+        for suffix in suffixes:
+            with self.path.with_suffix(suffix).open("rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            self._views.append(memoryview(mapped).cast(typecode))
+
+    def _close(self) -> None:
+        for view in self._views or ():
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._views, self._maps = None, []
+
+    def remove(self) -> None:
+        self._close()
+        self.path.with_suffix(".keys").unlink()
+        if self.wide:
+            self.path.with_suffix(".low").unlink()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"path": self.path, "size": self.size, "wide": self.wide, "_views": None, "_maps": []}
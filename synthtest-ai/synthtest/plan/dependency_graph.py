@@ -40,3 +40,13 @@ def topo_sort(schema: SchemaSpec) -> List[str]:
     if len(order) != len(graph):
         raise DependencyError("Cycle detected in foreign key dependencies")
     return order
+
+
+def build_parents(schema: SchemaSpec) -> Dict[str, Set[str]]:
+    parents: Dict[str, Set[str]] = {name: set() for name in schema.tables.keys()}
+    for child, table in schema.tables.items():
+        for fk in table.foreign_keys:
+            if fk.ref_table not in parents:
+                raise DependencyError(f"Unknown referenced table: {fk.ref_table}")
+            parents[child].add(fk.ref_table)
+    return parents
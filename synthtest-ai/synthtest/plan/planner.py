@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Set
 
-from synthtest.plan.dependency_graph import topo_sort
+from synthtest.plan.dependency_graph import build_parents, topo_sort
 from synthtest.schema.canonical import SchemaSpec
 
 
 def plan_tables(schema: SchemaSpec) -> List[str]:
     return topo_sort(schema)
+
+
+def plan_parents(schema: SchemaSpec) -> Dict[str, Set[str]]:
+    return build_parents(schema)
@@ -2,38 +2,44 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
+import math
+import random
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
-from synthtest.validate.pii_guard import detect_pii, is_email, is_phone
+from synthtest.validate.pii_guard import is_email, is_phone
 
+from .sketch import DistinctSketch, hash_value
 
-def infer_basic(input_path: str | Path, out_path: str | Path) -> None:
+ENUM_MAX_VALUES = 10
+UNIQUE_EXACT_LIMIT = 50_000
+# Three standard errors of a 4096-hash sketch.
+UNIQUE_TOLERANCE = 0.05
+RESERVOIR_SIZE = 1000
+QUANTILE_BINS = 32
+QUANTILE_MIN_VALUES = 100
+
+
+def infer_basic(input_path: str | Path, out_path: str | Path, sample_rows: Optional[int] = None) -> None:
     input_path = Path(input_path)
     out_path = Path(out_path)
 
-    with input_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        rows = list(reader)
-
-    if not rows:
+    profiles, row_count = profile_csv(input_path, sample_rows)
+    if not row_count:
         raise ValueError("No rows found in input CSV")
 
     table_name = input_path.stem
-    columns = {}
-    for col in reader.fieldnames or []:
-        values = [row.get(col) for row in rows]
-        col_spec = _infer_column(values)
-        columns[col] = col_spec
+    columns = {profile.name: profile.spec(row_count) for profile in profiles}
 
     config = {
         "dataset": {
             "name": table_name,
             "seed": 42,
             "mode": "valid",
-            "size": {table_name: len(rows)},
+            "size": {table_name: row_count},
             "max_attempts": 10,
         },
         "tables": {
@@ -48,49 +54,171 @@ def infer_basic(input_path: str | Path, out_path: str | Path) -> None:
     out_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
 
 
-def _infer_column(values: List[Any]) -> Dict[str, Any]:
-    cleaned = [v for v in values if v not in (None, "")]
-    nullable = len(cleaned) < len(values)
-
-    if not cleaned:
-        return {"type": "text", "nullable": True, "length": [1, 10]}
-
-    pii = detect_pii([str(v) for v in cleaned])
-
-    if pii:
-        if all(is_email(str(v)) for v in cleaned):
+def profile_csv(path: Path, sample_rows: Optional[int] = None) -> Tuple[List[ColumnProfile], int]:
+    """Profile the first ``sample_rows`` rows (all if None) of a CSV in one pass."""
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None) or []
+        profiles = [ColumnProfile(name) for name in header]
+        row_count = 0
+        for row in islice((row for row in reader if row), sample_rows):
+            row_count += 1
+            for profile, value in zip(profiles, row):
+                if value:
+                    profile.add(value)
+    return profiles, row_count
+
+
+class ColumnProfile:
+    """Streaming summary of the non-empty values of one column.
+
+    Every candidate type is checked per value until a value rules it out, and
+    min/max are tracked only for the candidates still standing, so a value is
+    parsed at most once per type. Enum counts stop after ``ENUM_MAX_VALUES``
+    distinct values. Distinct values are kept exactly up to
+    ``UNIQUE_EXACT_LIMIT`` and summarized by a ``DistinctSketch`` beyond that,
+    so uniqueness of very large columns is an estimate. ``sample`` is a
+    reservoir sample of ``RESERVOIR_SIZE`` values; numeric and date columns of
+    at least ``QUANTILE_MIN_VALUES`` values get an ``empirical`` distribution
+    from its quantiles.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.candidates: Dict[str, Optional[List[Any]]] = {kind: None for kind in _PARSERS}
+        self.min_len: Optional[int] = None
+        self.max_len: Optional[int] = None
+        self.counts: Optional[Dict[str, int]] = {}
+        self.distinct: Optional[set] = set()
+        self.sketch: Optional[DistinctSketch] = None
+        self.sample: List[str] = []
+        self._rng = random.Random(name)
+        self._weight = 1.0
+        self._next_sample = RESERVOIR_SIZE
+        self._skip_sample()
+
+    def add(self, value: str) -> None:
+        self.count += 1
+        candidates = self.candidates
+        for kind in list(candidates):
+            try:
+                parsed = _PARSERS[kind](value)
+                if parsed is None:
+                    continue
+                bounds = candidates[kind]
+                if bounds is None:
+                    candidates[kind] = [parsed, parsed]
+                elif parsed < bounds[0]:
+                    bounds[0] = parsed
+                elif parsed > bounds[1]:
+                    bounds[1] = parsed
+            except (ValueError, TypeError):
+                del candidates[kind]
+
+        length = len(value)
+        if self.min_len is None or length < self.min_len:
+            self.min_len = length
+        if self.max_len is None or length > self.max_len:
+            self.max_len = length
+
+        counts = self.counts
+        if counts is not None:
+            if value in counts:
+                counts[value] += 1
+            elif len(counts) < ENUM_MAX_VALUES:
+                counts[value] = 1
+            else:
+                self.counts = None
+
+        distinct = self.distinct
+        if distinct is not None:
+            distinct.add(value)
+            if len(distinct) > UNIQUE_EXACT_LIMIT:
+                self.sketch = DistinctSketch(hashes=map(hash_value, distinct))
+                self.distinct = None
+        else:
+            self.sketch.add_hash(hash_value(value))
+
+        if self.count <= RESERVOIR_SIZE:
+            self.sample.append(value)
+        elif self.count == self._next_sample:
+            self.sample[self._rng.randrange(RESERVOIR_SIZE)] = value
+            self._skip_sample()
+
+    def quantiles(self, kind: str, bins: int = QUANTILE_BINS) -> List[Any]:
+        """``bins + 1`` cut points of the reservoir sample, splitting it into equal-mass bins."""
+        sample = sorted(_PARSERS[kind](value) for value in self.sample)
+        last = len(sample) - 1
+        return [sample[round(i * last / bins)] for i in range(bins + 1)]
+
+    def _fitted(self, spec: Dict[str, Any], kind: str) -> Dict[str, Any]:
+        low, high = self.candidates[kind]
+        if self.count < QUANTILE_MIN_VALUES or low == high:
+            return spec
+        points = self.quantiles(kind)
+        if kind in {"date", "datetime"}:
+            points = [point.isoformat() for point in points]
+        return {**spec, "distribution": "empirical", "quantiles": points}
+
+    def signature(self) -> DistinctSketch:
+        """Sketch of all distinct values, for comparing columns across tables."""
+        if self.distinct is None:
+            return self.sketch
+        return DistinctSketch(hashes=map(hash_value, self.distinct))
+
+    def _skip_sample(self) -> None:
+        # Algorithm L: jump straight to the next value that enters the reservoir.
+        rng = self._rng
+        self._weight *= math.exp(math.log(rng.random()) / RESERVOIR_SIZE)
+        self._next_sample += int(math.log(rng.random()) / math.log(1 - self._weight)) + 1
+
+    @property
+    def distinct_count(self) -> float:
+        """Exact up to ``UNIQUE_EXACT_LIMIT`` distinct values, estimated beyond."""
+        if self.distinct is not None:
+            return float(len(self.distinct))
+        return self.sketch.estimate()
+
+    @property
+    def unique(self) -> bool:
+        if not self.count:
+            return False
+        if self.distinct is not None:
+            return len(self.distinct) == self.count
+        return self.distinct_count >= self.count * (1 - UNIQUE_TOLERANCE)
+
+    def spec(self, row_count: int) -> Dict[str, Any]:
+        """Column config for a table of ``row_count`` rows."""
+        nullable = self.count < row_count
+        if not self.count:
+            return {"type": "text", "nullable": True, "length": [1, 10]}
+
+        candidates = self.candidates
+        if "email" in candidates:
             return {"type": "email", "nullable": nullable, "pii": True}
-        if all(is_phone(str(v)) for v in cleaned):
+        if "phone" in candidates:
             return {"type": "phone", "nullable": nullable, "pii": True}
-
-    if _all_int(cleaned):
-        min_val, max_val = _min_max(cleaned, int)
-        return {"type": "int", "nullable": nullable, "range": [min_val, max_val]}
-    if _all_float(cleaned):
-        min_val, max_val = _min_max(cleaned, float)
-        return {"type": "decimal", "nullable": nullable, "range": [min_val, max_val]}
-    if _all_bool(cleaned):
-        return {"type": "bool", "nullable": nullable}
-    if _all_date(cleaned):
-        min_val, max_val = _min_max_date(cleaned)
-        return {"type": "date", "nullable": nullable, "range": [min_val, max_val]}
-    if _all_datetime(cleaned):
-        min_val, max_val = _min_max_datetime(cleaned)
-        return {"type": "datetime", "nullable": nullable, "range": [min_val, max_val]}
-
-    unique_vals = list({str(v) for v in cleaned})
-    if len(unique_vals) <= 10 and len(cleaned) > 0 and len(unique_vals) / len(cleaned) <= 0.2:
-        counts = {val: 0 for val in unique_vals}
-        for v in cleaned:
-            counts[str(v)] += 1
-        values_sorted = list(counts.keys())
-        weights = [counts[v] / len(cleaned) for v in values_sorted]
-        return {"type": "enum", "nullable": nullable, "values": values_sorted, "weights": weights}
-
-    min_len = min(len(str(v)) for v in cleaned) if cleaned else 1
-    max_len = max(len(str(v)) for v in cleaned) if cleaned else 10
-    unique = len(unique_vals) == len(cleaned) and len(cleaned) > 0
-    return {"type": "text", "nullable": nullable, "length": [min_len, max_len], "unique": unique}
+        if "int" in candidates:
+            return self._fitted({"type": "int", "nullable": nullable, "range": candidates["int"]}, "int")
+        if "float" in candidates:
+            return self._fitted({"type": "decimal", "nullable": nullable, "range": candidates["float"]}, "float")
+        if "bool" in candidates:
+            return {"type": "bool", "nullable": nullable}
+        if "date" in candidates:
+            spec = {"type": "date", "nullable": nullable, "range": [d.isoformat() for d in candidates["date"]]}
+            return self._fitted(spec, "date")
+        if "datetime" in candidates:
+            spec = {"type": "datetime", "nullable": nullable, "range": [d.isoformat() for d in candidates["datetime"]]}
+            return self._fitted(spec, "datetime")
+
+        counts = self.counts
+        if counts is not None and len(counts) / self.count <= 0.2:
+            values_sorted = list(counts.keys())
+            weights = [counts[v] / self.count for v in values_sorted]
+            return {"type": "enum", "nullable": nullable, "values": values_sorted, "weights": weights}
+
+        return {"type": "text", "nullable": nullable, "length": [self.min_len, self.max_len], "unique": self.unique}
 
 
 def _pick_primary_key(columns: Dict[str, Dict[str, Any]]) -> str:
@@ -100,56 +228,39 @@ def _pick_primary_key(columns: Dict[str, Dict[str, Any]]) -> str:
     return next(iter(columns.keys()))
 
 
-def _all_int(values: List[Any]) -> bool:
-    try:
-        return all(str(v).lstrip("-").isdigit() for v in values)
-    except Exception:
-        return False
-
-
-def _all_float(values: List[Any]) -> bool:
-    try:
-        for v in values:
-            float(v)
-        return True
-    except Exception:
-        return False
-
-
-def _all_bool(values: List[Any]) -> bool:
-    return all(str(v).lower() in {"true", "false", "1", "0"} for v in values)
-
+def _parse_int(value: str) -> int:
+    if not value.lstrip("-").isdigit():
+        raise ValueError(value)
+    return int(value)
 
-def _all_date(values: List[Any]) -> bool:
-    try:
-        for v in values:
-            dt.date.fromisoformat(str(v))
-        return True
-    except Exception:
-        return False
 
+def _parse_bool(value: str) -> None:
+    if value.lower() not in {"true", "false", "1", "0"}:
+        raise ValueError(value)
+    return None
 
-def _all_datetime(values: List[Any]) -> bool:
-    try:
-        for v in values:
-            dt.datetime.fromisoformat(str(v).replace("Z", "+00:00"))
-        return True
-    except Exception:
-        return False
 
+def _parse_datetime(value: str) -> dt.datetime:
+    return dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
 
-def _min_max(values: List[Any], cast):
-    casted = [cast(v) for v in values]
-    return min(casted), max(casted)
 
+def _check(predicate: Callable[[str], bool]) -> Callable[[str], None]:
+    def parse(value: str) -> None:
+        if not predicate(value):
+            raise ValueError(value)
+        return None
 
-def _min_max_date(values: List[Any]):
-    casted = [dt.date.fromisoformat(str(v)) for v in values]
-    casted.sort()
-    return casted[0].isoformat(), casted[-1].isoformat()
+    return parse
 
 
-def _min_max_datetime(values: List[Any]):
-    casted = [dt.datetime.fromisoformat(str(v).replace("Z", "+00:00")) for v in values]
-    casted.sort()
-    return casted[0].isoformat(), casted[-1].isoformat()
+# Candidate types in the order they win; parsers raise ValueError on a mismatch
+# and return the value to track min/max of, or None.
+_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "email": _check(is_email),
+    "phone": _check(is_phone),
+    "int": _parse_int,
+    "float": float,
+    "bool": _parse_bool,
+    "date": dt.date.fromisoformat,
+    "datetime": _parse_datetime,
+}
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import yaml
+
+from synthtest.export.arrow_exporter import read_arrow_batches
+from synthtest.export.json_exporter import _serialize_value
+from synthtest.util.logging import get_logger, log_event
+
+from .infer_basic import ColumnProfile, _pick_primary_key, profile_csv
+from .sketch import DistinctSketch, containment
+
+LOGGER = get_logger(__name__)
+
+INPUT_SUFFIXES = {".csv": "csv", ".parquet": "parquet"}
+FK_MIN_CONTAINMENT = 0.95
+_TEXT_TYPES = {"text", "uuid", "email", "phone", "name"}
+
+
+@dataclass
+class TableProfile:
+    """What the parent process needs from one profiled file; sketches replace distinct sets.
+
+    ``unique`` is ``ColumnProfile.unique``: exact up to ``UNIQUE_EXACT_LIMIT``
+    distinct values, within ``UNIQUE_TOLERANCE`` beyond.
+    """
+
+    name: str
+    row_count: int
+    columns: Dict[str, Dict[str, Any]]
+    sketches: Dict[str, DistinctSketch]
+    unique: Dict[str, bool]
+
+
+def infer_dataset(
+    input_dir: str | Path,
+    out_path: str | Path,
+    workers: int = 1,
+    sample_rows: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Infer a multi-table config from every CSV / Parquet file in ``input_dir``.
+
+    Files are profiled in ``workers`` processes. Each table's primary key is a
+    unique, non-null column; a column becomes a foreign key to another table's
+    primary key when at least ``FK_MIN_CONTAINMENT`` of its distinct values
+    occur there, judged from bottom-k sketches of both columns. Numeric keys
+    also need a matching name (``customer_id`` -> ``customers.id``) since small
+    integer ranges are contained in each other by chance.
+    """
+    input_dir = Path(input_dir)
+    files = sorted(path for path in input_dir.iterdir() if path.suffix in INPUT_SUFFIXES)
+    if not files:
+        raise ValueError(f"No CSV or Parquet files found in {input_dir}")
+
+    tasks = [(path, sample_rows) for path in files]
+    if workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as executor:
+            profiles = list(executor.map(_profile_file, tasks))
+    else:
+        profiles = [_profile_file(task) for task in tasks]
+
+    tables: Dict[str, Dict[str, Any]] = {}
+    for profile in profiles:
+        if not profile.row_count:
+            raise ValueError(f"No rows found in {profile.name}")
+        primary_key = _choose_primary_key(profile)
+        key_spec = profile.columns[primary_key]
+        if key_spec["type"] == "int":
+            # Drawing n distinct keys from exactly n values would exhaust the repair loop.
+            low, high = key_spec["range"]
+            key_spec["range"] = [low, max(high, low + 10 * profile.row_count)]
+            key_spec.pop("distribution", None)
+            key_spec.pop("quantiles", None)
+        tables[profile.name] = {"primary_key": primary_key, "columns": profile.columns}
+    _discover_foreign_keys(profiles, tables)
+
+    config = {
+        "dataset": {
+            "name": input_dir.resolve().name,
+            "seed": 42,
+            "mode": "valid",
+            "size": {profile.name: profile.row_count for profile in profiles},
+            "max_attempts": 10,
+        },
+        "tables": tables,
+        "rules": [],
+    }
+    Path(out_path).write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    return config
+
+
+def _profile_file(task: Tuple[Path, Optional[int]]) -> TableProfile:
+    path, sample_rows = task
+    if INPUT_SUFFIXES[path.suffix] == "csv":
+        columns, row_count = profile_csv(path, sample_rows)
+    else:
+        columns, row_count = _profile_parquet(path, sample_rows)
+    log_event(LOGGER, "table_profiled", table=path.stem, rows=row_count)
+    return TableProfile(
+        name=path.stem,
+        row_count=row_count,
+        columns={column.name: column.spec(row_count) for column in columns},
+        sketches={column.name: column.signature() for column in columns},
+        unique={column.name: column.unique for column in columns},
+    )
+
+
+def _profile_parquet(path: Path, sample_rows: Optional[int]) -> Tuple[List[ColumnProfile], int]:
+    """Profile a Parquet file through the same text view as a CSV export of it."""
+    profiles: Dict[str, ColumnProfile] = {}
+    row_count = 0
+    for row in islice(_parquet_rows(path), sample_rows):
+        if not profiles:
+            profiles = {name: ColumnProfile(name) for name in row}
+        row_count += 1
+        for name, value in row.items():
+            if value is not None:
+                text = str(_serialize_value(value))
+                if text:
+                    profiles[name].add(text)
+    return list(profiles.values()), row_count
+
+
+def _parquet_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    for batch in read_arrow_batches(path, "parquet"):
+        names = list(batch)
+        for values in zip(*batch.values()):
+            yield dict(zip(names, values))
+
+
+def _choose_primary_key(profile: TableProfile) -> str:
+    candidates = [
+        name for name, spec in profile.columns.items() if spec.get("unique") or _is_unique_number(profile, name)
+    ]
+    candidates = [name for name in candidates if not profile.columns[name].get("nullable")]
+    for name in candidates:
+        if name == "id" or _names_match(name, profile.name):
+            return name
+    if candidates:
+        return candidates[0]
+    return _pick_primary_key(profile.columns)
+
+
+def _is_unique_number(profile: TableProfile, name: str) -> bool:
+    # Numeric columns carry a range instead of a unique flag.
+    return profile.columns[name]["type"] == "int" and profile.unique[name]
+
+
+def _discover_foreign_keys(profiles: List[TableProfile], tables: Dict[str, Dict[str, Any]]) -> None:
+    by_name = {profile.name: profile for profile in profiles}
+    edges: Dict[str, Set[str]] = {name: set() for name in tables}
+    for child in profiles:
+        child_pk = tables[child.name]["primary_key"]
+        foreign_keys = []
+        for column, spec in child.columns.items():
+            if column == child_pk:
+                continue
+            best: Optional[Tuple[Tuple[int, float], str]] = None
+            for parent in profiles:
+                if parent.name == child.name:
+                    continue
+                parent_pk = tables[parent.name]["primary_key"]
+                parent_spec = parent.columns[parent_pk]
+                if not _types_compatible(spec, parent_spec):
+                    continue
+                child_sketch, parent_sketch = child.sketches[column], parent.sketches[parent_pk]
+                if child_sketch.estimate() > parent_sketch.estimate() * 1.1:
+                    continue
+                name_match = _names_match(column, parent.name, parent_pk)
+                if spec["type"] not in _TEXT_TYPES and not name_match:
+                    continue
+                share = containment(child_sketch, parent_sketch)
+                if share is None or share < FK_MIN_CONTAINMENT:
+                    continue
+                score = (int(name_match), share)
+                if best is None or score > best[0]:
+                    best = (score, parent.name)
+            if best is None:
+                continue
+            parent_name = best[1]
+            if _reaches(edges, parent_name, child.name):
+                log_event(LOGGER, "foreign_key_cycle_skipped", table=child.name, column=column, ref_table=parent_name)
+                continue
+            edges[child.name].add(parent_name)
+            parent_pk = tables[parent_name]["primary_key"]
+            foreign_keys.append({"column": column, "ref_table": parent_name, "ref_column": parent_pk})
+            # Values come from the parent's key pool, so the column takes the key's spec.
+            key_spec = {k: v for k, v in by_name[parent_name].columns[parent_pk].items() if k != "unique"}
+            tables[child.name]["columns"][column] = {**key_spec, "nullable": spec.get("nullable", False)}
+            log_event(LOGGER, "foreign_key_found", table=child.name, column=column, ref_table=parent_name)
+        if foreign_keys:
+            tables[child.name]["foreign_keys"] = foreign_keys
+
+
+def _types_compatible(child: Dict[str, Any], parent: Dict[str, Any]) -> bool:
+    if child["type"] in _TEXT_TYPES or child["type"] == "enum":
+        if parent["type"] not in _TEXT_TYPES:
+            return False
+        if "length" in child and "length" in parent:
+            return parent["length"][0] <= child["length"][0] and child["length"][1] <= parent["length"][1]
+        return True
+    return child["type"] == parent["type"] == "int"
+
+
+def _names_match(column: str, table: str, key: str = "id") -> bool:
+    """``customer_id`` / ``customers_id`` / ``customer`` refer to table ``customers`` with key ``id``."""
+    column = column.lower()
+    singular = table.lower()[:-1] if table.lower().endswith("s") else table.lower()
+    stems = {table.lower(), singular}
+    if column == key.lower() and key.lower() != "id":
+        return True
+    return any(column in {stem, f"{stem}_id", f"{stem}_{key.lower()}"} for stem in stems)
+
+
+def _reaches(edges: Dict[str, Set[str]], start: str, target: str) -> bool:
+    stack, seen = [start], set()
+    while stack:
+        node = stack.pop()
+        if node == target:
+            return True
+        if node not in seen:
+            seen.add(node)
+            stack.extend(edges[node])
+    return False
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import heapq
+from typing import Iterable, List, Optional, Set
+
+DEFAULT_SKETCH_SIZE = 4096
+_HASH_SPACE = float(1 << 64)
+
+
+def hash_value(value: str) -> int:
+    """Stable 64-bit hash of ``value`` (unlike ``hash()``, equal across processes)."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class DistinctSketch:
+    """Bottom-k (KMV) sketch: the ``k`` smallest distinct value hashes seen.
+
+    Estimates the number of distinct values within about ``1/sqrt(k)``
+    relative error in constant memory, and is exact below ``k`` values.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_SIZE, hashes: Iterable[int] = ()):
+        self.k = k
+        self._heap: List[int] = []
+        self._members: Set[int] = set()
+        self._sorted: Optional[List[int]] = None
+        for value_hash in hashes:
+            self.add_hash(value_hash)
+
+    def add_hash(self, value_hash: int) -> None:
+        self._sorted = None
+        if len(self._heap) < self.k:
+            if value_hash not in self._members:
+                heapq.heappush(self._heap, -value_hash)
+                self._members.add(value_hash)
+        elif value_hash < -self._heap[0] and value_hash not in self._members:
+            evicted = -heapq.heapreplace(self._heap, -value_hash)
+            self._members.discard(evicted)
+            self._members.add(value_hash)
+
+    def hashes(self) -> List[int]:
+        if self._sorted is None:
+            self._sorted = sorted(self._members)
+        return self._sorted
+
+    def estimate(self) -> float:
+        if len(self._heap) < self.k:
+            return float(len(self._heap))
+        return (self.k - 1) * _HASH_SPACE / (-self._heap[0] + 1)
+
+    def contains(self, value_hash: int) -> bool:
+        return value_hash in self._members
+
+    def threshold(self) -> float:
+        """Largest hash kept once full; every smaller hash of the set is in the sketch."""
+        if len(self._heap) < self.k:
+            return float("inf")
+        return float(-self._heap[0])
+
+
+def containment(child: DistinctSketch, parent: DistinctSketch, min_overlap: int = 32) -> Optional[float]:
+    """Estimated share of ``child``'s distinct values that also occur in ``parent``.
+
+    Only child hashes below the parent's threshold can be checked; if ``child``
+    is a subset this is exactly 1.0. None when fewer than ``min_overlap``
+    (or all, for small sets) child hashes can be compared.
+    """
+    hashes = child.hashes()
+    comparable = hashes[: bisect.bisect_right(hashes, parent.threshold())]
+    if not comparable or len(comparable) < min(min_overlap, len(hashes)):
+        return None
+    return sum(map(parent.contains, comparable)) / len(comparable)
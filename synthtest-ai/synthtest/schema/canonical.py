@@ -21,7 +21,17 @@ ColumnType = Literal[
     "name",
 ]
 
-DistributionType = Literal["uniform", "normal", "lognormal", "categorical"]
+DistributionType = Literal["uniform", "normal", "lognormal", "categorical", "empirical"]
+
+EngineType = Literal["row", "columnar"]
+
+BackendType = Literal["python", "numpy"]
+
+RepairStrategy = Literal["row", "targeted"]
+
+UniqueCheck = Literal["exact", "bloom"]
+
+RngMode = Literal["sequential", "counter"]
 
 
 class ColumnSpec(BaseModel):
@@ -34,6 +44,7 @@ class ColumnSpec(BaseModel):
     values: Optional[List[str]] = None
     weights: Optional[List[float]] = None
     distribution: Optional[DistributionType] = None
+    quantiles: Optional[List[str | int | float]] = None
     length: Optional[List[int]] = None
     pii: bool = False
 
@@ -62,6 +73,13 @@ class DatasetSpec(BaseModel):
     mode: Literal["valid", "invalid"] = "valid"
     size: Dict[str, int] = Field(default_factory=dict)
     max_attempts: int = 10
+    engine: EngineType = "row"
+    batch_size: int = Field(default=65536, gt=0)
+    backend: BackendType = "python"
+    repair: RepairStrategy = "row"
+    unique_check: UniqueCheck = "exact"
+    spill_after: Optional[int] = Field(default=None, gt=0)
+    rng: RngMode = "sequential"
 
 
 class SchemaSpec(BaseModel):
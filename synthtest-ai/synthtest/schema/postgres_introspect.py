@@ -1,9 +1,368 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
+from synthtest.util.hashing import hash_config
+from synthtest.util.logging import get_logger, log_event
 
-def introspect_postgres(_dsn: str) -> Any:
-    raise NotImplementedError(
-        "PostgreSQL introspection requires optional dependencies and is not implemented in this MVP."
-    )
+from .canonical import SchemaSpec
+from .dsl import parse_schema
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - exercised only without psycopg installed
+    psycopg = None
+
+LOGGER = get_logger(__name__)
+
+SNAPSHOT_VERSION = 2
+DEFAULT_ROWS = 100
+SURROGATE_KEY = "synthtest_row_id"
+
+# Changes whenever a table, column, constraint or enum label of the schema is
+# created, altered or dropped: every catalog row gets a new xmin on update.
+_FINGERPRINT_SQL = """
+SELECT md5(coalesce(string_agg(part, ',' ORDER BY part), '')) AS fingerprint FROM (
+    SELECT 'c' || c.oid || ':' || c.xmin::text AS part
+    FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %(schema)s AND c.relkind IN ('r', 'p')
+    UNION ALL
+    SELECT 'a' || a.attrelid || ':' || a.attnum || ':' || a.xmin::text
+    FROM pg_attribute a
+    JOIN pg_class c ON c.oid = a.attrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %(schema)s AND c.relkind IN ('r', 'p') AND a.attnum > 0
+    UNION ALL
+    SELECT 'k' || con.oid || ':' || con.xmin::text
+    FROM pg_constraint con JOIN pg_namespace n ON n.oid = con.connamespace
+    WHERE n.nspname = %(schema)s
+    UNION ALL
+    SELECT 'e' || e.oid || ':' || e.xmin::text
+    FROM pg_enum e
+    JOIN pg_type t ON t.oid = e.enumtypid
+    JOIN pg_namespace n ON n.oid = t.typnamespace
+    WHERE n.nspname = %(schema)s
+) parts
+"""
+
+_COLUMNS_SQL = """
+SELECT c.table_name, c.column_name, c.data_type, c.udt_name, c.is_nullable,
+       c.character_maximum_length, c.numeric_precision, c.numeric_scale
+FROM information_schema.columns c
+JOIN information_schema.tables t ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+WHERE c.table_schema = %(schema)s AND t.table_type = 'BASE TABLE'
+ORDER BY c.table_name, c.ordinal_position
+"""
+
+_CONSTRAINTS_SQL = """
+SELECT con.contype AS kind, cl.relname AS table_name, ref.relname AS ref_table,
+       ARRAY(SELECT a.attname FROM unnest(con.conkey) WITH ORDINALITY k(attnum, ord)
+             JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+             ORDER BY k.ord)::text[] AS columns,
+       ARRAY(SELECT a.attname FROM unnest(con.confkey) WITH ORDINALITY k(attnum, ord)
+             JOIN pg_attribute a ON a.attrelid = con.confrelid AND a.attnum = k.attnum
+             ORDER BY k.ord)::text[] AS ref_columns,
+       pg_get_constraintdef(con.oid) AS definition
+FROM pg_constraint con
+JOIN pg_class cl ON cl.oid = con.conrelid
+JOIN pg_namespace n ON n.oid = cl.relnamespace
+LEFT JOIN pg_class ref ON ref.oid = con.confrelid
+WHERE n.nspname = %(schema)s AND con.contype IN ('p', 'u', 'f', 'c')
+ORDER BY cl.relname, con.conname
+"""
+
+_ENUMS_SQL = """
+SELECT t.typname AS type_name, e.enumlabel AS label
+FROM pg_enum e
+JOIN pg_type t ON t.oid = e.enumtypid
+JOIN pg_namespace n ON n.oid = t.typnamespace
+WHERE n.nspname = %(schema)s
+ORDER BY t.typname, e.enumsortorder
+"""
+
+_INT_BOUNDS = {"int2": 2**15 - 1, "int4": 2**31 - 1, "int8": 2**63 - 1}
+_TYPE_MAP = {
+    "int2": "int",
+    "int4": "int",
+    "int8": "int",
+    "numeric": "decimal",
+    "float4": "decimal",
+    "float8": "decimal",
+    "bool": "bool",
+    "date": "date",
+    "timestamp": "datetime",
+    "timestamptz": "datetime",
+    "uuid": "uuid",
+}
+
+_CAST_RE = re.compile(r"::(?:character varying|double precision|timestamp with(?:out)? time zone|\w+)(?:\[\])?")
+_LITERAL = r"(-?\d+(?:\.\d+)?|'(?:[^']|'')*')"
+
+
+def introspect_postgres(
+    dsn: str,
+    schema: str = "public",
+    rows: int = DEFAULT_ROWS,
+    cache_dir: Optional[str | Path] = None,
+    refresh: bool = False,
+) -> SchemaSpec:
+    """Build a ``SchemaSpec`` for every table of ``schema`` in the database at ``dsn``."""
+    return parse_schema(introspect_postgres_config(dsn, schema, rows, cache_dir, refresh))
+
+
+def introspect_postgres_config(
+    dsn: str,
+    schema: str = "public",
+    rows: int = DEFAULT_ROWS,
+    cache_dir: Optional[str | Path] = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """Same as ``introspect_postgres`` but returns the raw config (as written to YAML).
+
+    The catalog is read in four bulk queries. The result is cached in
+    ``cache_dir`` (default ``$XDG_CACHE_HOME/synthtest/postgres``) and reused
+    while the catalog fingerprint of ``schema`` is unchanged, so a repeated run
+    costs one query. ``refresh`` ignores the cache.
+    """
+    return catalog_to_config(load_catalog(dsn, schema, cache_dir, refresh), rows)
+
+
+def load_catalog(
+    dsn: str,
+    schema: str = "public",
+    cache_dir: Optional[str | Path] = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    cache_path = _cache_dir(cache_dir) / f"{hash_config({'dsn': dsn, 'schema': schema})[:32]}.json"
+    with _connect(dsn) as connection:
+        fingerprint = _query(connection, _FINGERPRINT_SQL, {"schema": schema})[0]["fingerprint"]
+        if not refresh:
+            cached = _read_snapshot(cache_path, fingerprint)
+            if cached is not None:
+                log_event(LOGGER, "catalog_cache_hit", schema=schema, path=str(cache_path))
+                return cached
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "schema": schema,
+            "fingerprint": fingerprint,
+            "columns": _query(connection, _COLUMNS_SQL, {"schema": schema}),
+            "constraints": _query(connection, _CONSTRAINTS_SQL, {"schema": schema}),
+            "enums": _query(connection, _ENUMS_SQL, {"schema": schema}),
+        }
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+    tmp_path.replace(cache_path)
+    log_event(LOGGER, "catalog_cached", schema=schema, path=str(cache_path), tables=_table_count(snapshot))
+    return snapshot
+
+
+def catalog_to_config(snapshot: Dict[str, Any], rows: int = DEFAULT_ROWS) -> Dict[str, Any]:
+    """Map a catalog snapshot to a schema config.
+
+    Single-column primary keys, unique constraints and foreign keys map
+    directly. Check constraints on one column map to ``range`` (comparisons,
+    ``BETWEEN``) and enum ``values`` (``IN`` lists); anything else and
+    self-references are skipped and logged. Tables without a single-column
+    primary key get one from ``_surrogate_key``.
+    """
+    enums: Dict[str, List[str]] = {}
+    for row in snapshot["enums"]:
+        enums.setdefault(row["type_name"], []).append(row["label"])
+
+    tables: Dict[str, Dict[str, Any]] = {}
+    for row in snapshot["columns"]:
+        table = tables.setdefault(row["table_name"], {"primary_key": None, "foreign_keys": [], "columns": {}})
+        table["columns"][row["column_name"]] = _map_column(row, enums)
+
+    primary_keys: Dict[str, str] = {}
+    composite_keys: Dict[str, List[str]] = {}
+    for con in snapshot["constraints"]:
+        table = tables.get(con["table_name"])
+        if table is None:
+            continue
+        columns = con["columns"]
+        if con["kind"] == "p":
+            if len(columns) > 1:
+                log_event(LOGGER, "composite_key_skipped", table=con["table_name"], columns=columns)
+                composite_keys[con["table_name"]] = columns
+                continue
+            primary_keys[con["table_name"]] = columns[0]
+        elif con["kind"] == "u" and len(columns) == 1:
+            table["columns"][columns[0]]["unique"] = True
+        elif con["kind"] == "f" and len(columns) == 1:
+            if con["ref_table"] == con["table_name"] or con["ref_table"] not in tables:
+                log_event(LOGGER, "foreign_key_skipped", table=con["table_name"], column=columns[0])
+                continue
+            table["foreign_keys"].append(
+                {"column": columns[0], "ref_table": con["ref_table"], "ref_column": con["ref_columns"][0]}
+            )
+        elif con["kind"] == "c" and len(columns) == 1:
+            if not _apply_check(table["columns"][columns[0]], columns[0], con["definition"]):
+                log_event(LOGGER, "check_skipped", table=con["table_name"], definition=con["definition"])
+        else:
+            log_event(LOGGER, "constraint_skipped", table=con["table_name"], definition=con["definition"])
+
+    for name, table in tables.items():
+        pk = primary_keys.get(name) or _surrogate_key(name, table, composite_keys.get(name, []))
+        table["primary_key"] = pk
+        table["columns"][pk].update({"nullable": False, "unique": True})
+        for column in table["columns"].values():
+            max_value = column.pop("max_value", None)
+            # The default 0..1000 range cannot hold many distinct keys.
+            if max_value is not None and column.get("unique") and not column.get("range"):
+                column["range"] = [1, max_value]
+        if not table["foreign_keys"]:
+            del table["foreign_keys"]
+
+    return {
+        "dataset": {
+            "name": snapshot["schema"],
+            "seed": 42,
+            "mode": "valid",
+            "size": {name: rows for name in tables},
+            "max_attempts": 10,
+        },
+        "tables": tables,
+        "rules": [],
+    }
+
+
+def _map_column(row: Dict[str, Any], enums: Dict[str, List[str]]) -> Dict[str, Any]:
+    udt = row["udt_name"]
+    nullable = row["is_nullable"] == "YES"
+    if udt in enums:
+        return {"type": "enum", "nullable": nullable, "values": list(enums[udt])}
+    column_type = _TYPE_MAP.get(udt, "text")
+    spec: Dict[str, Any] = {"type": column_type, "nullable": nullable}
+    if column_type == "int":
+        spec["max_value"] = _INT_BOUNDS[udt]
+    elif column_type == "decimal" and row["numeric_precision"] and udt == "numeric":
+        scale = row["numeric_scale"] or 0
+        spec["range"] = [0, min(1000, 10 ** (row["numeric_precision"] - scale) - 10**-scale)]
+    elif column_type == "text":
+        name = row["column_name"].lower()
+        if "email" in name:
+            return {"type": "email", "nullable": nullable, "pii": True}
+        if "phone" in name:
+            return {"type": "phone", "nullable": nullable, "pii": True}
+        max_len = row["character_maximum_length"]
+        if max_len:
+            spec["length"] = [max_len, max_len] if udt == "bpchar" else [min(5, max_len), min(20, max_len)]
+    return spec
+
+
+def _apply_check(column: Dict[str, Any], name: str, definition: str) -> bool:
+    """Fold a single-column CHECK into ``column``; False if it is not fully understood."""
+    expr = _CAST_RE.sub("", definition)
+    col = rf"(?<![\w(])\(*\"?{re.escape(name)}\"?\)*"
+    labels = None
+    values = re.search(rf"{col} = ANY \(+ARRAY\[((?:'(?:[^']|'')*',? ?)+)\]\)*", expr)
+    if values and column["type"] in {"text", "enum"}:
+        labels = [label.replace("''", "'") for label in re.findall(r"'((?:[^']|'')*)'", values.group(1))]
+        expr = expr.replace(values.group(0), "")
+    lower, upper = column.get("range") or [None, None]
+    for match in list(re.finditer(rf"{col} (>=|<=|>|<) \(*{_LITERAL}\)*", expr)):
+        op, literal = match.group(1), match.group(2)
+        value = _literal(literal, column["type"])
+        if value is None:
+            return False
+        if column["type"] == "int" and op in {">", "<"}:
+            value = value + 1 if op == ">" else value - 1
+        if op in {">=", ">"}:
+            lower = value
+        else:
+            upper = value
+        expr = expr.replace(match.group(0), "", 1)
+    if re.sub(r"CHECK|AND|[()\s]", "", expr):
+        return False
+    if labels is not None:
+        column.update({"type": "enum", "values": labels})
+        column.pop("length", None)
+    if lower is not None or upper is not None:
+        column["range"] = _complete_range(column["type"], lower, upper)
+    return True
+
+
+def _literal(literal: str, column_type: str) -> Optional[Any]:
+    text = literal.strip("'")
+    if column_type == "int":
+        return int(float(text))
+    if column_type == "decimal":
+        return float(text)
+    if column_type in {"date", "datetime"}:
+        return text
+    return None
+
+
+def _complete_range(column_type: str, lower: Any, upper: Any) -> List[Any]:
+    if column_type in {"date", "datetime"}:
+        lower = lower or ("2020-01-01" if column_type == "date" else "2020-01-01T00:00:00")
+        upper = upper or ("2025-12-31" if column_type == "date" else "2025-12-31T23:59:59")
+        return [lower, upper]
+    if lower is None:
+        lower = 0 if upper > 0 else upper - 1000
+    if upper is None:
+        upper = max(1000, lower + 1000)
+    return [lower, upper]
+
+
+def _surrogate_key(table_name: str, table: Dict[str, Any], composite: List[str]) -> str:
+    """Key column for a table without a single-column primary key.
+
+    A unique column wins. Otherwise a non-foreign-key column of the composite
+    key (``line_no`` of ``(order_id, line_no)``): keeping it unique keeps the
+    composite key unique without forcing one child row per parent. Foreign
+    keys are never chosen, so a table with only those (a link table) gets an
+    extra generated ``synthtest_row_id`` column.
+    """
+    columns = table["columns"]
+    for name, spec in columns.items():
+        if spec.get("unique"):
+            return name
+    fk_columns = {fk["column"] for fk in table["foreign_keys"]}
+    candidates = [name for name in composite if name not in fk_columns]
+    candidates += [name for name in columns if name not in fk_columns and name not in candidates]
+    if candidates:
+        return candidates[0]
+    log_event(LOGGER, "surrogate_key_added", table=table_name, column=SURROGATE_KEY)
+    columns[SURROGATE_KEY] = {"type": "int", "nullable": False, "max_value": _INT_BOUNDS["int8"]}
+    return SURROGATE_KEY
+
+
+def _table_count(snapshot: Dict[str, Any]) -> int:
+    return len({row["table_name"] for row in snapshot["columns"]})
+
+
+def _read_snapshot(path: Path, fingerprint: str) -> Optional[Dict[str, Any]]:
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("fingerprint") != fingerprint:
+        return None
+    return snapshot
+
+
+def _cache_dir(cache_dir: Optional[str | Path]) -> Path:
+    if cache_dir is not None:
+        return Path(cache_dir)
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "synthtest" / "postgres"
+
+
+def _connect(dsn: str):
+    if psycopg is None:
+        raise ValueError("PostgreSQL introspection requires psycopg (pip install 'synthtest-ai[postgres]')")
+    return psycopg.connect(dsn)
+
+
+def _query(connection, sql: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        names: Tuple[str, ...] = tuple(column[0] for column in cursor.description)
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
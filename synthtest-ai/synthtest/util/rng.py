@@ -1,24 +1,75 @@
 from __future__ import annotations
 
+import math
 import random
-from dataclasses import dataclass
-from typing import Any, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence
 
 from .hashing import hash_to_int
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
 
 @dataclass
 class Rng:
+    """Random draws for one generation stream.
+
+    Sequential rngs wrap a ``random.Random``. Counter rngs (``counter=True``)
+    compute every draw from a key and a position instead (see
+    ``CounterRandom``), so ``row(i).column(name)`` is a stream of its own that
+    depends only on the seed, the derive path, the column and ``i``. On a
+    sequential rng ``row`` and ``column`` return the rng itself.
+    """
+
     seed: int
     _rng: random.Random
+    counter: bool = False
+    _column_seeds: Optional[Dict[str, int]] = field(default=None, repr=False)
 
     @classmethod
-    def with_seed(cls, seed: int) -> "Rng":
+    def with_seed(cls, seed: int, counter: bool = False) -> "Rng":
+        if counter:
+            return cls(seed=seed, _rng=CounterRandom(seed), counter=True)
         return cls(seed=seed, _rng=random.Random(seed))
 
     def derive(self, salt: str) -> "Rng":
         derived = hash_to_int(f"{self.seed}:{salt}")
-        return Rng.with_seed(derived)
+        return Rng.with_seed(derived, counter=self.counter)
+
+    def row(self, index: int) -> "Rng":
+        """Stream for row ``index``; its ``column(name)`` equals ``derive(name).row(index)``."""
+        if not self.counter:
+            return self
+        if self._column_seeds is None:
+            self._column_seeds = {}
+        key = _row_key(self.seed, index)
+        return _RowRng(
+            seed=key,
+            _rng=CounterRandom(key),
+            counter=True,
+            _column_seeds=self._column_seeds,
+            _parent_seed=self.seed,
+            _index=index,
+        )
+
+    def column(self, name: str) -> "Rng":
+        return self
+
+    def batch(self, start: int, count: int) -> "CounterBatch":
+        """Vectorized draws for rows ``start .. start + count`` (see ``CounterBatch``)."""
+        if not self.counter:
+            raise ValueError("Batch draws require a counter rng (dataset.rng: counter)")
+        if np is None:
+            raise ValueError("Batch draws require numpy (pip install 'synthtest-ai[fast]')")
+        return CounterBatch(self.seed, start, count)
 
     def randint(self, a: int, b: int) -> int:
         return self._rng.randint(a, b)
@@ -29,8 +80,14 @@ class Rng:
     def choice(self, seq: Sequence[Any]) -> Any:
         return self._rng.choice(seq)
 
-    def choices(self, population: Sequence[Any], weights: Sequence[float] | None = None, k: int = 1) -> list[Any]:
-        return self._rng.choices(population, weights=weights, k=k)
+    def choices(
+        self,
+        population: Sequence[Any],
+        weights: Sequence[float] | None = None,
+        k: int = 1,
+        cum_weights: Sequence[float] | None = None,
+    ) -> list[Any]:
+        return self._rng.choices(population, weights=weights, k=k, cum_weights=cum_weights)
 
     def gauss(self, mu: float, sigma: float) -> float:
         return self._rng.gauss(mu, sigma)
@@ -43,3 +100,175 @@ class Rng:
 
     def getrandbits(self, k: int) -> int:
         return self._rng.getrandbits(k)
+
+
+@dataclass
+class _RowRng(Rng):
+    """One row of a counter rng; column streams are created once and continue across retries."""
+
+    _parent_seed: int = 0
+    _index: int = 0
+    _cells: Dict[str, Rng] = field(default_factory=dict, repr=False)
+
+    def column(self, name: str) -> Rng:
+        cell = self._cells.get(name)
+        if cell is None:
+            seed = self._column_seeds.get(name)
+            if seed is None:
+                seed = self._column_seeds[name] = hash_to_int(f"{self._parent_seed}:{name}")
+            key = _row_key(seed, self._index)
+            cell = self._cells[name] = Rng(seed=key, _rng=CounterRandom(key), counter=True)
+        return cell
+
+
+class CounterRandom(random.Random):
+    """SplitMix64 as a counter-based generator: word ``i`` is ``mix(key + (i + 1) * gamma)``.
+
+    ``random``, ``getrandbits`` and the integer draws are implemented here;
+    ``random.Random`` builds ``choices``, ``gauss`` and the rest on top of
+    them. Integers below ``n`` are ``word * n >> 64``: one word per draw, with
+    a bias of at most ``n / 2**64``.
+    """
+
+    def __init__(self, key: int = 0):
+        super().__init__(key)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        self._key = (a if isinstance(a, int) else hash_to_int(str(a))) & _MASK64
+        self._counter = 0
+
+    def getstate(self) -> tuple:
+        return (self._key, self._counter)
+
+    def setstate(self, state: tuple) -> None:
+        self._key, self._counter = state
+
+    def _next(self) -> int:
+        self._counter += 1
+        z = (self._key + self._counter * _GAMMA) & _MASK64
+        z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+        z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            return self._next() >> (64 - k)
+        words = -(-k // 64)
+        value = 0
+        for _ in range(words):
+            value = (value << 64) | self._next()
+        return value >> (64 * words - k)
+
+    def _randbelow(self, n: int) -> int:
+        if n > 1 << 64:
+            return super()._randbelow(n)
+        return (self._next() * n) >> 64
+
+    def randint(self, a: int, b: int) -> int:
+        if b < a:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        return a + self._randbelow(b - a + 1)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        if not len(seq):
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self._randbelow(len(seq))]
+
+
+class CounterBatch:
+    """Draws of a counter rng for a range of rows, as NumPy arrays.
+
+    Mirrors the ``numpy.random.Generator`` methods the vectorized generators
+    use. Each call takes the next draw slot: slot ``j`` of row ``r`` is word
+    ``j`` of ``rng.row(r)``, so a row's values do not depend on the range it
+    was generated in.
+    """
+
+    def __init__(self, seed: int, start: int, count: int):
+        rows = np.arange(start, start + count, dtype=np.uint64)
+        self.count = count
+        self.draws = 0
+        self._keys = _mix_array(np.uint64(seed) + (rows + np.uint64(1)) * np.uint64(_GAMMA))
+
+    def words(self):
+        """The next 64-bit word of every row."""
+        self.draws += 1
+        return _mix_array(self._keys + np.uint64(self.draws * _GAMMA & _MASK64))
+
+    def random(self, size: Optional[int] = None):
+        self._check(size)
+        return (self.words() >> np.uint64(11)) * (1.0 / (1 << 53))
+
+    def integers(self, low: int, high: int, size: Optional[int] = None, endpoint: bool = False):
+        self._check(size)
+        low, high = int(low), int(high)
+        span = high - low + (1 if endpoint else 0)
+        if span <= 0:
+            raise ValueError("high must be above low")
+        if span > 1 << 64:
+            raise ValueError("Batch integers need a span of at most 2**64")
+        # The same ``word * span >> 64`` as ``CounterRandom._randbelow``.
+        offsets = _mulhi_array(self.words(), span)
+        return (offsets + np.uint64(low & _MASK64)).view(np.int64)
+
+    def uniform(self, low: float = 0.0, high: float = 1.0, size: Optional[int] = None):
+        return low + (high - low) * self.random(size)
+
+    def normal(self, loc: float = 0.0, scale: float = 1.0, size: Optional[int] = None):
+        # Box-Muller; 1 - u keeps the logarithm finite.
+        radius = np.sqrt(-2.0 * np.log(1.0 - self.random(size)))
+        return loc + scale * radius * np.cos(2.0 * math.pi * self.random(size))
+
+    def lognormal(self, mean: float = 0.0, sigma: float = 1.0, size: Optional[int] = None):
+        return np.exp(self.normal(mean, sigma, size))
+
+    def bytes(self, length: int) -> bytes:
+        if self.count == 0 or length % self.count:
+            raise ValueError("Batch bytes must split evenly across rows")
+        per_row = length // self.count
+        words = np.stack([self.words() for _ in range(-(-per_row // 8))], axis=1)
+        return words.astype(">u8").view(np.uint8).reshape(self.count, -1)[:, :per_row].tobytes()
+
+    def choice(self, a: int, size: Optional[int] = None, p=None):
+        if p is None:
+            return self.integers(0, a, size)
+        cumulative = np.cumsum(p)
+        index = np.searchsorted(cumulative, self.random(size) * cumulative[-1], side="right")
+        return np.minimum(index, a - 1)
+
+    def _check(self, size: Optional[int]) -> None:
+        if size is not None and size != self.count:
+            raise ValueError("Batch draws cover exactly one value per row")
+
+
+def _row_key(seed: int, index: int) -> int:
+    return _mix((seed + (index + 1) * _GAMMA) & _MASK64)
+
+
+def _mix(z: int) -> int:
+    z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+    z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _mulhi_array(words, n: int):
+    """``words * n >> 64`` for uint64 ``words`` and ``n <= 2**64``, from 32-bit halves."""
+    if n == 1 << 64:
+        return words
+    low_mask = np.uint64(0xFFFFFFFF)
+    shift = np.uint64(32)
+    w_lo, w_hi = words & low_mask, words >> shift
+    n_lo, n_hi = np.uint64(n & 0xFFFFFFFF), np.uint64(n >> 32)
+    lo_lo = w_lo * n_lo
+    hi_lo = w_hi * n_lo
+    cross = (lo_lo >> shift) + (hi_lo & low_mask) + w_lo * n_hi
+    return w_hi * n_hi + (hi_lo >> shift) + (cross >> shift)
+
+
+def _mix_array(z):
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+    return z ^ (z >> np.uint64(31))
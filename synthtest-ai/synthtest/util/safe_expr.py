@@ -1,71 +1,199 @@
 from __future__ import annotations
 
 import ast
-from typing import Any, Dict
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
 
 
 ALLOWED_BOOL_OPS = (ast.And, ast.Or)
 ALLOWED_CMPS = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
 ALLOWED_UNARY = (ast.Not,)
 
+_CMP_FUNCS: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
 
 class SafeExprError(ValueError):
     pass
 
 
 def evaluate(expr: str, context: Dict[str, Any]) -> Any:
+    return compile_expr(expr)(context)
+
+
+class CompiledExpr:
+    """A parsed expression compiled once into a tree of closures.
+
+    ``names`` holds the root names the expression references (e.g. ``orders``
+    for ``orders.status == 'FAILED'``) and ``attributes`` the ``(name, attr)``
+    pairs read from them. ``evaluate_batch`` evaluates the same expression over
+    column lists instead of a single row.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        names: FrozenSet[str],
+        attributes: FrozenSet[Tuple[str, str]],
+        row_fn: Callable,
+        batch_fn: Callable,
+    ):
+        self.source = source
+        self.names = names
+        self.attributes = attributes
+        self._row_fn = row_fn
+        self._batch_fn = batch_fn
+
+    def __call__(self, context: Dict[str, Any]) -> Any:
+        return self._row_fn(context)
+
+    def evaluate_batch(self, context: Dict[str, Any], size: int) -> List[Any]:
+        """Evaluate over ``size`` rows; tables in ``context`` map column names to lists."""
+        return _as_vector(self._batch_fn(context, size), size)
+
+
+@lru_cache(maxsize=4096)
+def compile_expr(expr: str) -> CompiledExpr:
     try:
         tree = ast.parse(expr, mode="eval")
     except SyntaxError as exc:
         raise SafeExprError(str(exc)) from exc
-    return _eval_node(tree.body, context)
+    names = frozenset(node.id for node in ast.walk(tree.body) if isinstance(node, ast.Name))
+    attributes = frozenset(
+        (node.value.id, node.attr)
+        for node in ast.walk(tree.body)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+    )
+    return CompiledExpr(expr, names, attributes, _compile_node(tree.body), _compile_batch_node(tree.body))
 
 
-def _eval_node(node: ast.AST, context: Dict[str, Any]) -> Any:
+def _compile_node(node: ast.AST) -> Callable[[Dict[str, Any]], Any]:
     if isinstance(node, ast.Constant):
-        return node.value
+        value = node.value
+        return lambda context: value
     if isinstance(node, ast.Name):
-        return _resolve_name(node.id, context)
+        name = node.id
+        return lambda context: _resolve_name(name, context)
     if isinstance(node, ast.Attribute):
-        base = _eval_node(node.value, context)
-        if isinstance(base, dict):
-            return base.get(node.attr)
-        return getattr(base, node.attr, None)
+        base_fn = _compile_node(node.value)
+        attr = node.attr
+
+        def attribute(context: Dict[str, Any]) -> Any:
+            base = base_fn(context)
+            if isinstance(base, dict):
+                return base.get(attr)
+            return getattr(base, attr, None)
+
+        return attribute
     if isinstance(node, ast.BoolOp) and isinstance(node.op, ALLOWED_BOOL_OPS):
-        values = [_eval_node(v, context) for v in node.values]
+        value_fns = [_compile_node(v) for v in node.values]
         if isinstance(node.op, ast.And):
-            return all(values)
-        return any(values)
+            return lambda context: all([fn(context) for fn in value_fns])
+        return lambda context: any([fn(context) for fn in value_fns])
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ALLOWED_UNARY):
+        operand_fn = _compile_node(node.operand)
+        return lambda context: not operand_fn(context)
+    if isinstance(node, ast.Compare):
+        left_fn = _compile_node(node.left)
+        steps = [(_compile_cmp(op), _compile_node(comparator)) for op, comparator in zip(node.ops, node.comparators)]
+
+        def compare(context: Dict[str, Any]) -> bool:
+            left = left_fn(context)
+            for cmp_fn, right_fn in steps:
+                right = right_fn(context)
+                if not cmp_fn(left, right):
+                    return False
+                left = right
+            return True
+
+        return compare
+    return _raiser(f"Unsupported expression node: {type(node).__name__}")
+
+
+def _compile_batch_node(node: ast.AST) -> Callable[[Dict[str, Any], int], Any]:
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda context, size: [value] * size
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda context, size: _resolve_name(name, context)
+    if isinstance(node, ast.Attribute):
+        base_fn = _compile_batch_node(node.value)
+        attr = node.attr
+
+        def attribute(context: Dict[str, Any], size: int) -> List[Any]:
+            base = base_fn(context, size)
+            if isinstance(base, dict):
+                column = base.get(attr)
+                return [None] * size if column is None else column
+            return [item.get(attr) if isinstance(item, dict) else getattr(item, attr, None) for item in base]
+
+        return attribute
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ALLOWED_BOOL_OPS):
+        value_fns = [_compile_batch_node(v) for v in node.values]
+        combine = all if isinstance(node.op, ast.And) else any
+
+        def bool_op(context: Dict[str, Any], size: int) -> List[bool]:
+            vectors = [_as_vector(fn(context, size), size) for fn in value_fns]
+            return [combine(values) for values in zip(*vectors)]
+
+        return bool_op
     if isinstance(node, ast.UnaryOp) and isinstance(node.op, ALLOWED_UNARY):
-        operand = _eval_node(node.operand, context)
-        return not operand
+        operand_fn = _compile_batch_node(node.operand)
+        return lambda context, size: [not value for value in _as_vector(operand_fn(context, size), size)]
     if isinstance(node, ast.Compare):
-        left = _eval_node(node.left, context)
-        result = True
-        for op, comparator in zip(node.ops, node.comparators):
-            right = _eval_node(comparator, context)
-            if not _compare(op, left, right):
-                result = False
-                break
-            left = right
-        return result
-    raise SafeExprError(f"Unsupported expression node: {type(node).__name__}")
-
-
-def _compare(op: ast.cmpop, left: Any, right: Any) -> bool:
-    if isinstance(op, ast.Eq):
-        return left == right
-    if isinstance(op, ast.NotEq):
-        return left != right
-    if isinstance(op, ast.Lt):
-        return left < right
-    if isinstance(op, ast.LtE):
-        return left <= right
-    if isinstance(op, ast.Gt):
-        return left > right
-    if isinstance(op, ast.GtE):
-        return left >= right
-    raise SafeExprError(f"Unsupported comparator: {type(op).__name__}")
+        left_fn = _compile_batch_node(node.left)
+        steps = [
+            (_compile_cmp(op), _compile_batch_node(comparator)) for op, comparator in zip(node.ops, node.comparators)
+        ]
+
+        def compare(context: Dict[str, Any], size: int) -> List[bool]:
+            left = _as_vector(left_fn(context, size), size)
+            result = [True] * size
+            for cmp_fn, right_fn in steps:
+                right = _as_vector(right_fn(context, size), size)
+                result = [ok and cmp_fn(a, b) for ok, a, b in zip(result, left, right)]
+                left = right
+            return result
+
+        return compare
+    message = f"Unsupported expression node: {type(node).__name__}"
+
+    def unsupported(context: Dict[str, Any], size: int) -> Any:
+        raise SafeExprError(message)
+
+    return unsupported
+
+
+def _compile_cmp(op: ast.cmpop) -> Callable[[Any, Any], bool]:
+    if isinstance(op, ALLOWED_CMPS):
+        return _CMP_FUNCS[type(op)]
+    message = f"Unsupported comparator: {type(op).__name__}"
+
+    def unsupported(left: Any, right: Any) -> bool:
+        raise SafeExprError(message)
+
+    return unsupported
+
+
+def _raiser(message: str) -> Callable[[Dict[str, Any]], Any]:
+    def unsupported(context: Dict[str, Any]) -> Any:
+        raise SafeExprError(message)
+
+    return unsupported
+
+
+def _as_vector(value: Any, size: int) -> List[Any]:
+    if isinstance(value, list):
+        return value
+    return [value] * size
 
 
 def _resolve_name(name: str, context: Dict[str, Any]) -> Any:
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable
+
+from synthtest.schema.canonical import SchemaSpec
+from synthtest.validate.report import TableReport, ValidationReport
+from synthtest.validate.validator import TableValidator, build_report, referenced_tables
+
+
+class InlineValidation:
+    """Builds the validation report from rows as they are written.
+
+    Each row is checked in the form the exporter's ``readback`` gives, i.e.
+    exactly as ``validate_output`` would read it from disk, so the report
+    matches the re-read pass without opening the output files again. Parent
+    tables must finish before their children start (the generation order
+    already guarantees this).
+    """
+
+    def __init__(self, schema: SchemaSpec):
+        self.schema = schema
+        self.referenced = set(referenced_tables(schema))
+        self.pk_sets: Dict[str, set] = {}
+        self.reports: Dict[str, TableReport] = {}
+
+    def wrap(self, table_name: str, exporter) -> "ValidatingExporter":
+        table = self.schema.tables[table_name]
+        validator = TableValidator(table, self.schema, self.pk_sets, collect_pk=table_name in self.referenced)
+        return ValidatingExporter(self, exporter, validator)
+
+    def report(self) -> ValidationReport:
+        return build_report(
+            self.schema, {name: self.reports[name] for name in self.schema.tables if name in self.reports}
+        )
+
+    def _finish(self, validator: TableValidator) -> None:
+        name = validator.table.name
+        self.reports[name] = validator.report()
+        if name in self.referenced:
+            self.pk_sets[name] = validator.pk_values
+
+
+class ValidatingExporter:
+    """Exporter wrapper feeding every written row to a ``TableValidator``."""
+
+    def __init__(self, inline: InlineValidation, exporter, validator: TableValidator):
+        self._inline = inline
+        self._exporter = exporter
+        self._validator = validator
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        rows = list(rows)
+        readback = self._exporter.readback
+        for row in rows:
+            self._validator.add_row(readback(row))
+        self._exporter.write_rows(rows)
+
+    def close(self) -> None:
+        self._exporter.close()
+        self._inline._finish(self._validator)
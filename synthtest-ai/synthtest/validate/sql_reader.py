@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+SQL_CHUNK_SIZE = 1 << 20
+
+# A string literal with '' escapes, written so a cut-off literal fails in linear time.
+_STRING = r"'[^']*(?:''[^']*)*'"
+_SPACE_RE = re.compile(r"\s*")
+_INSERT_RE = re.compile(r"INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES\s*", re.IGNORECASE)
+_COPY_RE = re.compile(r"COPY\s+(\w+)\s*\(([^)]*)\)\s*FROM\s+stdin\s*;[^\n]*\n", re.IGNORECASE)
+_TUPLE_RE = re.compile(rf"\(([^'()]*(?:{_STRING}[^'()]*)*)\)\s*([,;])")
+_VALUE_RE = re.compile(rf"{_STRING}|[^,\s']+")
+_COPY_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+def iter_sql_rows(handle: IO[str], chunk_size: int = SQL_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Rows of the INSERT statements (single- or multi-row) and COPY blocks in ``handle``.
+
+    The file is read ``chunk_size`` characters at a time and scanned in one
+    pass with compiled regexes: one match per statement header and per VALUES
+    tuple, one ``findall`` for the values of a tuple. String literals may hold
+    ``''``, commas, parentheses and newlines. Other statements are skipped.
+    """
+    reader = _Buffer(handle, chunk_size)
+    names: Dict[str, List[str]] = {}
+    while True:
+        reader.skip_space()
+        if reader.at_end():
+            return
+        header = reader.match(_INSERT_RE)
+        if header is not None:
+            yield from _insert_rows(reader, _column_names(header.group(2), names))
+            continue
+        header = reader.match(_COPY_RE)
+        if header is not None:
+            yield from _copy_rows(reader, _column_names(header.group(2), names))
+            continue
+        reader.skip_line()
+
+
+def _insert_rows(reader: _Buffer, columns: List[str]) -> Iterator[Dict[str, Any]]:
+    while True:
+        values = reader.match(_TUPLE_RE, whole=True)
+        if values is None:
+            reader.skip_line()
+            return
+        yield dict(zip(columns, map(_parse_value, _VALUE_RE.findall(values.group(1)))))
+        if values.group(2) == ";":
+            return
+        reader.skip_space()
+
+
+def _copy_rows(reader: _Buffer, columns: List[str]) -> Iterator[Dict[str, Any]]:
+    while True:
+        line = reader.read_line()
+        if line is None or line == "\\.":
+            return
+        yield dict(zip(columns, map(_parse_copy_value, line.split("\t"))))
+
+
+def _column_names(raw: str, cache: Dict[str, List[str]]) -> List[str]:
+    # Single-row INSERTs repeat the same column list on every line.
+    if raw not in cache:
+        cache[raw] = [name.strip() for name in raw.split(",")]
+    return cache[raw]
+
+
+def _parse_value(token: str) -> Any:
+    if token[0] == "'":
+        return token[1:-1].replace("''", "'")
+    if token.upper() == "NULL":
+        return None
+    return token
+
+
+def _parse_copy_value(value: str) -> Any:
+    if value == "\\N":
+        return None
+    if "\\" not in value:
+        return value
+    out: List[str] = []
+    i = 0
+    while i < len(value):
+        char = value[i]
+        if char == "\\" and i + 1 < len(value):
+            out.append(_COPY_UNESCAPES.get(value[i + 1], value[i + 1]))
+            i += 2
+        else:
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+class _Buffer:
+    """A window over a text stream; refilled when a match runs into its end."""
+
+    def __init__(self, handle: IO[str], chunk_size: int):
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._handle.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._text = self._text[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def at_end(self) -> bool:
+        return self._pos >= len(self._text) and not self._fill()
+
+    def skip_space(self) -> None:
+        while True:
+            self._pos = _SPACE_RE.match(self._text, self._pos).end()
+            if self._pos < len(self._text) or not self._fill():
+                return
+
+    def match(self, pattern: re.Pattern, whole: bool = False) -> Optional[re.Match]:
+        """Match ``pattern`` here and move past it.
+
+        Statement headers fit on one line, so those are retried with more
+        data only while no newline is buffered; ``whole`` patterns (VALUES
+        tuples, which may span lines) are retried until end of file.
+        """
+        while True:
+            found = pattern.match(self._text, self._pos)
+            if found is not None and found.end() < len(self._text):
+                self._pos = found.end()
+                return found
+            complete = not whole and self._text.find("\n", self._pos) != -1
+            if (found is None and complete) or not self._fill():
+                if found is not None:
+                    self._pos = found.end()
+                return found
+
+    def read_line(self) -> Optional[str]:
+        while True:
+            end = self._text.find("\n", self._pos)
+            if end != -1:
+                line = self._text[self._pos : end]
+                self._pos = end + 1
+                return line.rstrip("\r")
+            if not self._fill():
+                if self._pos >= len(self._text):
+                    return None
+                line = self._text[self._pos :]
+                self._pos = len(self._text)
+                return line.rstrip("\r")
+
+    def skip_line(self) -> None:
+        while True:
+            end = self._text.find("\n", self._pos)
+            if end != -1:
+                self._pos = end + 1
+                return
+            if not self._fill():
+                self._pos = len(self._text)
+                return
@@ -2,33 +2,111 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
+import io
 import json
-import re
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
-from synthtest.gen.rules_engine import evaluate_rules
+from synthtest.export.arrow_exporter import ARROW_FORMATS, arrow_batch_sizes, read_arrow_batches
+from synthtest.export.compression import COMPRESSION_SUFFIXES, find_table_file, open_text_reader
+from synthtest.gen.compiled import compile_table
 from synthtest.schema.canonical import ColumnSpec, SchemaSpec, TableSpec
 from synthtest.validate.report import TableReport, ValidationReport
+from synthtest.validate.sql_reader import iter_sql_rows
 
 
-def validate_output(schema: SchemaSpec, out_dir: Path, fmt: str) -> ValidationReport:
-    table_rows: Dict[str, List[Dict[str, Any]]] = {}
-    for table_name in schema.tables.keys():
-        path = _table_path(out_dir, table_name, fmt)
-        table_rows[table_name] = _load_rows(path, fmt)
+RULE_BATCH_SIZE = 4096
+PART_BYTES = 32 << 20
+_READ_BLOCK = 1 << 20
 
-    pk_sets = {name: _collect_pk(schema.tables[name], rows) for name, rows in table_rows.items()}
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+@dataclass
+class TablePart:
+    """A slice of one table's output file that a worker validates on its own.
+
+    ``start`` / ``stop`` are byte offsets of whole records in a plain CSV or
+    JSON Lines file, or batch indices in a Parquet / Arrow file; ``stop=None``
+    means the whole file. ``header`` holds the CSV column names for parts
+    that do not begin at the header line.
+    """
+
+    table: str
+    path: Path
+    fmt: str
+    start: int = 0
+    stop: Optional[int] = None
+    header: Optional[List[str]] = None
+    split: bool = False
+
+
+def validate_output(
+    schema: SchemaSpec,
+    out_dir: Path,
+    fmt: str,
+    workers: int = 1,
+    files: Optional[Mapping[str, str]] = None,
+) -> ValidationReport:
+    """Validate generated files without loading whole tables into memory.
+
+    A first pass streams only the primary-key column of tables referenced by
+    foreign keys; the second pass streams each table once through a
+    ``TableValidator``. Peak memory is bounded by the key and unique-value
+    sets, not by row count.
+
+    With ``workers > 1`` both passes run in a process pool, and files larger
+    than ``PART_BYTES`` are cut into parts at record boundaries. The partial
+    reports of a table are merged in file order, re-checking unique values
+    across parts, so the result equals the sequential report.
+
+    ``files`` maps tables to the file names a run wrote (``RunMetadata.files``)
+    so exactly those files are read; without it a table's file is looked up
+    with ``find_table_file``.
+    """
+    paths = {name: _table_path(out_dir, name, fmt, files) for name in schema.tables}
+    if workers > 1:
+        return _validate_parallel(schema, paths, fmt, workers)
+
+    pk_sets = {
+        name: _collect_pk(schema.tables[name], _iter_rows(paths[name], fmt)) for name in referenced_tables(schema)
+    }
 
     table_reports: Dict[str, TableReport] = {}
+    for table_name, table in schema.tables.items():
+        validator = TableValidator(table, schema, pk_sets)
+        for row in _iter_rows(paths[table_name], fmt):
+            validator.add_row(row)
+        table_reports[table_name] = validator.report()
+    return build_report(schema, table_reports)
+
+
+def _validate_parallel(schema: SchemaSpec, paths: Dict[str, Path], fmt: str, workers: int) -> ValidationReport:
+    parts = {name: split_table(name, paths[name], fmt, PART_BYTES) for name in schema.tables}
+
+    key_parts = [part for name in referenced_tables(schema) for part in parts[name]]
+    pk_sets: Dict[str, set] = {name: set() for name in referenced_tables(schema)}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(schema, {})) as executor:
+        for part, keys in zip(key_parts, executor.map(_collect_part_pk, key_parts)):
+            pk_sets[part.table].update(keys)
+
+    all_parts = [part for name in schema.tables for part in parts[name]]
+    results: Dict[str, List[Tuple[TableReport, Dict[str, Dict[Any, Optional[int]]]]]] = {
+        name: [] for name in schema.tables
+    }
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(schema, pk_sets)) as executor:
+        for part, result in zip(all_parts, executor.map(_validate_part, all_parts)):
+            results[part.table].append(result)
+    return build_report(schema, {name: merge_part_reports(name, results[name]) for name in schema.tables})
+
+
+def build_report(schema: SchemaSpec, table_reports: Dict[str, TableReport]) -> ValidationReport:
     total_violations = 0
     aggregate_coverage: Dict[str, int] = {}
-
-    for table_name, rows in table_rows.items():
-        table = schema.tables[table_name]
-        report = _validate_table(table, rows, pk_sets, schema)
-        table_reports[table_name] = report
+    for report in table_reports.values():
         total_violations += sum(report.violations.values()) + report.rule_violations
         for key, count in report.constraint_coverage.items():
             aggregate_coverage[key] = aggregate_coverage.get(key, 0) + count
@@ -42,139 +120,364 @@ def validate_output(schema: SchemaSpec, out_dir: Path, fmt: str) -> ValidationRe
     )
 
 
-def _table_path(out_dir: Path, table: str, fmt: str) -> Path:
+def referenced_tables(schema: SchemaSpec) -> List[str]:
+    """Tables whose primary keys are referenced by a foreign key, in schema order."""
+    referenced = {fk.ref_table for table in schema.tables.values() for fk in table.foreign_keys}
+    return [name for name in schema.tables if name in referenced]
+
+
+def _table_path(out_dir: Path, table: str, fmt: str, files: Optional[Mapping[str, str]] = None) -> Path:
+    """Output file of ``table``; text formats may also be stored as ``.gz`` / ``.zst``."""
+    if files and table in files:
+        return out_dir / files[table]
     if fmt == "csv":
-        return out_dir / f"{table}.csv"
+        return find_table_file(out_dir / f"{table}.csv")
     if fmt == "json":
-        return out_dir / f"{table}.jsonl"
+        return find_table_file(out_dir / f"{table}.jsonl")
     if fmt == "sql":
-        return out_dir / f"{table}.sql"
+        return find_table_file(out_dir / f"{table}.sql")
+    if fmt in ARROW_FORMATS:
+        return out_dir / f"{table}{ARROW_FORMATS[fmt]}"
     raise ValueError(f"Unsupported format: {fmt}")
 
 
-def _load_rows(path: Path, fmt: str) -> List[Dict[str, Any]]:
+def _iter_rows(path: Path, fmt: str) -> Iterator[Dict[str, Any]]:
+    if fmt not in {"csv", "json", "sql"} and fmt not in ARROW_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
     if not path.exists():
-        return []
-    if fmt == "csv":
-        with path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            return [dict(row) for row in reader]
-    if fmt == "json":
-        rows: List[Dict[str, Any]] = []
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                rows.append(json.loads(line))
-        return rows
-    if fmt == "sql":
-        rows = []
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                row = _parse_sql_insert(line)
-                if row:
-                    rows.append(row)
-        return rows
-    raise ValueError(f"Unsupported format: {fmt}")
+        return
+    if fmt in ARROW_FORMATS:
+        for columns in read_arrow_batches(path, fmt):
+            names = list(columns)
+            for values in zip(*columns.values()):
+                yield dict(zip(names, values))
+        return
+    with open_text_reader(path) as handle:
+        if fmt == "csv":
+            yield from csv.DictReader(handle)
+            return
+        if fmt == "sql":
+            yield from iter_sql_rows(handle)
+            return
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            yield json.loads(line)
 
 
-def _collect_pk(table: TableSpec, rows: List[Dict[str, Any]]) -> set:
+def _load_rows(path: Path, fmt: str) -> List[Dict[str, Any]]:
+    return list(_iter_rows(path, fmt))
+
+
+def _collect_pk(table: TableSpec, rows: Iterable[Dict[str, Any]]) -> set:
     values = set()
+    column = table.columns.get(table.primary_key)
+    if column is None:
+        return values
     for row in rows:
-        raw = row.get(table.primary_key)
-        column = table.columns.get(table.primary_key)
-        if column is None:
-            continue
-        value, type_error = _coerce_value(raw, column)
+        value, type_error = _coerce_value(row.get(table.primary_key), column)
         if value is not None and not type_error:
             values.add(value)
     return values
 
 
-def _validate_table(
-    table: TableSpec,
-    rows: List[Dict[str, Any]],
-    pk_sets: Dict[str, set],
-    schema: SchemaSpec,
+def split_table(table: str, path: Path, fmt: str, part_bytes: int = PART_BYTES) -> List[TablePart]:
+    """Cut ``path`` into parts of about ``part_bytes`` that can be read independently.
+
+    Plain CSV and JSON Lines files are cut after a newline (for CSV, one
+    outside quoted fields); Parquet / Arrow files between row groups. SQL and
+    compressed files cannot be entered mid-stream and stay whole.
+    """
+    whole = [TablePart(table, path, fmt)]
+    if not path.exists() or path.suffix in COMPRESSION_SUFFIXES.values():
+        return whole
+    if fmt in ARROW_FORMATS:
+        bounds = _batch_bounds(arrow_batch_sizes(path, fmt), part_bytes)
+        header = None
+    elif fmt in {"csv", "json"} and path.stat().st_size > part_bytes:
+        bounds = _record_bounds(path, part_bytes, header=fmt == "csv")
+        header = _csv_header(path, bounds[0]) if fmt == "csv" else None
+    else:
+        return whole
+    if len(bounds) <= 2:
+        return whole
+    return [
+        TablePart(table, path, fmt, start, stop, header, split=True) for start, stop in zip(bounds, bounds[1:])
+    ]
+
+
+def merge_part_reports(
+    table: str, results: List[Tuple[TableReport, Dict[str, Dict[Any, Optional[int]]]]]
 ) -> TableReport:
-    violations: Dict[str, int] = {}
-    coverage: Dict[str, int] = {}
-    unique_sets: Dict[str, set] = {name: set() for name, col in table.columns.items() if col.unique}
-    failed_rows = 0
-    rule_violations = 0
-
-    for row in rows:
+    """Combine the reports of a table's parts, given in file order.
+
+    Each part lists the first row it saw of every unique value (``None`` when
+    that row already failed); a value seen in an earlier part is a
+    duplicate, and fails its row if nothing else did.
+    """
+    if len(results) == 1:
+        return results[0][0]
+    merged = TableReport(table=table, row_count=0)
+    seen: Dict[str, set] = {}
+    for report, first_rows in results:
+        merged.row_count += report.row_count
+        merged.rule_violations += report.rule_violations
+        merged.failed_rows += report.failed_rows
+        for key, count in report.violations.items():
+            _add(merged.violations, key, count)
+        for key, count in report.constraint_coverage.items():
+            _add(merged.constraint_coverage, key, count)
+        newly_failed = set()
+        for col_name, values in first_rows.items():
+            column_seen = seen.setdefault(col_name, set())
+            for value, row_index in values.items():
+                if value in column_seen:
+                    _increment(merged.violations, "unique")
+                    if row_index is not None:
+                        newly_failed.add(row_index)
+                else:
+                    column_seen.add(value)
+        merged.failed_rows += len(newly_failed)
+    return merged
+
+
+def _init_worker(schema: SchemaSpec, pk_sets: Dict[str, set]) -> None:
+    _WORKER_STATE["schema"] = schema
+    _WORKER_STATE["pk_sets"] = pk_sets
+
+
+def _collect_part_pk(part: TablePart) -> set:
+    return _collect_pk(_WORKER_STATE["schema"].tables[part.table], _iter_part_rows(part))
+
+
+def _validate_part(part: TablePart) -> Tuple[TableReport, Dict[str, Dict[Any, Optional[int]]]]:
+    schema = _WORKER_STATE["schema"]
+    validator = TableValidator(schema.tables[part.table], schema, _WORKER_STATE["pk_sets"], track_rows=part.split)
+    for row in _iter_part_rows(part):
+        validator.add_row(row)
+    return validator.report(), validator.first_rows()
+
+
+def _iter_part_rows(part: TablePart) -> Iterator[Dict[str, Any]]:
+    if part.stop is None:
+        yield from _iter_rows(part.path, part.fmt)
+        return
+    if part.fmt in ARROW_FORMATS:
+        for columns in read_arrow_batches(part.path, part.fmt, part.start, part.stop):
+            names = list(columns)
+            for values in zip(*columns.values()):
+                yield dict(zip(names, values))
+        return
+    with part.path.open("rb") as raw:
+        raw.seek(part.start)
+        handle = io.StringIO(raw.read(part.stop - part.start).decode("utf-8"), newline="")
+    if part.fmt == "csv":
+        yield from csv.DictReader(handle, fieldnames=part.header)
+        return
+    for line in handle:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _batch_bounds(sizes: List[int], part_bytes: int) -> List[int]:
+    bounds, size = [0], 0
+    for index, batch_size in enumerate(sizes):
+        size += batch_size
+        if size >= part_bytes and index + 1 < len(sizes):
+            bounds.append(index + 1)
+            size = 0
+    bounds.append(len(sizes))
+    return bounds
+
+
+def _record_bounds(path: Path, part_bytes: int, header: bool) -> List[int]:
+    """Byte offsets of record starts about ``part_bytes`` apart, plus the file size.
+
+    A newline ends a CSV record only outside quotes, i.e. after an even
+    number of ``"`` (escaped quotes are doubled). With ``header`` the first
+    offset is the end of the header record.
+    """
+    bounds = [] if header else [0]
+    next_cut = 0 if header else part_bytes
+    in_quotes = False
+    offset = 0
+    with path.open("rb") as handle:
+        while True:
+            block = handle.read(_READ_BLOCK)
+            if not block:
+                break
+            pos = 0
+            while offset + len(block) > next_cut:
+                cut = max(next_cut - offset, pos)
+                if header:
+                    in_quotes ^= block.count(b'"', pos, cut) & 1
+                newline = block.find(b"\n", cut)
+                if newline == -1:
+                    pos = cut
+                    break
+                if header:
+                    in_quotes ^= block.count(b'"', cut, newline) & 1
+                pos = newline + 1
+                if not in_quotes:
+                    bounds.append(offset + pos)
+                    next_cut = offset + pos + part_bytes
+                else:
+                    next_cut = offset + pos
+            if header:
+                in_quotes ^= block.count(b'"', pos) & 1
+            offset += len(block)
+    if not bounds or bounds[-1] < offset:
+        bounds.append(offset)
+    return bounds
+
+
+def _csv_header(path: Path, end: int) -> List[str]:
+    with path.open("rb") as handle:
+        return next(csv.reader(io.StringIO(handle.read(end).decode("utf-8"), newline="")))
+
+
+class TableValidator:
+    """Accumulates the ``TableReport`` of one table from a stream of rows.
+
+    Rows are checked as they arrive; rules are evaluated over column batches
+    of ``batch_size`` rows, so only one batch of parsed values is held at a
+    time. With ``collect_pk`` the valid primary-key values seen are kept in
+    ``pk_values``, matching what ``_collect_pk`` would read from the file.
+    """
+
+    def __init__(
+        self,
+        table: TableSpec,
+        schema: SchemaSpec,
+        pk_sets: Mapping[str, Any],
+        batch_size: int = RULE_BATCH_SIZE,
+        collect_pk: bool = False,
+        track_rows: bool = False,
+    ):
+        self.table = table
+        self.plan = compile_table(table, schema, pk_sets)
+        self.batch_size = batch_size
+        self.row_count = 0
+        self.failed_rows = 0
+        self.rule_violations = 0
+        self.violations: Dict[str, int] = {}
+        self.coverage: Dict[str, int] = {}
+        # Unique value -> index of the first row holding it.
+        self.unique_sets: Dict[str, Dict[Any, int]] = {name: {} for name, col in table.columns.items() if col.unique}
+        self._parsed: Dict[str, List[Any]] = {col_name: [] for col_name in table.columns}
+        self._failures: List[bool] = []
+        self.pk_values: set = set()
+        self._pk_column = table.primary_key if collect_pk else None
+        self._failed_indices: Optional[set] = set() if track_rows else None
+
+    def add_row(self, row: Dict[str, Any]) -> None:
+        violations = self.violations
+        coverage = self.coverage
+        fk_index = self.plan.fk_index
         row_failed = False
-        parsed_row: Dict[str, Any] = {}
-        for col_name, column in table.columns.items():
+        for col_name, compiled in self.plan.columns.items():
+            column = compiled.spec
             raw_value = row.get(col_name)
-            coverage = _increment(coverage, "type")
+            _increment(coverage, "type")
             value, type_error = _coerce_value(raw_value, column)
-            parsed_row[col_name] = value
+            self._parsed[col_name].append(value)
             if value is None:
-                coverage = _increment(coverage, "nullable")
+                _increment(coverage, "nullable")
                 if not column.nullable:
-                    violations = _increment(violations, "nullability")
+                    _increment(violations, "nullability")
                     row_failed = True
                 continue
             if type_error:
-                violations = _increment(violations, "type")
+                _increment(violations, "type")
                 row_failed = True
                 continue
+            if col_name == self._pk_column:
+                self.pk_values.add(value)
 
             if column.range and column.type in {"int", "decimal", "date", "datetime"}:
-                coverage = _increment(coverage, "range")
-                if not _check_range(value, column):
-                    violations = _increment(violations, "range")
+                _increment(coverage, "range")
+                if compiled.range_check is not None and not compiled.range_check(value):
+                    _increment(violations, "range")
                     row_failed = True
 
-            if column.regex and column.type in {"text", "email", "phone", "postcode_uk", "name"}:
-                coverage = _increment(coverage, "regex")
-                if not re.fullmatch(column.regex, str(value)):
-                    violations = _increment(violations, "regex")
+            if compiled.regex is not None and column.type in {"text", "email", "phone", "postcode_uk", "name"}:
+                _increment(coverage, "regex")
+                if not compiled.regex.fullmatch(str(value)):
+                    _increment(violations, "regex")
                     row_failed = True
 
-            if column.values and column.type == "enum":
-                coverage = _increment(coverage, "enum")
-                if value not in column.values:
-                    violations = _increment(violations, "enum")
+            if compiled.enum_values is not None:
+                _increment(coverage, "enum")
+                if value not in compiled.enum_values:
+                    _increment(violations, "enum")
                     row_failed = True
 
             if column.unique:
-                coverage = _increment(coverage, "unique")
-                if value in unique_sets[col_name]:
-                    violations = _increment(violations, "unique")
+                _increment(coverage, "unique")
+                seen = self.unique_sets[col_name]
+                if value in seen:
+                    _increment(violations, "unique")
                     row_failed = True
-                unique_sets[col_name].add(value)
+                else:
+                    seen[value] = self.row_count
 
-            fk = next((fk for fk in table.foreign_keys if fk.column == col_name), None)
-            if fk:
-                coverage = _increment(coverage, "foreign_key")
-                if value not in pk_sets.get(fk.ref_table, set()):
-                    violations = _increment(violations, "foreign_key")
+            if compiled.is_foreign_key:
+                _increment(coverage, "foreign_key")
+                if not fk_index.contains(col_name, value):
+                    _increment(violations, "foreign_key")
                     row_failed = True
 
-        coverage = _increment(coverage, "rules")
-        context = {table.name: parsed_row}
-        if evaluate_rules(schema.rules, context):
-            rule_violations += 1
-            row_failed = True
-
-        if row_failed:
-            failed_rows += 1
-
-    return TableReport(
-        table=table.name,
-        row_count=len(rows),
-        violations=violations,
-        rule_violations=rule_violations,
-        failed_rows=failed_rows,
-        constraint_coverage=coverage,
-    )
+        _increment(coverage, "rules")
+        self.row_count += 1
+        self._failures.append(row_failed)
+        if len(self._failures) >= self.batch_size:
+            self._flush()
+
+    def report(self) -> TableReport:
+        self._flush()
+        return TableReport(
+            table=self.table.name,
+            row_count=self.row_count,
+            violations=self.violations,
+            rule_violations=self.rule_violations,
+            failed_rows=self.failed_rows,
+            constraint_coverage=self.coverage,
+        )
+
+    def first_rows(self) -> Dict[str, Dict[Any, Optional[int]]]:
+        """Unique value -> first row holding it, or None if that row failed.
+
+        Only kept with ``track_rows``; ``merge_part_reports`` uses it to find
+        duplicates across parts of a table.
+        """
+        if self._failed_indices is None:
+            return {}
+        self._flush()
+        failed = self._failed_indices
+        return {
+            col_name: {value: None if index in failed else index for value, index in seen.items()}
+            for col_name, seen in self.unique_sets.items()
+        }
+
+    def _flush(self) -> None:
+        failures = self._failures
+        if not failures:
+            return
+        rules = self.plan.rules
+        if rules:
+            rule_results = rules.evaluate_batch({self.table.name: self._parsed}, len(failures))
+            for index, rule_failures in enumerate(rule_results):
+                if rule_failures:
+                    self.rule_violations += 1
+                    failures[index] = True
+        self.failed_rows += sum(failures)
+        if self._failed_indices is not None:
+            base = self.row_count - len(failures)
+            self._failed_indices.update(base + index for index, failed in enumerate(failures) if failed)
+        self._parsed = {col_name: [] for col_name in self._parsed}
+        self._failures = []
 
 
 def _increment(counter: Dict[str, int], key: str) -> Dict[str, int]:
@@ -182,6 +485,10 @@ def _increment(counter: Dict[str, int], key: str) -> Dict[str, int]:
     return counter
 
 
+def _add(counter: Dict[str, int], key: str, count: int) -> None:
+    counter[key] = counter.get(key, 0) + count
+
+
 def _coerce_value(raw_value: Any, column: ColumnSpec) -> Tuple[Any, bool]:
     if raw_value is None:
         return None, False
@@ -223,64 +530,3 @@ def _coerce_value(raw_value: Any, column: ColumnSpec) -> Tuple[Any, bool]:
     except Exception:
         return raw_value, True
     return raw_value, False
-
-
-def _check_range(value: Any, column: ColumnSpec) -> bool:
-    if not column.range or len(column.range) < 2:
-        return True
-    min_val, max_val = column.range[0], column.range[1]
-    if column.type in {"int", "decimal"}:
-        return float(min_val) <= float(value) <= float(max_val)
-    if column.type == "date":
-        start = dt.date.fromisoformat(str(min_val))
-        end = dt.date.fromisoformat(str(max_val))
-        return start <= value <= end
-    if column.type == "datetime":
-        start = dt.datetime.fromisoformat(str(min_val).replace("Z", "+00:00"))
-        end = dt.datetime.fromisoformat(str(max_val).replace("Z", "+00:00"))
-        if isinstance(value, dt.datetime) and value.tzinfo is not None:
-            value = value.replace(tzinfo=None)
-        if start.tzinfo is not None:
-            start = start.replace(tzinfo=None)
-        if end.tzinfo is not None:
-            end = end.replace(tzinfo=None)
-        return start <= value <= end
-    return True
-
-
-def _parse_sql_insert(line: str) -> Dict[str, Any] | None:
-    match = re.match(r"INSERT INTO\s+(\w+)\s*\(([^\)]+)\)\s*VALUES\s*\((.*)\);", line)
-    if not match:
-        return None
-    columns = [c.strip() for c in match.group(2).split(",")]
-    values = _split_sql_values(match.group(3))
-    return {col: _parse_sql_value(val) for col, val in zip(columns, values)}
-
-
-def _split_sql_values(blob: str) -> List[str]:
-    values = []
-    current = ""
-    in_string = False
-    i = 0
-    while i < len(blob):
-        char = blob[i]
-        if char == "'":
-            in_string = not in_string
-            current += char
-        elif char == "," and not in_string:
-            values.append(current.strip())
-            current = ""
-        else:
-            current += char
-        i += 1
-    if current:
-        values.append(current.strip())
-    return values
-
-
-def _parse_sql_value(value: str) -> Any:
-    if value.upper() == "NULL":
-        return None
-    if value.startswith("'") and value.endswith("'"):
-        return value[1:-1].replace("''", "'")
-    return value
@@ -1,8 +1,16 @@
+import json
+import sqlite3
 from pathlib import Path
 
+import pytest
+
+from synthtest.config.loader import load_schema_from_path
+from synthtest.config.models import ExportOptions
 from synthtest.gen.core import generate_dataset
+from synthtest.profile.infer_dataset import infer_dataset
 from synthtest.schema.dsl import parse_schema
 from synthtest.util.hashing import hash_config
+from synthtest.validate.validator import validate_output
 
 
 def test_generate_and_validate(tmp_path: Path):
@@ -16,12 +24,23 @@ def test_generate_and_validate(tmp_path: Path):
                     "email": {"type": "email", "unique": True},
                 },
             },
+            "products": {
+                "primary_key": "sku",
+                "columns": {
+                    "sku": {"type": "text", "regex": "[A-Z]{3}-[0-9]{4}"},
+                    "price": {"type": "decimal", "range": [1, 250], "distribution": "normal"},
+                },
+            },
             "orders": {
                 "primary_key": "order_id",
-                "foreign_keys": [{"column": "customer_id", "ref_table": "customers", "ref_column": "customer_id"}],
+                "foreign_keys": [
+                    {"column": "customer_id", "ref_table": "customers", "ref_column": "customer_id"},
+                    {"column": "sku", "ref_table": "products", "ref_column": "sku"},
+                ],
                 "columns": {
                     "order_id": {"type": "uuid"},
                     "customer_id": {"type": "uuid"},
+                    "sku": {"type": "text"},
                     "status": {"type": "enum", "values": ["PAID", "FAILED"]},
                     "total": {"type": "decimal", "range": [0, 1000]},
                 },
@@ -36,3 +55,264 @@ def test_generate_and_validate(tmp_path: Path):
     report_path = tmp_path / "validation_report.json"
     assert report_path.exists()
     assert metadata.dataset_name == "demo"
+
+
+def _columnar_raw() -> dict:
+    return {
+        "dataset": {
+            "name": "demo",
+            "seed": 11,
+            "mode": "valid",
+            "size": {"customers": 40, "products": 25, "orders": 90},
+            "engine": "columnar",
+            "batch_size": 16,
+        },
+        "tables": {
+            "customers": {
+                "primary_key": "customer_id",
+                "columns": {
+                    "customer_id": {"type": "uuid"},
+                    "email": {"type": "email", "unique": True},
+                },
+            },
+            "products": {
+                "primary_key": "sku",
+                "columns": {
+                    "sku": {"type": "text", "regex": "[A-Z]{3}-[0-9]{4}"},
+                    "price": {"type": "decimal", "range": [1, 250], "distribution": "normal"},
+                },
+            },
+            "orders": {
+                "primary_key": "order_id",
+                "foreign_keys": [
+                    {"column": "customer_id", "ref_table": "customers", "ref_column": "customer_id"},
+                    {"column": "sku", "ref_table": "products", "ref_column": "sku"},
+                ],
+                "columns": {
+                    "order_id": {"type": "uuid"},
+                    "customer_id": {"type": "uuid"},
+                    "sku": {"type": "text"},
+                    "status": {"type": "enum", "values": ["PAID", "FAILED"]},
+                    "total": {"type": "decimal", "range": [0, 1000]},
+                },
+            },
+        },
+        "rules": [
+            {"if": "orders.status == 'FAILED'", "then": ["orders.total <= 500.0"]}
+        ],
+    }
+
+
+def test_columnar_engine_is_deterministic(tmp_path: Path):
+    raw = _columnar_raw()
+    schema = parse_schema(raw)
+    first, second = tmp_path / "first", tmp_path / "second"
+    generate_dataset(schema, hash_config(raw), first, "csv")
+    generate_dataset(schema, hash_config(raw), second, "csv")
+
+    for name in ("customers.csv", "orders.csv"):
+        assert (first / name).read_bytes() == (second / name).read_bytes()
+    report = json.loads((first / "validation_report.json").read_text(encoding="utf-8"))
+    assert report["total_violations"] == 0
+    assert report["tables"]["orders"]["row_count"] == 90
+
+
+def test_engines_report_no_repairs_in_invalid_mode(tmp_path: Path):
+    reports = {}
+    for engine in ("row", "columnar"):
+        raw = _columnar_raw()
+        raw["dataset"].update({"engine": engine, "mode": "invalid"})
+        generate_dataset(parse_schema(raw), hash_config(raw), tmp_path / engine, "csv")
+        reports[engine] = json.loads((tmp_path / engine / "validation_report.json").read_text(encoding="utf-8"))
+
+    for engine, report in reports.items():
+        assert {table["repair_attempts"] for table in report["tables"].values()} == {0}, engine
+
+
+def test_sharded_generation_matches_serial(tmp_path: Path):
+    raw = _columnar_raw()
+    schema = parse_schema(raw)
+    serial, sharded = tmp_path / "serial", tmp_path / "sharded"
+    generate_dataset(schema, hash_config(raw), serial, "csv")
+    generate_dataset(schema, hash_config(raw), sharded, "csv", workers=2)
+
+    for name in ("customers.csv", "products.csv", "orders.csv", "validation_report.json"):
+        assert (serial / name).read_bytes() == (sharded / name).read_bytes()
+
+
+def test_counter_rng_output_does_not_depend_on_batch_size(tmp_path: Path):
+    outputs = []
+    for batch_size in (7, 64):
+        raw = _columnar_raw()
+        raw["dataset"].update(rng="counter", batch_size=batch_size)
+        out = tmp_path / str(batch_size)
+        generate_dataset(parse_schema(raw), hash_config(raw), out, "csv")
+        outputs.append(out)
+
+    for name in ("customers.csv", "products.csv", "orders.csv"):
+        assert (outputs[0] / name).read_bytes() == (outputs[1] / name).read_bytes()
+    report = json.loads((outputs[0] / "validation_report.json").read_text(encoding="utf-8"))
+    assert report["total_violations"] == 0
+
+
+@pytest.mark.parametrize("engine", ["row", "columnar"])
+def test_targeted_repair_avoids_row_retries(tmp_path: Path, engine: str):
+    reports = {}
+    for repair in ("row", "targeted"):
+        raw = _columnar_raw()
+        raw["dataset"].update({"engine": engine, "repair": repair})
+        generate_dataset(parse_schema(raw), hash_config(raw), tmp_path / repair, "csv")
+        reports[repair] = json.loads((tmp_path / repair / "validation_report.json").read_text(encoding="utf-8"))
+
+    orders = reports["targeted"]["tables"]["orders"]
+    assert reports["targeted"]["total_violations"] == 0
+    assert orders["repair_attempts"] == orders["row_count"]
+    assert orders["repair_attempts"] < reports["row"]["tables"]["orders"]["repair_attempts"]
+
+
+def test_targeted_repair_keeps_invalid_mode_violations(tmp_path: Path):
+    reports = {}
+    for repair in ("row", "targeted"):
+        raw = _columnar_raw()
+        raw["dataset"].update({"engine": "row", "mode": "invalid", "repair": repair})
+        generate_dataset(parse_schema(raw), hash_config(raw), tmp_path / repair, "csv")
+        reports[repair] = (tmp_path / repair / "validation_report.json").read_text(encoding="utf-8")
+
+    assert reports["targeted"] == reports["row"]
+    assert json.loads(reports["targeted"])["tables"]["orders"]["rule_violations"] > 0
+
+
+def test_inline_validation_matches_reread(tmp_path: Path):
+    raw = _columnar_raw()
+    raw["dataset"]["mode"] = "invalid"
+    schema = parse_schema(raw)
+    for fmt in ("csv", "sql"):
+        reread, inline = tmp_path / f"reread-{fmt}", tmp_path / f"inline-{fmt}"
+        generate_dataset(schema, hash_config(raw), reread, fmt)
+        generate_dataset(schema, hash_config(raw), inline, fmt, validate="inline")
+        expected = (reread / "validation_report.json").read_bytes()
+        assert (inline / "validation_report.json").read_bytes() == expected
+        assert json.loads(expected)["total_violations"] > 0
+
+
+def test_parquet_output_is_typed_and_validates(tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    raw = _columnar_raw()
+    schema = parse_schema(raw)
+    generate_dataset(schema, hash_config(raw), tmp_path / "csv", "csv")
+    generate_dataset(schema, hash_config(raw), tmp_path / "parquet", "parquet", validate="inline")
+
+    orders = pq.read_table(tmp_path / "parquet" / "orders.parquet")
+    assert str(orders.schema.field("total").type) == "double"
+    assert orders.num_rows == 90
+    parquet_report = validate_output(schema, tmp_path / "parquet", "parquet")
+    inline_report = json.loads((tmp_path / "parquet" / "validation_report.json").read_text(encoding="utf-8"))
+    csv_report = json.loads((tmp_path / "csv" / "validation_report.json").read_text(encoding="utf-8"))
+    assert parquet_report.total_violations == 0
+    assert inline_report["tables"] == csv_report["tables"]
+
+
+def test_arrow_output_spans_record_batches(tmp_path: Path):
+    pa = pytest.importorskip("pyarrow")
+    raw = _columnar_raw()
+    schema = parse_schema(raw)
+    generate_dataset(schema, hash_config(raw), tmp_path / "csv", "csv")
+    generate_dataset(schema, hash_config(raw), tmp_path / "arrow", "arrow")
+
+    with pa.memory_map(str(tmp_path / "arrow" / "orders.arrow"), "r") as source:
+        reader = pa.ipc.open_file(source)
+        assert reader.num_record_batches > 1
+        orders = reader.read_all()
+    assert pa.types.is_dictionary(orders.schema.field("status").type)
+    assert set(orders.column("status").to_pylist()) <= {"PAID", "FAILED"}
+    arrow_report = json.loads((tmp_path / "arrow" / "validation_report.json").read_text(encoding="utf-8"))
+    csv_report = json.loads((tmp_path / "csv" / "validation_report.json").read_text(encoding="utf-8"))
+    assert arrow_report["tables"] == csv_report["tables"]
+
+
+def test_compressed_output_is_detected_by_validator(tmp_path: Path):
+    raw = _columnar_raw()
+    raw["dataset"]["mode"] = "invalid"
+    schema = parse_schema(raw)
+    generate_dataset(schema, hash_config(raw), tmp_path / "plain", "json")
+    generate_dataset(schema, hash_config(raw), tmp_path / "gzip", "json", export=ExportOptions(compression="gzip"))
+
+    assert (tmp_path / "gzip" / "orders.jsonl.gz").exists()
+    metadata = json.loads((tmp_path / "gzip" / "run_metadata.json").read_text(encoding="utf-8"))
+    assert metadata["files"]["orders"] == "orders.jsonl.gz"
+    expected = validate_output(schema, tmp_path / "plain", "json")
+    assert validate_output(schema, tmp_path / "gzip", "json") == expected
+
+
+def test_compressed_run_validates_its_own_files(tmp_path: Path):
+    raw = _columnar_raw()
+    valid_schema = parse_schema(raw)
+    raw["dataset"]["mode"] = "invalid"
+    schema = parse_schema(raw)
+    generate_dataset(schema, hash_config(raw), tmp_path / "plain", "csv")
+    generate_dataset(valid_schema, hash_config(raw), tmp_path / "out", "csv")
+    generate_dataset(schema, hash_config(raw), tmp_path / "out", "csv", export=ExportOptions(compression="gzip"))
+
+    report = json.loads((tmp_path / "out" / "validation_report.json").read_text(encoding="utf-8"))
+    expected = json.loads((tmp_path / "plain" / "validation_report.json").read_text(encoding="utf-8"))
+    assert report["total_violations"] == expected["total_violations"] > 0
+    with pytest.raises(ValueError, match="Several output files"):
+        validate_output(schema, tmp_path / "out", "csv")
+
+
+def test_database_sink_loads_tables_in_fk_order(tmp_path: Path):
+    raw = _columnar_raw()
+    schema = parse_schema(raw)
+    db_path = tmp_path / "synth.db"
+    export = ExportOptions(db_url=f"sqlite:///{db_path}", db_batch_size=16)
+    generate_dataset(schema, hash_config(raw), tmp_path / "csv", "csv")
+    generate_dataset(schema, hash_config(raw), tmp_path / "db", "db", workers=2, export=export)
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM orders").fetchone() == (90,)
+        orphans = connection.execute(
+            "SELECT COUNT(*) FROM orders o LEFT JOIN customers c ON o.customer_id = c.customer_id "
+            "WHERE c.customer_id IS NULL"
+        ).fetchone()
+    assert orphans == (0,)
+    db_report = json.loads((tmp_path / "db" / "validation_report.json").read_text(encoding="utf-8"))
+    csv_report = json.loads((tmp_path / "csv" / "validation_report.json").read_text(encoding="utf-8"))
+    assert db_report["tables"] == csv_report["tables"]
+    with pytest.raises(ValueError):
+        generate_dataset(schema, hash_config(raw), tmp_path / "db", "db", validate="reread", export=export)
+
+
+def test_database_sink_replaces_tables_on_a_second_run(tmp_path: Path):
+    raw = _columnar_raw()
+    schema = parse_schema(raw)
+    db_url = f"sqlite:///{tmp_path / 'synth.db'}"
+    for _ in range(2):
+        generate_dataset(schema, hash_config(raw), tmp_path / "db", "db", export=ExportOptions(db_url=db_url))
+
+    with sqlite3.connect(tmp_path / "synth.db") as connection:
+        assert connection.execute("SELECT COUNT(*) FROM orders").fetchone() == (90,)
+    with pytest.raises(sqlite3.IntegrityError):
+        generate_dataset(
+            schema, hash_config(raw), tmp_path / "db", "db", export=ExportOptions(db_url=db_url, db_mode="append")
+        )
+
+
+def test_infer_directory_discovers_keys(tmp_path: Path):
+    raw = _columnar_raw()
+    schema = parse_schema(raw)
+    generate_dataset(schema, hash_config(raw), tmp_path / "data", "csv", validate="off")
+    (tmp_path / "data" / "run_metadata.json").unlink()
+
+    infer_dataset(tmp_path / "data", tmp_path / "inferred.yml", workers=2)
+    inferred, _ = load_schema_from_path(tmp_path / "inferred.yml")
+
+    assert {name: table.primary_key for name, table in inferred.tables.items()} == {
+        "customers": "customer_id",
+        "orders": "order_id",
+        "products": "sku",
+    }
+    fks = {(fk.column, fk.ref_table, fk.ref_column) for fk in inferred.tables["orders"].foreign_keys}
+    assert fks == {("customer_id", "customers", "customer_id"), ("sku", "products", "sku")}
+    generate_dataset(inferred, "inferred", tmp_path / "regenerated", "csv")
+    report = json.loads((tmp_path / "regenerated" / "validation_report.json").read_text(encoding="utf-8"))
+    assert report["total_violations"] == 0
@@ -0,0 +1,31 @@
+from synthtest.gen.constraints import build_constraint_plan
+from synthtest.schema.canonical import ColumnSpec, RuleSpec, TableSpec
+
+
+def _orders() -> TableSpec:
+    return TableSpec(
+        name="orders",
+        primary_key="order_id",
+        columns={
+            "order_id": ColumnSpec(name="order_id", type="uuid"),
+            "total": ColumnSpec(name="total", type="decimal", range=[0, 2000]),
+            "status": ColumnSpec(name="status", type="enum", values=["PAID", "FAILED"]),
+            "qty": ColumnSpec(name="qty", type="int", range=[1, 10]),
+        },
+    )
+
+
+def test_rules_become_conditional_bounds():
+    rules = [
+        RuleSpec(**{"if": "orders.status == 'FAILED'", "then": ["orders.total <= 500.0", "3 > orders.qty"]}),
+        RuleSpec(**{"if": "orders.total > 10", "then": ["orders.qty >= 5"]}),
+    ]
+    plan = build_constraint_plan(rules, _orders())
+    assert set(plan.bounds) == {"total", "qty"}
+    assert plan.order[-2:] == ["total", "qty"]
+
+    table = _orders()
+    failed = {"status": "FAILED"}
+    assert plan.column_for(table.columns["total"], failed).range == [0.0, 500.0]
+    assert plan.column_for(table.columns["qty"], failed).range == [1, 2]
+    assert plan.column_for(table.columns["total"], {"status": "PAID"}) is table.columns["total"]
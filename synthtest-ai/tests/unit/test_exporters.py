@@ -0,0 +1,68 @@
+import datetime as dt
+import json
+from pathlib import Path
+
+import pytest
+
+from synthtest.export.csv_exporter import CsvExporter
+from synthtest.export.json_exporter import JsonExporter
+
+
+def _rows():
+    return [
+        {"id": 1, "name": "Zoë \"Q\"", "amount": 12.5, "flag": True, "at": dt.datetime(2024, 1, 2, 3, 4, 5)},
+        {"id": -7, "name": None, "amount": float("nan"), "flag": False, "at": dt.date(2024, 2, 29)},
+        {"id": 10**20, "name": "tab\tline\n", "amount": 1e-7, "flag": None, "at": None},
+    ]
+
+
+def test_json_write_rows_matches_json_dumps(tmp_path: Path):
+    columns = ["id", "name", "amount", "flag", "at"]
+    exporter = JsonExporter(tmp_path / "rows.jsonl", columns, buffer_size=64)
+    exporter.write_rows(_rows()[:2])
+    exporter.write_row(_rows()[2])
+    exporter.close()
+
+    expected = "".join(json.dumps(exporter.readback(row), ensure_ascii=True) + "\n" for row in _rows())
+    assert (tmp_path / "rows.jsonl").read_text(encoding="utf-8") == expected
+
+
+def test_csv_write_rows_round_trips(tmp_path: Path):
+    columns = ["id", "name", "amount", "flag", "at"]
+    exporter = CsvExporter(tmp_path / "rows.csv", columns)
+    exporter.write_rows(_rows())
+    exporter.close()
+
+    lines = (tmp_path / "rows.csv").read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "id,name,amount,flag,at"
+    assert lines[1] == '1,"Zoë ""Q""",12.5,True,2024-01-02T03:04:05'
+
+
+def test_arrow_write_batch_matches_write_rows(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    from synthtest.export.arrow_exporter import ArrowExporter
+    from synthtest.gen.batch import ColumnBatch
+    from synthtest.schema.canonical import ColumnSpec, TableSpec
+
+    table = TableSpec(
+        name="orders",
+        primary_key="id",
+        columns={
+            "id": ColumnSpec(name="id", type="int"),
+            "total": ColumnSpec(name="total", type="decimal"),
+            "status": ColumnSpec(name="status", type="enum", values=["new", "paid"]),
+        },
+    )
+    batch = ColumnBatch(
+        columns=["id", "total", "status"],
+        data={"id": list(range(10)), "total": [1] * 10, "status": ["new", "paid", None, "new", "paid"] * 2},
+    )
+    by_rows = ArrowExporter(tmp_path / "rows.parquet", table, "valid", row_group_size=4)
+    by_rows.write_rows(batch.rows())
+    by_rows.close()
+    by_batch = ArrowExporter(tmp_path / "batch.parquet", table, "valid", row_group_size=4)
+    by_batch.write_batch(ColumnBatch(batch.columns, {k: v[:3] for k, v in batch.data.items()}))
+    by_batch.write_batch(ColumnBatch(batch.columns, {k: v[3:] for k, v in batch.data.items()}))
+    by_batch.close()
+
+    assert (tmp_path / "rows.parquet").read_bytes() == (tmp_path / "batch.parquet").read_bytes()
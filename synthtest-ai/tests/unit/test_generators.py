@@ -1,4 +1,8 @@
-from synthtest.gen.generators import primitives
+import pytest
+
+from synthtest.gen.compiled import compile_generator
+from synthtest.gen.generators import primitives, vectorized
+from synthtest.schema.canonical import ColumnSpec
 from synthtest.util.rng import Rng
 
 
@@ -20,3 +24,106 @@ def test_uuid_deterministic():
     rng1 = Rng.with_seed(42)
     rng2 = Rng.with_seed(42)
     assert primitives.generate_uuid(rng1) == primitives.generate_uuid(rng2)
+
+
+def test_vectorized_ranges_and_determinism():
+    pytest.importorskip("numpy")
+    column = ColumnSpec(name="qty", type="int", range=[1, 10], distribution="normal")
+    first = vectorized.generate_column(column, Rng.with_seed(5), 500)
+    second = vectorized.generate_column(column, Rng.with_seed(5), 500)
+    assert first == second
+    assert all(isinstance(value, int) and 1 <= value <= 10 for value in first)
+
+    enum = ColumnSpec(name="status", type="enum", values=["A", "B"], weights=[0.9, 0.1])
+    values = vectorized.generate_column(enum, Rng.with_seed(5), 500)
+    assert set(values) <= {"A", "B"}
+    assert values.count("A") > values.count("B")
+
+
+def test_int_bounds_at_the_int64_limits():
+    column = ColumnSpec(name="id", type="int", range=[-(2**63), "9223372036854775807"])
+    assert primitives.parse_int_range([0, 2**64]) == (0, 2**63 - 1)
+    generate, rng = compile_generator(column), Rng.with_seed(5)
+    scalar = [generate(rng) for _ in range(20)]
+    assert all(-(2**63) <= value <= 2**63 - 1 for value in scalar)
+
+    pytest.importorskip("numpy")
+    for rng in (Rng.with_seed(5), Rng.with_seed(5, counter=True)):
+        values = vectorized.generate_column(column, rng, 200)
+        assert all(isinstance(value, int) and -(2**63) <= value <= 2**63 - 1 for value in values)
+        assert max(values) > 2**62
+
+
+def test_vectorized_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(vectorized, "np", None)
+    column = ColumnSpec(name="qty", type="int", range=[1, 10])
+    assert not vectorized.numpy_available()
+    assert vectorized.generate_column(column, Rng.with_seed(5), 10) is None
+
+
+def test_compiled_generators_match_per_cell_draws():
+    sku = ColumnSpec(name="sku", type="text", regex="^SKU-[A-Z]{3}\\d{2,4}$")
+    status = ColumnSpec(name="status", type="enum", values=["A", "B", "C"], weights=[0.5, 0.3, 0.2])
+    compiled_rng, reference_rng = Rng.with_seed(9), Rng.with_seed(9)
+    generate_sku, generate_status = compile_generator(sku), compile_generator(status)
+    for _ in range(50):
+        assert generate_sku(compiled_rng) == primitives.generate_text_from_regex(reference_rng, sku.regex)
+        assert generate_status(compiled_rng) == primitives.generate_enum(reference_rng, status.values, status.weights)
+
+
+def test_empirical_distribution_follows_quantiles():
+    column = ColumnSpec(
+        name="amount",
+        type="int",
+        range=[0, 1000],
+        distribution="empirical",
+        quantiles=[0, 0, 0, 10, 1000],
+    )
+    generate = compile_generator(column)
+    rng = Rng.with_seed(3)
+    values = [generate(rng) for _ in range(4000)]
+
+    assert all(0 <= value <= 1000 for value in values)
+    assert 0.45 < values.count(0) / len(values) < 0.55
+    assert 0.2 < sum(1 for value in values if value > 10) / len(values) < 0.3
+    with pytest.raises(ValueError):
+        compile_generator(ColumnSpec(name="bad", type="int", distribution="empirical", quantiles=[5, 1]))
+
+
+def test_weighted_sampler_matches_rng_choices():
+    values = [f"SKU-{i}" for i in range(500)]
+    weights = [(i % 7) + 0.5 for i in range(500)]
+    sampler = primitives.WeightedSampler(values, weights)
+
+    expected_rng, single_rng, batch_rng = Rng.with_seed(9), Rng.with_seed(9), Rng.with_seed(9)
+    expected = [expected_rng.choices(values, weights=weights, k=1)[0] for _ in range(2000)]
+    assert [sampler.draw(single_rng) for _ in range(2000)] == expected
+    assert sampler.draw_many(batch_rng, 2000) == expected
+    with pytest.raises(ValueError):
+        primitives.WeightedSampler(["a", "b"], [0, 0])
+
+
+def test_counter_rng_rows_are_independent_of_order():
+    table = Rng.with_seed(9, counter=True).derive("orders")
+    forward = [table.row(index).column("qty").randint(1, 100) for index in range(50)]
+    backward = [table.row(index).column("qty").randint(1, 100) for index in reversed(range(50))]
+    assert forward == backward[::-1]
+    assert table.row(3).column("qty").random() == table.derive("qty").row(3).random()
+    sequential = Rng.with_seed(9)
+    assert sequential.row(3).column("qty") is sequential
+
+    pytest.importorskip("numpy")
+    batch = table.derive("qty").batch(10, 20)
+    words = batch.words()
+    assert [int(word) for word in words] == [table.row(index).column("qty").getrandbits(64) for index in range(10, 30)]
+    column = ColumnSpec(name="qty", type="int", range=[1, 10], distribution="normal")
+    whole = vectorized.generate_column(column, table.derive("qty"), 30)
+    assert vectorized.generate_column(column, table.derive("qty"), 20, start=10) == whole[10:]
+
+
+def test_counter_batch_integers_match_scalar_draws():
+    pytest.importorskip("numpy")
+    table = Rng.with_seed(9, counter=True).derive("orders")
+    for low, high in [(1, 10), (0, 10**18 + 3), (-(2**63), 2**63 - 1)]:
+        batch = table.batch(5, 40).integers(low, high, 40, endpoint=True)
+        assert batch.tolist() == [table.row(index).randint(low, high) for index in range(5, 45)]
@@ -0,0 +1,82 @@
+import pytest
+
+from synthtest.gen.keys import ForeignKeyIndex, KeyPool
+from synthtest.schema.canonical import ColumnSpec, ForeignKeySpec, TableSpec
+
+
+def test_foreign_key_index_membership():
+    orders = TableSpec(
+        name="orders",
+        primary_key="order_id",
+        foreign_keys=[ForeignKeySpec(column="customer_id", ref_table="customers", ref_column="customer_id")],
+        columns={
+            "order_id": ColumnSpec(name="order_id", type="uuid"),
+            "customer_id": ColumnSpec(name="customer_id", type="uuid"),
+        },
+    )
+    pool = KeyPool(["a", "b"])
+    pool.append("c")
+    index = ForeignKeyIndex(orders, {"customers": pool})
+
+    assert index.is_foreign_key("customer_id")
+    assert not index.is_foreign_key("order_id")
+    assert index.contains("customer_id", "c")
+    assert not index.contains("customer_id", "z")
+    assert list(index.parent_keys("customer_id")) == ["a", "b", "c"]
+    assert not ForeignKeyIndex(orders, {}).contains("customer_id", "a")
+
+
+def test_key_pool_compacts_without_changing_draws():
+    import uuid
+
+    from synthtest.gen.keys import BloomKeySet, KeySet
+    from synthtest.util.rng import Rng
+
+    values = [str(uuid.UUID(int=i * 7919)) for i in range(300)] + ["not-a-uuid"]
+    plain, compact = KeyPool(compact_after=10**9), KeyPool(compact_after=50)
+    for value in values[:300]:
+        plain.append(value)
+        compact.append(value)
+    assert compact.compact and not plain.compact
+    assert [compact[i] for i in range(len(compact))] == values[:300]
+    assert [Rng.with_seed(3).choice(compact) for _ in range(5)] == [Rng.with_seed(3).choice(plain) for _ in range(5)]
+    assert values[299] in compact and str(uuid.UUID(int=1)) not in compact
+
+    # A value that fits no buffer moves the pool back to the plain form.
+    compact.append(values[300])
+    assert not compact.compact and list(compact) == values
+
+    ints = KeySet(range(0, 1000, 3), compact_after=16)
+    assert ints.compact and len(ints) == 334
+    assert 999 in ints and 998 not in ints and "999" not in ints
+
+    bloom = BloomKeySet(capacity=1000)
+    for value in range(1000):
+        bloom.add(value)
+    assert all(value in bloom for value in range(1000))
+    assert sum(value in bloom for value in range(1000, 11000)) < 100
+
+
+def test_key_pool_spills_to_disk(tmp_path, monkeypatch):
+    import pickle
+
+    from synthtest.gen import spill
+    from synthtest.util.rng import Rng
+
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(spill, "SPILL_BLOCK", 16)
+    values = [(i * 7919) % 1000 - 500 for i in range(300)]
+    plain, spilled = KeyPool(), KeyPool(compact_after=20, spill_after=40, spill_dir=tmp_path)
+    for value in values:
+        plain.append(value)
+        spilled.append(value)
+    assert spilled.spilled and len(spilled) == 300
+    assert list(spilled) == values and spilled[-1] == values[-1]
+    assert [Rng.with_seed(3).choice(spilled) for _ in range(5)] == [Rng.with_seed(3).choice(plain) for _ in range(5)]
+    assert all((value in spilled) == (value in plain) for value in range(-600, 600))
+
+    # Keys outside the buffer kind (invalid mode) keep their position.
+    spilled.append("bad-key")
+    loaded = pickle.loads(pickle.dumps(spilled))
+    assert loaded[300] == "bad-key" and "bad-key" in loaded
+    assert list(loaded)[:300] == values and values[7] in loaded and 501 not in loaded
@@ -1,5 +1,5 @@
 from synthtest.schema.dsl import parse_schema
-from synthtest.plan.planner import plan_tables
+from synthtest.plan.planner import plan_parents, plan_tables
 
 
 def test_planner_topo_order():
@@ -22,3 +22,23 @@ def test_planner_topo_order():
     schema = parse_schema(raw)
     order = plan_tables(schema)
     assert order.index("a") < order.index("b") < order.index("c")
+
+
+def test_planner_parents_list_every_referenced_table():
+    raw = {
+        "dataset": {"name": "demo", "seed": 1, "mode": "valid", "size": {}},
+        "tables": {
+            "a": {"primary_key": "id", "columns": {"id": {"type": "uuid"}}},
+            "b": {"primary_key": "id", "columns": {"id": {"type": "uuid"}}},
+            "c": {
+                "primary_key": "id",
+                "foreign_keys": [
+                    {"column": "a_id", "ref_table": "a", "ref_column": "id"},
+                    {"column": "b_id", "ref_table": "b", "ref_column": "id"},
+                ],
+                "columns": {"id": {"type": "uuid"}, "a_id": {"type": "uuid"}, "b_id": {"type": "uuid"}},
+            },
+        },
+    }
+    schema = parse_schema(raw)
+    assert plan_parents(schema) == {"a": set(), "b": set(), "c": {"a", "b"}}
@@ -0,0 +1,166 @@
+from pathlib import Path
+
+from synthtest.schema import postgres_introspect
+from synthtest.schema.dsl import parse_schema
+from synthtest.schema.postgres_introspect import catalog_to_config, introspect_postgres
+
+
+def _column(table, name, udt, nullable="NO", max_len=None, precision=None, scale=None):
+    return {
+        "table_name": table,
+        "column_name": name,
+        "data_type": udt,
+        "udt_name": udt,
+        "is_nullable": nullable,
+        "character_maximum_length": max_len,
+        "numeric_precision": precision,
+        "numeric_scale": scale,
+    }
+
+
+def _constraint(kind, table, columns, definition, ref_table=None, ref_columns=()):
+    return {
+        "kind": kind,
+        "table_name": table,
+        "ref_table": ref_table,
+        "columns": columns,
+        "ref_columns": list(ref_columns),
+        "definition": definition,
+    }
+
+
+SNAPSHOT = {
+    "version": 2,
+    "schema": "shop",
+    "fingerprint": "abc",
+    "columns": [
+        _column("customers", "id", "int8"),
+        _column("customers", "email", "varchar", max_len=255),
+        _column("customers", "tier", "customer_tier"),
+        _column("orders", "id", "uuid"),
+        _column("orders", "customer_id", "int8"),
+        _column("orders", "status", "varchar", max_len=16),
+        _column("orders", "qty", "int4"),
+        _column("orders", "total", "numeric", nullable="YES", precision=8, scale=2),
+    ],
+    "constraints": [
+        _constraint("p", "customers", ["id"], "PRIMARY KEY (id)"),
+        _constraint("u", "customers", ["email"], "UNIQUE (email)"),
+        _constraint("p", "orders", ["id"], "PRIMARY KEY (id)"),
+        _constraint("f", "orders", ["customer_id"], "FOREIGN KEY ...", "customers", ["id"]),
+        _constraint(
+            "c",
+            "orders",
+            ["status"],
+            "CHECK (((status)::text = ANY ((ARRAY['new'::character varying, 'paid'::character varying])::text[])))",
+        ),
+        _constraint("c", "orders", ["qty"], "CHECK (((qty > 0) AND (qty <= 50)))"),
+        _constraint("c", "orders", ["total"], "CHECK ((round(total) > (0)::numeric))"),
+    ],
+    "enums": [
+        {"type_name": "customer_tier", "label": "gold"},
+        {"type_name": "customer_tier", "label": "silver"},
+    ],
+}
+
+
+def test_catalog_maps_keys_types_and_checks():
+    config = catalog_to_config(SNAPSHOT, rows=25)
+    schema = parse_schema(config)
+
+    customers, orders = schema.tables["customers"], schema.tables["orders"]
+    assert customers.primary_key == "id"
+    assert customers.columns["id"].range == [1, 2**63 - 1]
+    assert customers.columns["email"].type == "email"
+    assert customers.columns["tier"].values == ["gold", "silver"]
+    assert orders.foreign_keys[0].ref_table == "customers"
+    assert orders.columns["status"].values == ["new", "paid"]
+    assert orders.columns["qty"].range == [1, 50]
+    # round(total) > 0 is not a plain comparison, so only the numeric(8,2) bound applies.
+    assert orders.columns["total"].range == [0, 1000]
+    assert orders.columns["total"].nullable
+    assert schema.dataset.size == {"customers": 25, "orders": 25}
+
+
+def test_composite_primary_key_keeps_foreign_keys_shared():
+    snapshot = {
+        **SNAPSHOT,
+        "columns": SNAPSHOT["columns"]
+        + [
+            _column("items", "order_id", "uuid"),
+            _column("items", "line_no", "int4"),
+            _column("links", "order_id", "uuid"),
+            _column("links", "customer_id", "int8"),
+        ],
+        "constraints": SNAPSHOT["constraints"]
+        + [
+            _constraint("p", "items", ["order_id", "line_no"], "PRIMARY KEY (order_id, line_no)"),
+            _constraint("f", "items", ["order_id"], "FOREIGN KEY ...", "orders", ["id"]),
+            _constraint("p", "links", ["order_id", "customer_id"], "PRIMARY KEY (order_id, customer_id)"),
+            _constraint("f", "links", ["order_id"], "FOREIGN KEY ...", "orders", ["id"]),
+            _constraint("f", "links", ["customer_id"], "FOREIGN KEY ...", "customers", ["id"]),
+        ],
+    }
+    schema = parse_schema(catalog_to_config(snapshot, rows=25))
+
+    items, links = schema.tables["items"], schema.tables["links"]
+    assert items.primary_key == "line_no"
+    assert items.columns["line_no"].range == [1, 2**31 - 1]
+    assert not items.columns["order_id"].unique
+    assert links.primary_key == postgres_introspect.SURROGATE_KEY
+    assert not links.columns["order_id"].unique and not links.columns["customer_id"].unique
+
+
+class _FakeCursor:
+    def __init__(self, queries):
+        self.queries = queries
+        self.description = None
+        self._rows = []
+
+    def execute(self, sql, params):
+        self.queries.append(sql)
+        assert params == {"schema": "shop"}
+        if "fingerprint" in sql:
+            rows = [{"fingerprint": "abc"}]
+        elif "information_schema.columns" in sql:
+            rows = SNAPSHOT["columns"]
+        elif "pg_get_constraintdef" in sql:
+            rows = SNAPSHOT["constraints"]
+        else:
+            rows = SNAPSHOT["enums"]
+        self.description = [(name,) for name in rows[0]]
+        self._rows = [tuple(row.values()) for row in rows]
+
+    def fetchall(self):
+        return self._rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+class _FakeConnection:
+    def __init__(self, queries):
+        self.queries = queries
+
+    def cursor(self):
+        return _FakeCursor(self.queries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+def test_catalog_snapshot_is_cached_by_fingerprint(tmp_path: Path, monkeypatch):
+    queries = []
+    monkeypatch.setattr(postgres_introspect, "_connect", lambda dsn: _FakeConnection(queries))
+
+    first = introspect_postgres("postgresql://db/shop", schema="shop", cache_dir=tmp_path)
+    assert len(queries) == 4
+    second = introspect_postgres("postgresql://db/shop", schema="shop", cache_dir=tmp_path)
+    assert len(queries) == 5
+    assert second == first
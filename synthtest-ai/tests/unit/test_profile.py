@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import yaml
+
+from synthtest.profile import infer_basic as profiling
+from synthtest.profile.infer_basic import ColumnProfile, infer_basic
+from synthtest.profile.sketch import DistinctSketch, containment, hash_value
+
+
+def test_infer_basic_streams_and_samples(tmp_path: Path):
+    lines = ["id,score,status,joined,email"]
+    for i in range(50):
+        status = "ACTIVE" if i % 3 else "CLOSED"
+        score = "" if i == 7 else str(i * 2.5)
+        lines.append(f"u{i},{score},{status},2024-01-{i % 28 + 1:02d}T09:30:00,user{i}@example.com")
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    infer_basic(csv_path, tmp_path / "schema.yml", sample_rows=20)
+    config = yaml.safe_load((tmp_path / "schema.yml").read_text(encoding="utf-8"))
+
+    columns = config["tables"]["users"]["columns"]
+    assert config["dataset"]["size"] == {"users": 20}
+    assert config["tables"]["users"]["primary_key"] == "id"
+    assert columns["score"] == {"type": "decimal", "nullable": True, "range": [0.0, 47.5]}
+    assert columns["status"]["values"] == ["CLOSED", "ACTIVE"]
+    assert columns["joined"]["range"] == ["2024-01-01T09:30:00", "2024-01-20T09:30:00"]
+    assert columns["email"]["type"] == "email"
+
+
+def test_uniqueness_is_estimated_past_exact_limit(monkeypatch):
+    monkeypatch.setattr(profiling, "UNIQUE_EXACT_LIMIT", 1000)
+    unique, repeated = ColumnProfile("a"), ColumnProfile("b")
+    for i in range(20000):
+        unique.add(f"key-{i}")
+        repeated.add(f"key-{i % 12000}")
+
+    assert unique.distinct is None and unique.unique
+    assert not repeated.unique
+    assert abs(repeated.distinct_count - 12000) < 12000 * 0.05
+    assert len(unique.sample) == profiling.RESERVOIR_SIZE
+
+
+def test_sketch_containment_detects_subsets():
+    parent = DistinctSketch(k=256, hashes=(hash_value(f"id-{i}") for i in range(5000)))
+    child = DistinctSketch(k=256, hashes=(hash_value(f"id-{i}") for i in range(0, 5000, 7)))
+    stranger = DistinctSketch(k=256, hashes=(hash_value(f"other-{i}") for i in range(3000)))
+
+    assert containment(child, parent) == 1.0
+    assert containment(stranger, parent) < 0.1
+    assert abs(parent.estimate() - 5000) < 5000 * 0.2
+
+
+def test_numeric_columns_get_empirical_quantiles():
+    profile = ColumnProfile("latency_ms")
+    for i in range(2000):
+        profile.add(str(5 if i % 4 else 100 + i))
+
+    spec = profile.spec(2000)
+    assert spec["distribution"] == "empirical"
+    assert len(spec["quantiles"]) == profiling.QUANTILE_BINS + 1
+    assert spec["quantiles"] == sorted(spec["quantiles"])
+    # Three quarters of the values are 5, so most cut points are too.
+    assert spec["quantiles"].count(5) >= 20
+    assert spec["range"][0] <= spec["quantiles"][0] and spec["quantiles"][-1] <= spec["range"][1]
+
+
+def test_large_int_keys_are_found_exactly(tmp_path: Path):
+    from synthtest.profile.infer_dataset import infer_dataset
+
+    names = ["Ann", "Bob", "Cy"]
+    with (tmp_path / "customers.csv").open("w", encoding="utf-8") as handle:
+        handle.write("id,name\n")
+        handle.writelines(f"{i},{names[i % 3]}\n" for i in range(1, 20001))
+    with (tmp_path / "orders.csv").open("w", encoding="utf-8") as handle:
+        handle.write("id,customer_id\n")
+        handle.writelines(f"{i},{i * 7 % 20000 + 1}\n" for i in range(1, 5001))
+
+    config = infer_dataset(tmp_path, tmp_path / "inferred.yml")
+
+    customers = config["tables"]["customers"]
+    assert customers["primary_key"] == "id"
+    assert customers["columns"]["id"]["range"] == [1, 200001]
+    assert config["tables"]["orders"]["foreign_keys"] == [
+        {"column": "customer_id", "ref_table": "customers", "ref_column": "id"}
+    ]
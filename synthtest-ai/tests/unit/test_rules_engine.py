@@ -0,0 +1,32 @@
+from synthtest.gen.rules_engine import compile_rules, evaluate_rules
+from synthtest.schema.canonical import RuleSpec
+from synthtest.util.safe_expr import compile_expr
+
+
+def _rules():
+    return [
+        RuleSpec(**{"if": "orders.status == 'FAILED'", "then": ["orders.total <= 500.0"]}),
+        RuleSpec(**{"if": "customers.active", "then": ["customers.email != ''"]}),
+    ]
+
+
+def test_compiled_rules_match_row_evaluation():
+    rules = compile_rules(_rules()).for_context(["orders"])
+    assert len(rules.rules) == 1
+    assert rules.evaluate({"orders": {"status": "FAILED", "total": 900.0}}) == ["orders.total <= 500.0"]
+    assert rules.evaluate({"orders": {"status": "PAID", "total": 900.0}}) == []
+    assert evaluate_rules(_rules(), {"orders": {"status": "FAILED", "total": 100.0}}) == []
+
+
+def test_batch_evaluation_matches_rows():
+    rules = compile_rules(_rules()).for_context(["orders"])
+    columns = {"status": ["FAILED", "PAID", "FAILED", None], "total": [900.0, 900.0, 10.0, None]}
+    batch = rules.evaluate_batch({"orders": columns}, 4)
+    rows = [rules.evaluate({"orders": {"status": s, "total": t}}) for s, t in zip(columns["status"], columns["total"])]
+    assert batch == rows
+    assert batch[0] == ["orders.total <= 500.0"]
+
+
+def test_compile_expr_is_cached():
+    assert compile_expr("orders.total <= 500.0") is compile_expr("orders.total <= 500.0")
+    assert compile_expr("a.x == 1 and b.y > 2").names == frozenset({"a", "b"})
@@ -1,7 +1,8 @@
 from pathlib import Path
 
 from synthtest.schema.dsl import parse_schema
-from synthtest.validate.validator import validate_output
+from synthtest.export.sql_exporter import SqlExporter
+from synthtest.validate.validator import TableValidator, _load_rows, validate_output
 
 
 def test_validator_valid_csv(tmp_path: Path):
@@ -25,3 +26,118 @@ def test_validator_valid_csv(tmp_path: Path):
 
     report = validate_output(schema, tmp_path, "csv")
     assert report.total_violations == 0
+
+
+def test_streaming_validator_batches_match(tmp_path: Path):
+    raw = {
+        "dataset": {"name": "demo", "seed": 1, "mode": "valid", "size": {"orders": 5}},
+        "tables": {
+            "orders": {
+                "primary_key": "id",
+                "columns": {
+                    "id": {"type": "int", "unique": True},
+                    "status": {"type": "enum", "values": ["PAID", "FAILED"]},
+                    "total": {"type": "decimal", "range": [0, 1000]},
+                },
+            }
+        },
+        "rules": [{"if": "orders.status == 'FAILED'", "then": ["orders.total <= 500"]}],
+    }
+    schema = parse_schema(raw)
+    rows = [
+        {"id": "1", "status": "FAILED", "total": "900"},
+        {"id": "1", "status": "PAID", "total": "900"},
+        {"id": "2", "status": "FAILED", "total": "100"},
+        {"id": "3", "status": "BOGUS", "total": "2000"},
+        {"id": "4", "status": "FAILED", "total": "700"},
+    ]
+    reports = []
+    for batch_size in (2, 4096):
+        validator = TableValidator(schema.tables["orders"], schema, {}, batch_size=batch_size)
+        for row in rows:
+            validator.add_row(row)
+        reports.append(validator.report())
+    assert reports[0] == reports[1]
+    assert reports[0].rule_violations == 2
+    assert reports[0].failed_rows == 4
+
+
+def test_sql_batches_and_copy_round_trip(tmp_path: Path):
+    rows = [
+        {"id": 1, "note": "it's\ta\\test", "flag": True},
+        {"id": 2, "note": None, "flag": False},
+        {"id": 3, "note": "line\nbreak", "flag": None},
+    ]
+    expected = [{"id": "1", "note": "it's\ta\\test", "flag": "True"}, {"id": "2", "note": None, "flag": "False"}]
+    for style, batch_size in (("insert", 2), ("copy", 1)):
+        path = tmp_path / f"{style}.sql"
+        exporter = SqlExporter(path, "notes", ["id", "note", "flag"], batch_size=batch_size, style=style)
+        for row in rows[:2]:
+            exporter.write_row(row)
+        if style == "copy":
+            exporter.write_row(rows[2])
+        exporter.close()
+        loaded = _load_rows(path, "sql")
+        assert loaded[:2] == expected
+        assert [exporter.readback(row) for row in rows[:2]] == expected
+    assert loaded[2]["note"] == "line\nbreak"
+
+
+def test_sql_reader_handles_quotes_and_chunk_boundaries():
+    import io
+
+    from synthtest.validate.sql_reader import iter_sql_rows
+
+    sql = (
+        "BEGIN;\n"
+        "INSERT INTO notes (id, body, score) VALUES ('n1', 'it''s (a, b)', 1.5);\n"
+        "INSERT INTO notes (id, body, score) VALUES\n"
+        "('n2', 'multi\nline; text', NULL),\n"
+        "('n3', '', -2);\n"
+        "COPY notes (id, body, score) FROM stdin;\n"
+        "n4\ttab\\there\t\\N\n"
+        "\\.\n"
+        "COMMIT;\n"
+    )
+    expected = [
+        {"id": "n1", "body": "it's (a, b)", "score": "1.5"},
+        {"id": "n2", "body": "multi\nline; text", "score": None},
+        {"id": "n3", "body": "", "score": "-2"},
+        {"id": "n4", "body": "tab\there", "score": None},
+    ]
+    for chunk_size in (1, 7, 64, 1 << 20):
+        assert list(iter_sql_rows(io.StringIO(sql), chunk_size=chunk_size)) == expected
+
+
+def test_parallel_validation_merges_split_parts(tmp_path: Path, monkeypatch):
+    from synthtest.validate import validator
+
+    raw = {
+        "dataset": {"name": "demo", "seed": 1, "mode": "valid", "size": {"users": 1, "orders": 1}},
+        "tables": {
+            "users": {
+                "primary_key": "id",
+                "columns": {"id": {"type": "int", "unique": True}, "bio": {"type": "text"}},
+            },
+            "orders": {
+                "primary_key": "id",
+                "columns": {"id": {"type": "int", "unique": True}, "user_id": {"type": "int"}},
+                "foreign_keys": [{"column": "user_id", "ref_table": "users", "ref_column": "id"}],
+            },
+        },
+        "rules": [],
+    }
+    schema = parse_schema(raw)
+    # Quoted newlines must not be taken as record ends; ids repeat across parts.
+    users = ["id,bio"] + [f'{i % 150},"line one\nline, ""two"""' for i in range(200)]
+    (tmp_path / "users.csv").write_text("\n".join(users) + "\n", encoding="utf-8")
+    orders = ["id,user_id"] + [f"{i},{i % 180}" for i in range(300)]
+    (tmp_path / "orders.csv").write_text("\n".join(orders) + "\n", encoding="utf-8")
+
+    expected = validate_output(schema, tmp_path, "csv")
+    monkeypatch.setattr(validator, "PART_BYTES", 500)
+    assert len(validator.split_table("users", tmp_path / "users.csv", "csv", 500)) > 5
+    report = validate_output(schema, tmp_path, "csv", workers=2)
+    assert report == expected
+    assert report.tables["users"].violations["unique"] == 50
+    assert report.tables["orders"].violations["foreign_key"] == 30